@@ -1,7 +1,10 @@
 __version__ = "0.1.7"
 
+from .m_animation import *
 from .m_array import *
+from .m_dry_run import *
 from .m_enum import *
+from .m_trace import *
 from .m_variable import *
 from .mlinearcollection import *
 
@@ -14,4 +17,14 @@ __all__ = [
     "MArrayElementComp",
     "MVariable",
     "LinearCollection",
+    "VirtualLinearCollection",
+    "TranslateMobjects",
+    "DryRunScene",
+    "DryRunMArray",
+    "DryRunMArrayPointer",
+    "DryRunMArraySlidingWindow",
+    "DryRunMVariable",
+    "TraceRecorder",
+    "TraceReplayer",
+    "replay_trace",
 ]
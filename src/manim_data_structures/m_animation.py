@@ -0,0 +1,148 @@
+"""Contains animations that move many mobjects at once."""
+
+import typing
+
+import numpy as np
+from manim import OUT, Animation, Mobject, rotation_matrix
+
+
+class TranslateMobjects(Animation):
+    """Moves each of many mobjects by its own (or one shared) displacement in a single animation.
+
+    The points of all moved mobjects are interpolated as one array, instead of building an animation (and a copy of the mobject) per mobject.
+    With a `path_arc`, each mobject travels rigidly along the arc that :func:`~manim.utils.paths.path_along_arc` would move its points along.
+
+    Parameters
+    ----------
+    mobject
+        Specifies the mobject containing the moved mobjects (e.g. a :class:`~.mlinearcollection.LinearCollection`).
+    mobs
+        Specifies the mobjects to move.
+    displacements
+        Specifies the displacement of each mobject in `mobs`, or a single displacement shared by all of them.
+    path_arc
+        Specifies the angle of the arc the mobjects travel along. `0` moves them along straight lines.
+    path_arc_axis
+        Specifies the axis of the arc.
+    **kwargs
+        Forwarded to constructor of the parent.
+
+    Attributes
+    ----------
+    __mobs : :class:`~typing.List`\0[:class:`~manim.mobject.mobject.Mobject`]
+        The mobjects to move.
+    __displacements : :class:`np.ndarray`
+        The displacement of each mobject in :attr:`__mobs`, or the one shared by all of them.
+    __members : :class:`~typing.List`\0[:class:`~manim.mobject.mobject.Mobject`]
+        The family members (with points) of :attr:`__mobs`.
+    __offsets : :class:`np.ndarray`
+        The offsets of the points of each member of :attr:`__members` in :attr:`__start_points`.
+    __start_points : :class:`np.ndarray`
+        The points of all members of :attr:`__members` when the animation began.
+    __point_displacements : :class:`np.ndarray`
+        The displacement of each point in :attr:`__start_points`, or the shared displacement that is broadcast over them.
+    __path_arc : :class:`float`
+        The angle of the arc the mobjects travel along.
+    __path_arc_axis : :class:`np.ndarray`
+        The unit axis of the arc.
+    __arc_vectors : :class:`np.ndarray`
+        The vector from each point in :attr:`__start_points` to the center of its arc.
+    """
+
+    def __init__(
+        self,
+        mobject: Mobject,
+        mobs: typing.Iterable[Mobject],
+        displacements: typing.Union[typing.Iterable[np.ndarray], np.ndarray],
+        path_arc: float = 0,
+        path_arc_axis: np.ndarray = OUT,
+        **kwargs
+    ) -> None:
+        """Initializes the animation.
+
+        Parameters
+        ----------
+        mobject
+            Specifies the mobject containing the moved mobjects (e.g. a :class:`~.mlinearcollection.LinearCollection`).
+        mobs
+            Specifies the mobjects to move.
+        displacements
+            Specifies the displacement of each mobject in `mobs`, or a single displacement shared by all of them.
+        path_arc
+            Specifies the angle of the arc the mobjects travel along. `0` moves them along straight lines.
+        path_arc_axis
+            Specifies the axis of the arc.
+        **kwargs
+            Forwarded to constructor of the parent.
+        """
+
+        super().__init__(mobject, **kwargs)
+        self.__mobs: typing.List[Mobject] = list(mobs)
+        self.__displacements: np.ndarray = np.asarray(displacements, dtype=float)
+        self.__members: typing.List[Mobject] = []
+        self.__offsets: np.ndarray = np.zeros(1, dtype=int)
+        self.__start_points: np.ndarray = np.zeros((0, 3))
+        self.__point_displacements: np.ndarray = np.zeros((0, 3))
+        self.__path_arc: float = path_arc
+        self.__path_arc_axis: np.ndarray = np.asarray(path_arc_axis) / np.linalg.norm(
+            path_arc_axis
+        )
+        self.__arc_vectors: np.ndarray = np.zeros((0, 3))
+
+    def begin(self) -> None:
+        """Records the starting points of the moved mobjects in one array.
+
+        Unlike :meth:`Animation.begin() <manim.animation.animation.Animation.begin>`, doesn't copy the mobject.
+        """
+
+        shared = self.__displacements.ndim == 1
+        self.__members = []
+        counts = []
+        displacements = []
+        for i, mob in enumerate(self.__mobs):
+            for member in mob.family_members_with_points():
+                self.__members.append(member)
+                counts.append(len(member.points))
+                if not shared:
+                    displacements.append(self.__displacements[i])
+
+        self.__offsets = np.cumsum([0] + counts)
+        if self.__members:
+            self.__start_points = np.concatenate([m.points for m in self.__members])
+            if shared:
+                self.__point_displacements = self.__displacements
+            else:
+                self.__point_displacements = np.repeat(displacements, counts, axis=0)
+            if self.__path_arc != 0:
+                # Every point of a mobject shares the center of its arc up to a translation
+                self.__arc_vectors = self.__point_displacements / 2 + np.cross(
+                    self.__path_arc_axis, self.__point_displacements
+                ) / (2 * np.tan(self.__path_arc / 2))
+
+        if self.suspend_mobject_updating:
+            self.mobject.suspend_updating()
+        self.interpolate(0)
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        """Moves the points of all moved mobjects in one vectorized step.
+
+        Parameters
+        ----------
+        alpha
+            Specifies the progress of the animation.
+        """
+
+        alpha = self.rate_func(alpha)
+        if self.__path_arc == 0:
+            points = self.__start_points + alpha * self.__point_displacements
+        else:
+            rotation = rotation_matrix(alpha * self.__path_arc, self.__path_arc_axis)
+            points = (
+                self.__start_points
+                + self.__arc_vectors
+                - np.dot(self.__arc_vectors, rotation.T)
+            )
+        for member, start, end in zip(
+            self.__members, self.__offsets[:-1], self.__offsets[1:]
+        ):
+            member.points = points[start:end]
@@ -4,10 +4,14 @@ from manim import *
 
 import typing
 import numpy as np
+from contextlib import contextmanager
 from copy import deepcopy
+from difflib import SequenceMatcher
 
 from . import utils
-from .m_enum import MArrayDirection, MArrayElementComp
+from .m_animation import TranslateMobjects
+from .m_enum import MArrayDirection, MArrayElementComp, MArrayPermutationMode
+from .m_trace import traced, traced_context
 
 
 @utils.exclude_from_deepcopy("_MArrayElement__scene")
@@ -64,9 +68,9 @@ class MArrayElement(VGroup):
     __mob_value : :class:`~manim.mobject.text.text_mobject.Text`
         Represents the value of the element.
     __mob_index : :class:`~manim.mobject.text.text_mobject.Text`
-        Represents the index of the element.
+        Represents the index of the element. `None` until it is non-empty or first fetched.
     __mob_label : :class:`~manim.mobject.text.text_mobject.Text`
-        Represents the label of the element.
+        Represents the label of the element. `None` until it is non-empty or first fetched.
     """
 
     def __copy_prop_refs(
@@ -213,9 +217,9 @@ class MArrayElement(VGroup):
         init_value
             If `True`, instantiates a :class:`~manim.mobject.text.text_mobject.Text` and assigns it to :attr:`__mob_value`.
         init_index
-            If `True`, instantiates a :class:`~manim.mobject.text.text_mobject.Text` and assigns it to :attr:`__mob_index`.
+            If `True`, instantiates a :class:`~manim.mobject.text.text_mobject.Text` and assigns it to :attr:`__mob_index`. An empty index is left as `None` until it is fetched.
         init_label
-            If `True`, instantiates a :class:`~manim.mobject.text.text_mobject.Text` and assigns it to :attr:`__mob_label`.
+            If `True`, instantiates a :class:`~manim.mobject.text.text_mobject.Text` and assigns it to :attr:`__mob_label`. An empty label is left as `None` until it is fetched.
         next_to_mob
             Specifies placement for :attr:`__mob_body` w.r.t another :class:`MArrayElement`.
         next_to_dir
@@ -229,23 +233,33 @@ class MArrayElement(VGroup):
             self.add(self.__mob_body)
 
         if init_value:
-            self.__mob_value: Text = Text(**self.__mob_value_props)
+            self.__mob_value: Text = utils.build_text(self.__mob_value_props)
             self.__mob_value.next_to(self.__mob_body, np.array([0, 0, 0]), 0)
             self.add(self.__mob_value)
 
         if init_index:
-            self.__mob_index: Text = Text(**self.__mob_index_props)
-            self.__mob_index.next_to(
-                self.__mob_body, self.__index_pos, self.__index_gap
-            )
-            self.add(self.__mob_index)
+            self.__mob_index: Text = None
+            if self.__mob_index_props["text"]:
+                self.__materialize_mob_index()
 
         if init_label:
-            self.__mob_label: Text = Text(**self.__mob_label_props)
-            self.__mob_label.next_to(
-                self.__mob_body, self.__label_pos, self.__label_gap
-            )
-            self.add(self.__mob_label)
+            self.__mob_label: Text = None
+            if self.__mob_label_props["text"]:
+                self.__materialize_mob_label()
+
+    def __materialize_mob_index(self) -> None:
+        """Instantiates a :class:`~manim.mobject.text.text_mobject.Text` and assigns it to :attr:`__mob_index`."""
+
+        self.__mob_index = utils.build_text(self.__mob_index_props)
+        self.__mob_index.next_to(self.__mob_body, self.__index_pos, self.__index_gap)
+        self.add(self.__mob_index)
+
+    def __materialize_mob_label(self) -> None:
+        """Instantiates a :class:`~manim.mobject.text.text_mobject.Text` and assigns it to :attr:`__mob_label`."""
+
+        self.__mob_label = utils.build_text(self.__mob_label_props)
+        self.__mob_label.next_to(self.__mob_body, self.__label_pos, self.__label_gap)
+        self.add(self.__mob_label)
 
     def __init__(
         self,
@@ -325,26 +339,42 @@ class MArrayElement(VGroup):
 
         return self.__mob_value
 
-    def fetch_mob_index(self) -> Text:
-        """Fetches the index mobject.
+    def fetch_mob_index(self, materialize: bool = True) -> typing.Optional[Text]:
+        """Fetches the index mobject, instantiating it if it was skipped.
+
+        Parameters
+        ----------
+        materialize
+            If `False`, a skipped index mobject isn't instantiated and `None` is returned instead.
 
         Returns
         -------
-        :class:`~manim.mobject.text.text_mobject.Text`
+        :data:`~typing.Optional`\0[:class:`~manim.mobject.text.text_mobject.Text`]
             :attr:`__mob_index`.
         """
 
+        if self.__mob_index is None and materialize:
+            self.__materialize_mob_index()
+
         return self.__mob_index
 
-    def fetch_mob_label(self) -> Text:
-        """Fetches the label mobject.
+    def fetch_mob_label(self, materialize: bool = True) -> typing.Optional[Text]:
+        """Fetches the label mobject, instantiating it if it was skipped.
+
+        Parameters
+        ----------
+        materialize
+            If `False`, a skipped label mobject isn't instantiated and `None` is returned instead.
 
         Returns
         -------
-        :class:`~manim.mobject.text.text_mobject.Text`
+        :data:`~typing.Optional`\0[:class:`~manim.mobject.text.text_mobject.Text`]
             :attr:`__mob_label`.
         """
 
+        if self.__mob_label is None and materialize:
+            self.__materialize_mob_label()
+
         return self.__mob_label
 
     def fetch_mob(self, mob_target: MArrayElementComp) -> Mobject:
@@ -371,7 +401,31 @@ class MArrayElement(VGroup):
             return self.fetch_mob_label()
         else:
             return self
-        
+
+    def fetch_content_hash(self) -> str:
+        """Fetches a hash of the element's props along with the geometry and style of its mobjects.
+
+        Used by manim's scene caching in place of serializing the whole element.
+
+        Returns
+        -------
+        :class:`str`
+            Hex digest of the element's state.
+        """
+
+        return utils.content_hash(
+            self,
+            type(self).__name__,
+            self.__mob_body_props,
+            self.__mob_value_props,
+            self.__mob_index_props,
+            self.__mob_label_props,
+            self.__index_pos,
+            self.__index_gap,
+            self.__label_pos,
+            self.__label_gap,
+        )
+
     def get_body(self) -> Square:
         return self.fetch_mob_square()
     
@@ -459,25 +513,24 @@ class MArrayElement(VGroup):
         Returns
         -------
         :class:`~manim.mobject.text.text_mobject.Text`
-            Updated :attr:`__mob_index`.
+            Updated :attr:`__mob_index`, `None` if it is empty and was not animated.
         """
 
         # Update props of mob_index
         self.__update_props(mob_index_args=mob_index_args)
 
         # Remove current mob_index
-        self.remove(self.__mob_index)
+        if self.__mob_index is not None:
+            self.remove(self.__mob_index)
 
-        # Initialize new mob_index
+        # Initialize new mob_index (added to group unless it is empty)
         self.__init_mobs(init_index=True)
 
-        # Add new mob_index to group
-        self.add(self.__mob_index)
-
         # Animate change
         if play_anim:
             self.__scene.play(
-                update_anim(self.__mob_index, **update_anim_args), **play_anim_args
+                update_anim(self.fetch_mob_index(), **update_anim_args),
+                **play_anim_args,
             )
 
         return self.__mob_index
@@ -508,29 +561,58 @@ class MArrayElement(VGroup):
         Returns
         -------
         :class:`~manim.mobject.text.text_mobject.Text`
-            Updated :attr:`__mob_label`.
+            Updated :attr:`__mob_label`, `None` if it is empty and was not animated.
         """
 
         # Update props of mob_label
         self.__update_props(mob_label_args=mob_label_args)
 
         # Remove current mob_label
-        self.remove(self.__mob_label)
+        if self.__mob_label is not None:
+            self.remove(self.__mob_label)
 
-        # Initialize new mob_label
+        # Initialize new mob_label (added to group unless it is empty)
         self.__init_mobs(init_label=True)
 
-        # Add new mob_label to group
-        self.add(self.__mob_label)
-
         # Animate change
         if play_anim:
             self.__scene.play(
-                update_anim(self.__mob_label, **update_anim_args), **play_anim_args
+                update_anim(self.fetch_mob_label(), **update_anim_args),
+                **play_anim_args,
             )
 
         return self.__mob_label
 
+    def assign_mob_index(self, mob_index: Text, mob_index_args: dict = {}) -> Text:
+        """Replaces the index mobject with the specified one (e.g. taken over from another element) and positions it w.r.t :attr:`__mob_body`.
+
+        Parameters
+        ----------
+        mob_index
+            Specifies the new index mobject. `None` leaves the index to be instantiated when it is fetched.
+        mob_index_args
+            Arguments for :class:`~manim.mobject.text.text_mobject.Text` that represents the element index. Its `text` should match the one of `mob_index`.
+
+        Returns
+        -------
+        :class:`~manim.mobject.text.text_mobject.Text`
+            Updated :attr:`__mob_index`.
+        """
+
+        self.__update_props(mob_index_args=mob_index_args)
+
+        if self.__mob_index is not None:
+            self.remove(self.__mob_index)
+
+        self.__mob_index = mob_index
+        if self.__mob_index is not None:
+            self.__mob_index.next_to(
+                self.__mob_body, self.__index_pos, self.__index_gap
+            )
+            self.add(self.__mob_index)
+
+        return self.__mob_index
+
     def animate_mob_body(self) -> "_AnimationBuilder":  # type: ignore
         """Invokes the animate property over square mobject.
 
@@ -562,7 +644,7 @@ class MArrayElement(VGroup):
             Animate property of :attr:`__mob_index`.
         """
 
-        return self.__mob_index.animate
+        return self.fetch_mob_index().animate
 
     def animate_mob_label(self) -> "_AnimationBuilder":  # type: ignore
         """Invokes the animate property over label mobject.
@@ -573,7 +655,7 @@ class MArrayElement(VGroup):
             Animate property of :attr:`__mob_label`.
         """
 
-        return self.__mob_label.animate
+        return self.fetch_mob_label().animate
 
     def swap_with_elem(
         self,
@@ -638,9 +720,63 @@ class MArrayElement(VGroup):
         self.__update_prop_refs(elem_prop_refs)
         elem.__update_prop_refs(self_prop_refs)
 
+        # Skipped (empty) index and label mobjects are None
         for mob_name in mobs_list:
-            self.add(getattr(self, mob_name))
-            elem.add(getattr(elem, mob_name))
+            if getattr(self, mob_name) is not None:
+                self.add(getattr(self, mob_name))
+            if getattr(elem, mob_name) is not None:
+                elem.add(getattr(elem, mob_name))
+
+    def swap_mobs_with_elem(
+        self, elem: "MArrayElement", swap_body: bool = False
+    ) -> None:
+        """Swaps the value (and body) with the element specified, keeping the index and label of both.
+
+        Unlike :meth:`swap_with_elem`, only the references of the swapped mobjects and their properties are exchanged, and each mobject takes over the slot of the other one in the submobjects instead of being removed and re-added.
+
+        Parameters
+        ----------
+        elem
+            Specifies the element to swap with.
+        swap_body
+            If `True`, swaps the body as well; otherwise only the value is swapped.
+        """
+
+        MArrayElement.permute_mobs([self, elem], [1, 0], swap_body)
+
+    @staticmethod
+    def permute_mobs(
+        elems: typing.List["MArrayElement"],
+        perm: typing.List[int],
+        swap_body: bool = False,
+    ) -> None:
+        """Moves the value (and body) of element `perm[i]` to element `i`, keeping the index and label of every element.
+
+        Each mobject takes over the slot of the one it replaces in the submobjects, so this runs in O(n) without removing and re-adding any mobject.
+
+        Parameters
+        ----------
+        elems
+            Specifies the elements to permute.
+        perm
+            Specifies the index in `elems` of the element whose mobjects each element receives.
+        swap_body
+            If `True`, permutes the bodies as well; otherwise only the values are permuted.
+        """
+
+        pairs: typing.List[typing.Tuple[str, str]] = [
+            ("_MArrayElement__mob_value", "_MArrayElement__mob_value_props")
+        ]
+        if swap_body:
+            pairs.append(("_MArrayElement__mob_body", "_MArrayElement__mob_body_props"))
+
+        for mob_name, props_name in pairs:
+            mobs = [getattr(elem, mob_name) for elem in elems]
+            props = [getattr(elem, props_name) for elem in elems]
+            for elem, mob, j in zip(elems, mobs, perm):
+                elem.submobjects[elem.submobjects.index(mob)] = mobs[j]
+                setattr(elem, mob_name, mobs[j])
+                setattr(elem, props_name, props[j])
 
 
 @utils.exclude_from_deepcopy("_MArray__scene")
@@ -714,6 +850,10 @@ class MArray(VGroup):
         Represents the array.
     __mob_arr_label : :class:`~manim.mobject.text.text_mobject.Text`
         Represents the array label.
+    __elem_len_tree : :class:`~.utils.FenwickTree`
+        Prefix sums of the `side_length`\0s of the elements' square mobjects.
+    __batch : :class:`~typing.List`\0[:class:`~typing.Tuple`\0[:class:`~typing.List`\0[:class:`~manim.animation.animation.Animation`], :data:`~typing.Callable`\0[`[]`, `None`], :class:`~typing.List`\0[:class:`~manim.mobject.mobject.Mobject`]]]
+        Animations (along with their completion callbacks and the mobjects they replaced) collected by :meth:`batch`; `None` outside of a batch.
     """
 
     __dir_map = [
@@ -727,6 +867,8 @@ class MArray(VGroup):
     def __sum_elem_len(self, index_start: int, index_end: int) -> int:
         """Sums the side_length of all elements' square mobject present in the array between the specified range.
 
+        Runs in O(log n) as the lengths are kept in :attr:`__elem_len_tree`.
+
         Parameters
         ----------
         index_start
@@ -748,10 +890,7 @@ class MArray(VGroup):
         ):
             raise Exception("Index out of bounds!")
 
-        total_len = 0
-        for i in range(index_start, index_end + 1):
-            total_len += self.__mob_arr[i].fetch_mob_body().side_length
-        return total_len
+        return self.__elem_len_tree.range_sum(index_start, index_end)
 
     def __calc_label_pos_and_mob(self) -> typing.Tuple[Square, np.ndarray]:
         """Calculates the position of the array label relative to one of the element's square mobjects.
@@ -926,6 +1065,7 @@ class MArray(VGroup):
             )
         )
         self.add(self.__mob_arr[-1])
+        self.__elem_len_tree.append(self.__mob_arr[-1].fetch_mob_body().side_length)
 
         anim_list = [
             append_anim(
@@ -944,6 +1084,64 @@ class MArray(VGroup):
 
         return anim_list
 
+    def __append_elems(self, values: typing.Iterable) -> None:
+        """Creates and inserts elements in bulk without animating them.
+
+        The element arguments are copied once and every body is positioned by a single cumulative sum over the side lengths instead of chaining :meth:`~manim.mobject.mobject.Mobject.next_to` calls.
+
+        Parameters
+        ----------
+        values
+            Specifies the values of the new elements.
+        """
+
+        mob_elem_body_props = deepcopy(self.__mob_elem_body_props)
+        mob_elem_value_props = deepcopy(self.__mob_elem_value_props)
+        mob_elem_index_props = deepcopy(self.__mob_elem_index_props)
+        index_pos = self.__calc_index_pos()
+        index_start = len(self.__mob_arr)
+
+        new_elems: typing.List[MArrayElement] = []
+        for i, value in enumerate(values):
+            mob_elem_value_props["text"] = value
+            mob_elem_index_props["text"] = self.__calc_index(index_start + i)
+            new_elems.append(
+                MArrayElement(
+                    scene=self.__scene,
+                    mob_body_args=mob_elem_body_props,
+                    mob_value_args=mob_elem_value_props,
+                    mob_index_args=mob_elem_index_props,
+                    index_pos=index_pos,
+                )
+            )
+
+        if not len(new_elems):
+            return
+
+        arr_dir_np = self.__dir_map[self.__arr_dir.value]["arr"]
+        elem_lens = np.array(
+            [elem.fetch_mob_body().side_length for elem in new_elems], dtype=float
+        )
+
+        # Every body is built at the origin, so its shift is its distance from the first new body
+        shifts = np.outer(
+            np.cumsum(elem_lens) - elem_lens / 2 - elem_lens[0] / 2, arr_dir_np
+        )
+        if len(self.__mob_arr):
+            shifts += (
+                self.__mob_arr[-1].fetch_mob_body().get_center()
+                + arr_dir_np * (self.__elem_len_tree.fetch(-1) + elem_lens[0]) / 2
+            )
+
+        for elem, shift_np in zip(new_elems, shifts):
+            elem.shift(shift_np)
+
+        self.__mob_arr.extend(new_elems)
+        self.__elem_len_tree.rebuild(
+            self.__elem_len_tree.fetch_values() + elem_lens.tolist()
+        )
+        self.add(*new_elems)
+
     def __remove_elem(
         self,
         index: int,
@@ -953,6 +1151,7 @@ class MArray(VGroup):
         update_anim_args: dict = {},
         removal_anim_target: MArrayElementComp = None,
         update_anim_target: MArrayElementComp = MArrayElementComp.INDEX,
+        reuse_index_mobs: bool = False,
     ) -> typing.Tuple[Succession, typing.Callable[[bool], typing.List[Animation]]]:
         """Removes the element from the array at the specified index.
 
@@ -972,6 +1171,8 @@ class MArray(VGroup):
             Specifies the target :class:`~manim.mobject.mobject.Mobject` of the :class:`MArrayElement` on which the removal :class:`~manim.animation.animation.Animation` is to be played.
         update_anim_target
             Specifies the target :class:`~manim.mobject.mobject.Mobject` of the :class:`MArrayElement` on which the update :class:`~manim.animation.animation.Animation` is to be played.
+        reuse_index_mobs
+            If `True`, the indices after the removed element are renumbered by passing each index mobject on to the next element, so only one index :class:`~manim.mobject.text.text_mobject.Text` is instantiated. Assumes the indices have not been changed through :meth:`update_elem_index`.
 
         Returns
         -------
@@ -987,16 +1188,20 @@ class MArray(VGroup):
         self.remove(self.__mob_arr[index])
         removed_mob = self.__mob_arr[index]
         self.__mob_arr = self.__mob_arr[0:index] + self.__mob_arr[index + 1 :]
+        self.__elem_len_tree.delete(index)
 
+        # The following elements move by one shared offset in a single animation
         anims_shift = []
-        for i in range(index, len(self.__mob_arr)):
+        if index < len(self.__mob_arr):
             anims_shift.append(
-                ApplyMethod(
-                    self.__mob_arr[i].shift,
+                TranslateMobjects(
+                    VGroup(*self.__mob_arr[index:]),
+                    self.__mob_arr[index:],
                     -(
                         self.__dir_map[self.__arr_dir.value]["arr"]
                         * removed_mob.fetch_mob_body().side_length
                     ),
+                    remover=True,
                 )
             )
 
@@ -1028,20 +1233,39 @@ class MArray(VGroup):
                 Represents :class:`Animation` for indices update.
             """
 
+            if reuse_index_mobs:
+                # Element i (previously i + 1) takes over the index of element i - 1
+                # (previously i); the index of the last element is dropped
+                for i in range(len(self.__mob_arr) - 1, index, -1):
+                    self.__mob_arr[i].assign_mob_index(
+                        self.__mob_arr[i - 1].fetch_mob_index(materialize=False),
+                        {"text": self.__calc_index(i)},
+                    )
+                # The removed element's index has been animated along with it
+                if index < len(self.__mob_arr):
+                    self.__mob_arr[index].update_mob_index(
+                        mob_index_args={"text": self.__calc_index(index)},
+                        play_anim=False,
+                    )
+
             anims_index = []
             for i in range(index, len(self.__mob_arr)):
-                self.__mob_arr[i].update_mob_index(
-                    mob_index_args={"text": self.__calc_index(i)}, play_anim=False
-                )
+                if not reuse_index_mobs:
+                    self.__mob_arr[i].update_mob_index(
+                        mob_index_args={"text": self.__calc_index(i)}, play_anim=False
+                    )
+                if self.__hide_index and update_anim_target == MArrayElementComp.INDEX:
+                    # Hidden indices are never instantiated, nothing to animate
+                    continue
                 anims_index.append(
                     update_anim(
                         (self.__mob_arr[i].fetch_mob(update_anim_target)),
-                        **update_anim_args
+                        **update_anim_args,
                     )
                 )
 
             if play_anim:
-                self.__scene.play(*anims_index, **play_anim_args)
+                self.__play(anims_index, play_anim_args=play_anim_args)
 
             return anims_index
 
@@ -1055,6 +1279,133 @@ class MArray(VGroup):
             update_indices,
         )
 
+    def __play_in_scene(self, *anims: Animation, **play_anim_args) -> None:
+        """Plays the specified animations and keeps the array whole at the top level of the scene.
+
+        :py:meth:`Scene.play() <manim.scene.scene.Scene.play>` adds the mobjects of the animations (and the groups wrapping them) to the top level of the scene, splitting the array up into its remaining parts. Afterwards, those mobjects and parts are taken off the top level again and the array takes their place, provided it was on the scene.
+
+        Parameters
+        ----------
+        *anims
+            Specifies the animations to play.
+        **play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+        """
+
+        shown = any(mob is self for mob in self.__scene.mobjects)
+        self.__scene.play(*anims, **play_anim_args)
+        if not shown:
+            return
+
+        # The mobjects the animations introduced, including replaced values
+        animated = set()
+        pending = list(anims)
+        while pending:
+            anim = pending.pop()
+            if anim.mobject is not None:
+                animated.add(id(anim.mobject))
+            pending.extend(getattr(anim, "animations", []))
+        family = {id(mob) for mob in self.get_family()}
+
+        mobjects = []
+        position = None
+        for mob in self.__scene.mobjects:
+            if mob is self or id(mob) in family:
+                if position is None:
+                    position = len(mobjects)
+            elif id(mob) not in animated:
+                mobjects.append(mob)
+        mobjects.insert(len(mobjects) if position is None else position, self)
+        self.__scene.mobjects = mobjects
+
+    def __play(
+        self,
+        anims: typing.List[Animation],
+        on_finish: typing.Callable[[], None] = None,
+        play_anim_args: dict = {},
+        replaced: typing.List[Mobject] = [],
+    ) -> None:
+        """Plays the specified animations, or collects them if a :meth:`batch` is open.
+
+        Parameters
+        ----------
+        anims
+            Specifies the animations to play.
+        on_finish
+            Called once the animations have been played.
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`. Ignored inside a batch.
+        replaced
+            Specifies the mobjects of the array that the operation replaced (e.g. the previous value of an element). Inside a batch, the animations aren't grouped with those of earlier operations animating them.
+        """
+
+        if self.__batch is not None:
+            self.__batch.append((anims, on_finish, replaced))
+            return
+
+        if len(anims):
+            self.__play_in_scene(*anims, **play_anim_args)
+
+        if on_finish is not None:
+            on_finish()
+
+    def __play_batch(
+        self,
+        steps: typing.List[
+            typing.Tuple[
+                typing.List[Animation],
+                typing.Callable[[], None],
+                typing.List[Mobject],
+            ]
+        ],
+        play_anim_args: dict = {},
+    ) -> None:
+        """Plays the animations collected by a :meth:`batch` in a single :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+
+        Consecutive steps are grouped into one :class:`~manim.animation.composition.AnimationGroup` as long as they animate disjoint mobjects; a step that touches (or replaces) a mobject of the current group starts the next one. The groups are played in order.
+
+        Parameters
+        ----------
+        steps
+            Specifies the collected animations, their completion callbacks and the mobjects they replaced.
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+        """
+
+        groups: typing.List[typing.List[Animation]] = []
+        group_family: typing.Set[int] = set()
+        callbacks: typing.List[typing.Callable[[], None]] = []
+
+        for anims, on_finish, replaced in steps:
+            if on_finish is not None:
+                callbacks.append(on_finish)
+            if not len(anims):
+                continue
+
+            family = {
+                id(mob)
+                for anim in anims
+                if anim.mobject is not None
+                for mob in anim.mobject.get_family()
+            }
+            family |= {id(mob) for mob in replaced if mob is not None}
+            if not len(groups) or not family.isdisjoint(group_family):
+                groups.append([])
+                group_family = set()
+            groups[-1].extend(anims)
+            group_family |= family
+
+        if len(groups) == 1:
+            self.__play_in_scene(AnimationGroup(*groups[0]), **play_anim_args)
+        elif len(groups):
+            self.__play_in_scene(
+                Succession(*[AnimationGroup(*group) for group in groups]),
+                **play_anim_args,
+            )
+
+        for callback in callbacks:
+            callback()
+
     def __init_props(
         self,
         scene: Scene,
@@ -1107,6 +1458,14 @@ class MArray(VGroup):
         self.__arr: typing.List[typing.Any] = arr
         self.__label: str = label
         self.__mob_arr: typing.List[MArrayElement] = []
+        self.__elem_len_tree: utils.FenwickTree = utils.FenwickTree()
+        self.__batch: typing.List[
+            typing.Tuple[
+                typing.List[Animation],
+                typing.Callable[[], None],
+                typing.List[Mobject],
+            ]
+        ] = None
         self.__index_offset: int = index_offset
         self.__index_start: int = index_start
         self.__index_hex_display: bool = index_hex_display
@@ -1166,6 +1525,7 @@ class MArray(VGroup):
                     )
             self.add(self.__mob_arr_label)
 
+    @traced
     def __init__(
         self,
         scene: Scene,
@@ -1247,15 +1607,35 @@ class MArray(VGroup):
         )
 
         # Append elements to __mob_arr
-        for v in arr:
-            self.__append_elem(
-                v,
-                False,
-            )
+        self.__append_elems(arr)
 
         # Initialize other mobjects (e.g. __arr_label)
         self.__init_mobs(True)
 
+    @classmethod
+    def from_values(cls, scene: Scene, values: typing.Iterable, **kwargs) -> "MArray":
+        """Builds an array from any iterable of values (e.g. a :class:`np.ndarray` or a generator).
+
+        Parameters
+        ----------
+        scene
+            Specifies the scene where the object is to be rendered.
+        values
+            Specifies the values of the array.
+        **kwargs
+            Forwarded to the constructor of :class:`MArray`.
+
+        Returns
+        -------
+        :class:`MArray`
+            The constructed array.
+        """
+
+        if isinstance(values, np.ndarray):
+            values = values.tolist()
+
+        return cls(scene, list(values), **kwargs)
+
     def fetch_arr(self) -> list:
         """Fetches the original array.
 
@@ -1289,6 +1669,35 @@ class MArray(VGroup):
 
         return self.__mob_arr_label
 
+    def fetch_content_hash(self) -> str:
+        """Fetches a hash of the array's values and props along with the geometry and style of its mobjects.
+
+        Used by manim's scene caching in place of serializing the whole array.
+
+        Returns
+        -------
+        :class:`str`
+            Hex digest of the array's state.
+        """
+
+        return utils.content_hash(
+            self,
+            type(self).__name__,
+            self.__arr,
+            self.__label,
+            self.__index_offset,
+            self.__index_start,
+            self.__index_hex_display,
+            self.__hide_index,
+            self.__arr_dir,
+            self.__arr_label_pos,
+            self.__arr_label_gap,
+            self.__mob_arr_label_props,
+            self.__mob_elem_body_props,
+            self.__mob_elem_value_props,
+            self.__mob_elem_index_props,
+        )
+
     def fetch_arr_dir(self) -> MArrayDirection:
         """Fetches the growth direction enum of the array.
 
@@ -1300,6 +1709,60 @@ class MArray(VGroup):
 
         return self.__arr_dir
 
+    @traced_context
+    @contextmanager
+    def batch(
+        self, run_time: float = None, play_anim_args: dict = {}
+    ) -> typing.Iterator["MArray"]:
+        """Collects the animations of the array's operations and plays them together on exit.
+
+        Inside the block, :meth:`append_elem`, :meth:`remove_elem`, :meth:`swap_elems`, :meth:`update_elem_value`, :meth:`update_elem_index` and :meth:`update_mob_arr_label` update the array immediately but defer their animations. On exit they are played in a single :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`, see :meth:`__play_batch`. Nested batches join the outermost one.
+
+        Operations that animate (or replace) the same mobject, e.g. two updates of one element, are played one after the other.
+
+        Mobjects are only moved when the batch is played, so an operation that places a new mobject relative to a pending move (e.g. appending after a removal) should go in a separate batch.
+
+        Parameters
+        ----------
+        run_time
+            Specifies the total run time of the batch. Defaults to the run times of the animations.
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`. Per-operation `play_anim_args` are ignored inside the batch.
+
+        Yields
+        ------
+        :class:`MArray`
+            The array itself.
+
+        Examples
+        --------
+        ::
+
+            with arr.batch(run_time=1):
+                for i in range(len(arr.fetch_arr())):
+                    arr.update_elem_value(i, 0)
+        """
+
+        if self.__batch is not None:
+            yield self
+            return
+
+        self.__batch = []
+        try:
+            yield self
+        except BaseException:
+            self.__batch = None
+            raise
+
+        steps, self.__batch = self.__batch, None
+
+        play_anim_args = dict(play_anim_args)
+        if run_time is not None:
+            play_anim_args["run_time"] = run_time
+
+        self.__play_batch(steps, play_anim_args)
+
+    @traced
     def update_elem_value(
         self,
         index: int,
@@ -1340,10 +1803,21 @@ class MArray(VGroup):
 
         self.__arr[index] = value
         mob_value_args["text"] = value
-        return self.__mob_arr[index].update_mob_value(
-            mob_value_args, update_anim, update_anim_args, play_anim, play_anim_args
+        replaced = self.__mob_arr[index].fetch_mob_value()
+        mob_value = self.__mob_arr[index].update_mob_value(
+            mob_value_args, play_anim=False
         )
 
+        if play_anim:
+            self.__play(
+                [update_anim(mob_value, **update_anim_args)],
+                play_anim_args=play_anim_args,
+                replaced=[replaced],
+            )
+
+        return mob_value
+
+    @traced
     def update_elem_index(
         self,
         index: int,
@@ -1383,10 +1857,22 @@ class MArray(VGroup):
             raise Exception("Index out of bounds!")
 
         mob_index_args["text"] = value
-        return self.__mob_arr[index].update_mob_index(
-            mob_index_args, update_anim, update_anim_args, play_anim, play_anim_args
+        replaced = self.__mob_arr[index].fetch_mob_index(materialize=False)
+        mob_index = self.__mob_arr[index].update_mob_index(
+            mob_index_args, play_anim=False
         )
 
+        if play_anim:
+            mob_index = self.__mob_arr[index].fetch_mob_index()
+            self.__play(
+                [update_anim(mob_index, **update_anim_args)],
+                play_anim_args=play_anim_args,
+                replaced=[replaced],
+            )
+
+        return mob_index
+
+    @traced
     def update_mob_arr_label(
         self,
         label: str,
@@ -1425,6 +1911,7 @@ class MArray(VGroup):
         self.__update_props(mob_arr_label_args=mob_arr_label_args)
 
         # Remove current mob_label
+        replaced = self.__mob_arr_label
         self.remove(self.__mob_arr_label)
 
         # Initialize new mob_label
@@ -1435,8 +1922,10 @@ class MArray(VGroup):
 
         # Animate change
         if play_anim:
-            self.__scene.play(
-                update_anim(self.__mob_arr_label, **update_anim_args), **play_anim_args
+            self.__play(
+                [update_anim(self.__mob_arr_label, **update_anim_args)],
+                play_anim_args=play_anim_args,
+                replaced=[replaced],
             )
 
         return self.__mob_arr_label
@@ -1517,6 +2006,7 @@ class MArray(VGroup):
 
         return self.__mob_arr[index].animate_mob_index()
 
+    @traced
     def append_elem(
         self,
         value: typing.Any,
@@ -1571,10 +2061,11 @@ class MArray(VGroup):
         )
 
         if play_anim:
-            self.__scene.play(*anim_list, **play_anim_args)
+            self.__play(anim_list, play_anim_args=play_anim_args)
 
         return anim_list
 
+    @traced
     def remove_elem(
         self,
         index: int,
@@ -1586,6 +2077,7 @@ class MArray(VGroup):
         update_anim_target: MArrayElementComp = MArrayElementComp.INDEX,
         play_anim: bool = True,
         play_anim_args: dict = {},
+        reuse_index_mobs: bool = False,
     ) -> typing.Tuple[Succession, typing.Callable[[bool], typing.List[Animation]]]:
         """Removes the element from the array at the specified index.
 
@@ -1609,6 +2101,8 @@ class MArray(VGroup):
             If `True`, plays the animation(s).
         play_anim_args
             Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+        reuse_index_mobs
+            If `True`, the indices after the removed element are renumbered by passing each index mobject on to the next element, so only one index :class:`~manim.mobject.text.text_mobject.Text` is instantiated. Assumes the indices have not been changed through :meth:`update_elem_index`.
 
         Returns
         -------
@@ -1631,14 +2125,16 @@ class MArray(VGroup):
             update_anim_args,
             removal_anim_target,
             update_anim_target,
+            reuse_index_mobs,
         )
 
         if play_anim:
-            self.__scene.play(remove_anim, **play_anim_args)
+            self.__play([remove_anim], play_anim_args=play_anim_args)
             update_indices(play_anim_args=play_anim_args)
 
         return (remove_anim, update_indices)
 
+    @traced
     def swap_elems(
         self,
         index_1: int,
@@ -1646,7 +2142,7 @@ class MArray(VGroup):
         swap_body: bool = False,
         play_anim: bool = True,
         play_anim_args: dict = {},
-    ) -> typing.Tuple[CyclicReplace, typing.Callable[[], None]]:
+    ) -> typing.Tuple[TranslateMobjects, typing.Callable[[], None]]:
         """Swap two elements of the array.
 
         Parameters
@@ -1664,8 +2160,8 @@ class MArray(VGroup):
 
         Returns
         -------
-        :class:`~manim.animation.transform.CyclicReplace`
-            Animation for swapping of elements.
+        :class:`~.m_animation.TranslateMobjects`
+            Animation for swapping of elements, moving them along arcs like :class:`~manim.animation.transform.CyclicReplace` without copying them.
         :data:`~typing.Callable`\0[`[]`, `None`]
             Method that updates the submobjects and references of the swapped elements.
         """
@@ -1686,7 +2182,6 @@ class MArray(VGroup):
             self.__arr[index_1],
         )
 
-        anim: CyclicReplace = None
         if swap_body:
             group_1 = VGroup(
                 swap_elem_1.fetch_mob_body(), swap_elem_1.fetch_mob_value()
@@ -1694,35 +2189,291 @@ class MArray(VGroup):
             group_2 = VGroup(
                 swap_elem_2.fetch_mob_body(), swap_elem_2.fetch_mob_value()
             )
-            anim = CyclicReplace(group_1, group_2, remover=True)
         else:
-            anim = CyclicReplace(
-                swap_elem_1.fetch_mob_value(),
-                swap_elem_2.fetch_mob_value(),
-                remover=True,
-            )
+            group_1 = VGroup(swap_elem_1.fetch_mob_value())
+            group_2 = VGroup(swap_elem_2.fetch_mob_value())
+
+        displacement = group_2.get_center() - group_1.get_center()
+        anim = TranslateMobjects(
+            VGroup(group_1, group_2),
+            [group_1, group_2],
+            [displacement, -displacement],
+            path_arc=90 * DEGREES,
+            remover=True,
+        )
 
-        def update_references():
-            """Updates references of submobjects and attributes for the swapped elements."""
+        refs_swapped = False
+
+        def swap_references():
+            """Swaps the mobjects of the elements; runs only once."""
+
+            nonlocal refs_swapped
+            if refs_swapped:
+                return
+            refs_swapped = True
 
+            swap_elem_1.swap_mobs_with_elem(swap_elem_2, swap_body)
             if swap_body:
-                swap_elem_1.swap_with_elem(
-                    swap_elem_2,
-                    exclude_list=[
-                        "_MArrayElement__mob_index",
-                        "_MArrayElement__mob_label",
-                    ],
+                len_1 = self.__elem_len_tree.fetch(index_1)
+                self.__elem_len_tree.update(
+                    index_1, self.__elem_len_tree.fetch(index_2)
                 )
-            else:
-                swap_elem_1.swap_with_elem(swap_elem_2)
-            self.__scene.add(swap_elem_1, swap_elem_2)
+                self.__elem_len_tree.update(index_2, len_1)
+
+        def update_references():
+            """Updates references of submobjects and attributes for the swapped elements.
+
+            The elements stay children of the array only, instead of also being added to the top level of the scene.
+            """
+
+            swap_references()
+
+        if play_anim:
+            if self.__batch is not None:
+                # Later operations of the batch must see the swapped elements
+                swap_references()
+            self.__play([anim], update_references, play_anim_args)
+
+        return (anim, update_references)
+
+    @traced
+    def apply_permutation(
+        self,
+        perm: typing.Iterable[int],
+        mode: MArrayPermutationMode = MArrayPermutationMode.SIMULTANEOUS,
+        swap_body: bool = False,
+        wave_size: int = 8,
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> typing.Tuple[Animation, typing.Callable[[], None]]:
+        """Reorders the array so that the element at index `perm[i]` moves to index `i`, in a single animation.
+
+        Runs in O(n): the destination of every element is computed from the prefix sums of the element lengths and the mobjects are moved by one :class:`~.m_animation.TranslateMobjects` (per wave), instead of one :meth:`swap_elems` play per swap.
+
+        Parameters
+        ----------
+        perm
+            Specifies the permutation, containing each index of the array exactly once.
+        mode
+            Specifies whether the elements move at once or in staggered waves.
+        swap_body
+            If `True`, the bodies move along with the values; otherwise only the values move.
+        wave_size
+            Specifies the number of neighbouring destinations per wave in :attr:`~.m_enum.MArrayPermutationMode.STAGGERED` mode. Each wave starts when the previous one is halfway.
+        play_anim
+            If `True`, plays the animation(s).
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+
+        Returns
+        -------
+        :class:`~manim.animation.animation.Animation`
+            :class:`~.m_animation.TranslateMobjects` moving the elements, or a :class:`~manim.animation.composition.LaggedStart` of one per wave.
+        :data:`~typing.Callable`\0[`[]`, `None`]
+            Method that updates the submobjects and references of the permuted elements.
+        """
+
+        order = np.asarray(list(perm), dtype=int)
+        n = len(self.__mob_arr)
+        seen = np.zeros(n, dtype=bool)
+        if len(order) != n or (n and (order.min() < 0 or order.max() >= n)):
+            raise Exception("Invalid permutation!")
+        seen[order] = True
+        if not seen.all():
+            raise Exception("Invalid permutation!")
+
+        self.__arr = [self.__arr[i] for i in order]
+
+        # Element i receives the mobjects of element order[i]
+        lens = np.array(self.__elem_len_tree.fetch_values(), dtype=float)
+        new_lens = lens[order] if swap_body else lens
+        centers = np.cumsum(lens) - lens / 2
+        new_centers = np.cumsum(new_lens) - new_lens / 2
+        mob_shifts = new_centers - centers[order]
+        slot_shifts = new_centers - centers
+        arr_dir_np = self.__dir_map[self.__arr_dir.value]["arr"]
+
+        waves: typing.List[typing.Tuple[list, list]] = []
+        for i in range(n):
+            if mode == MArrayPermutationMode.SIMULTANEOUS:
+                if not len(waves):
+                    waves.append(([], []))
+            elif i % max(wave_size, 1) == 0:
+                waves.append(([], []))
+            mobs, shifts = waves[-1]
+
+            src_elem = self.__mob_arr[order[i]]
+            if mob_shifts[i] != 0:
+                mobs.append(src_elem.fetch_mob_value())
+                shifts.append(arr_dir_np * mob_shifts[i])
+                if swap_body:
+                    mobs.append(src_elem.fetch_mob_body())
+                    shifts.append(arr_dir_np * mob_shifts[i])
+            if slot_shifts[i] != 0:
+                # The index and label stay with the slot, which changes its length
+                for mob in (
+                    self.__mob_arr[i].fetch_mob_index(materialize=False),
+                    self.__mob_arr[i].fetch_mob_label(materialize=False),
+                ):
+                    if mob is not None:
+                        mobs.append(mob)
+                        shifts.append(arr_dir_np * slot_shifts[i])
+
+        anims = [
+            TranslateMobjects(VGroup(*mobs), mobs, shifts, remover=True)
+            for mobs, shifts in waves
+            if len(mobs)
+        ]
+        if mode == MArrayPermutationMode.STAGGERED and len(anims) > 1:
+            anim = LaggedStart(*anims, lag_ratio=0.5, remover=True)
+        elif len(anims):
+            anim = anims[0]
+        else:
+            anim = TranslateMobjects(VGroup(), [], np.zeros(3), remover=True)
+
+        refs_permuted = False
+
+        def update_references():
+            """Updates references of submobjects and attributes for the permuted elements; runs only once."""
+
+            nonlocal refs_permuted
+            if refs_permuted:
+                return
+            refs_permuted = True
+
+            MArrayElement.permute_mobs(self.__mob_arr, order.tolist(), swap_body)
+            if swap_body:
+                self.__elem_len_tree.rebuild(new_lens.tolist())
 
         if play_anim:
-            self.__scene.play(anim, **play_anim_args)
-            update_references()
+            if self.__batch is not None:
+                # Later operations of the batch must see the permuted elements
+                update_references()
+            self.__play([anim], update_references, play_anim_args)
 
         return (anim, update_references)
 
+    @traced
+    def morph_to(
+        self,
+        new_values: typing.Iterable,
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> Animation:
+        """Changes the array to the specified values, reusing the value mobjects of a diff.
+
+        The values kept by a :class:`~difflib.SequenceMatcher` diff of the displayed values are moved to their new positions, so only inserted or changed values instantiate a :class:`~manim.mobject.text.text_mobject.Text`. The diff is a heuristic and not guaranteed to keep the most values. The elements themselves keep their positions; only the length difference is appended or removed at the end.
+
+        Parameters
+        ----------
+        new_values
+            Specifies the values of the array after the change.
+        play_anim
+            If `True`, plays the animation(s).
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`.
+
+        Returns
+        -------
+        :class:`~manim.animation.animation.Animation`
+            Fades out the dropped values (and elements), then moves the kept values and then fades in the new values (and elements). A no-op animation if the values don't change.
+        """
+
+        new_values = list(new_values)
+        n, m = len(self.__arr), len(new_values)
+
+        # New element j keeps the value of old element source[j]
+        source: typing.List[typing.Optional[int]] = [None] * m
+        for tag, i1, i2, j1, _ in SequenceMatcher(
+            None,
+            [str(value) for value in self.__arr],
+            [str(value) for value in new_values],
+            autojunk=False,
+        ).get_opcodes():
+            if tag == "equal":
+                for k in range(i2 - i1):
+                    source[j1 + k] = i1 + k
+
+        # Pair the remaining values with the remaining elements, keeping the new values of appended elements in place
+        total = max(n, m)
+        perm: typing.List[typing.Optional[int]] = source + [None] * (total - m)
+        free = set(range(total)) - {i for i in source if i is not None}
+        for j in range(n, total):
+            if perm[j] is None:
+                perm[j] = j
+                free.remove(j)
+        free_iter = iter(sorted(free))
+        for j in range(total):
+            if perm[j] is None:
+                perm[j] = next(free_iter)
+
+        arr_dir_np = self.__dir_map[self.__arr_dir.value]["arr"]
+        label_shift = 0
+        anims_in: typing.List[Animation] = []
+        if m > n:
+            # An appended element whose slot takes a kept value is built with the new value of the element it hands its value to
+            receiver = {i: j for j, i in enumerate(perm)}
+            self.__append_elems([new_values[receiver[i]] for i in range(n, m)])
+            for elem in self.__mob_arr[n:]:
+                label_shift += self.__calc_label_shift_factor(elem)
+                anims_in.append(FadeIn(elem.fetch_mob_body()))
+                mob_index = elem.fetch_mob_index(materialize=False)
+                if mob_index is not None:
+                    anims_in.append(FadeIn(mob_index))
+
+        centers = [elem.fetch_mob_body().get_center() for elem in self.__mob_arr]
+        mobs: typing.List[Mobject] = []
+        shifts: typing.List[np.ndarray] = []
+        for j, i in enumerate(perm[:m]):
+            if source[j] is not None and i != j:
+                mobs.append(self.__mob_arr[i].fetch_mob_value())
+                shifts.append(centers[j] - centers[i])
+
+        MArrayElement.permute_mobs(self.__mob_arr, perm)
+
+        anims_out: typing.List[Animation] = []
+        for j in range(m):
+            if source[j] is not None:
+                continue
+            elem = self.__mob_arr[j]
+            if perm[j] < n:
+                # Element j now holds a dropped value
+                anims_out.append(FadeOut(elem.fetch_mob_value()))
+                elem.update_mob_value({"text": new_values[j]}, play_anim=False)
+            elif perm[j] != j:
+                # Element j now holds its new value, built by an appended element
+                elem.fetch_mob_value().move_to(centers[j])
+            anims_in.append(FadeIn(elem.fetch_mob_value()))
+
+        for elem in self.__mob_arr[m:]:
+            label_shift -= self.__calc_label_shift_factor(elem)
+            self.remove(elem)
+            anims_out.append(FadeOut(elem))
+        if m < n:
+            self.__mob_arr = self.__mob_arr[:m]
+            self.__elem_len_tree.rebuild(self.__elem_len_tree.fetch_values()[:m])
+
+        if label_shift != 0:
+            mobs.append(self.__mob_arr_label)
+            shifts.append(arr_dir_np * label_shift)
+
+        self.__arr = new_values
+
+        # Played one after the other, but all begun at once so the new mobjects start hidden
+        anims = [AnimationGroup(*anims_out)] if len(anims_out) else []
+        if len(mobs):
+            anims.append(TranslateMobjects(VGroup(*mobs), mobs, shifts, remover=True))
+        if len(anims_in):
+            anims.append(AnimationGroup(*anims_in))
+        if not len(anims):
+            return TranslateMobjects(VGroup(), [], np.zeros(3), remover=True)
+        anim = AnimationGroup(*anims, lag_ratio=1)
+
+        if play_anim:
+            self.__play([anim], play_anim_args=play_anim_args)
+
+        return anim
+
 
 @utils.exclude_from_deepcopy("_MArrayPointer__scene", "_MArrayPointer__arr")
 class MArrayPointer(VGroup):
@@ -1781,6 +2532,8 @@ class MArrayPointer(VGroup):
         Represents the label of the element.
     __updater_pos : :data:`typing.Callable`\0[[], None]
         The updater function that keeps the pointer intact with the array.
+    __pos_key : :class:`tuple`
+        The layout the pointer was last positioned for, see :meth:`__calc_pos_key`.
     """
 
     __dir_map = [
@@ -1814,11 +2567,33 @@ class MArrayPointer(VGroup):
 
         return arrow_pos_np
 
+    def __calc_pos_key(self) -> tuple:
+        """Calculates a key that changes whenever the pointer has to be repositioned.
+
+        Returns
+        -------
+        :class:`tuple`
+            :attr:`__index`, the center and size of the attached element's body and the center of :attr:`__mob_arrow`.
+        """
+
+        mob_body = self.__arr.fetch_mob_arr()[self.__index].fetch_mob_body()
+        return (
+            self.__index,
+            *mob_body.get_center(),
+            mob_body.width,
+            mob_body.height,
+            *self.__mob_arrow.get_center(),
+        )
+
     def __add_updater(self) -> None:
         """Attaches the position updater function with the pointer."""
 
         def updater_pos(mob: Mobject) -> None:
+            pos_key = self.__calc_pos_key()
+            if pos_key == self.__pos_key:
+                return
             self.__init_pos()
+            self.__pos_key = self.__calc_pos_key()
 
         self.__updater_pos = updater_pos
 
@@ -1908,6 +2683,7 @@ class MArrayPointer(VGroup):
         self.__arrow_gap: float = arrow_gap
         self.__label_gap: float = label_gap
         self.__pointer_pos: MArrayDirection = pointer_pos
+        self.__pos_key: tuple = None
 
     def __update_props(
         self, mob_arrow_args: dict = {}, mob_label_args: dict = {}
@@ -1945,7 +2721,7 @@ class MArrayPointer(VGroup):
             self.__mob_arrow = Arrow(
                 start=(-arrow_pos_np + (arrow_pos_np * self.__arrow_len)),
                 end=-arrow_pos_np,
-                **self.__mob_arrow_props
+                **self.__mob_arrow_props,
             )
             self.__mob_arrow.next_to(
                 self.__arr.fetch_mob_arr()[self.__index].fetch_mob_body(),
@@ -1973,6 +2749,7 @@ class MArrayPointer(VGroup):
             self.__arrow_gap,
         )
 
+    @traced
     def __init__(
         self,
         scene: Scene,
@@ -2064,6 +2841,7 @@ class MArrayPointer(VGroup):
 
         return self.__index
 
+    @traced
     def update_mob_label(
         self,
         label: str,
@@ -2140,6 +2918,7 @@ class MArrayPointer(VGroup):
 
         return self.__mob_label.animate
 
+    @traced
     def shift_to_elem(
         self, index: int, play_anim: bool = True, play_anim_args: dict = {}
     ) -> ApplyMethod:
@@ -2173,6 +2952,7 @@ class MArrayPointer(VGroup):
 
         return shift_anim
 
+    @traced
     def attach_to_elem(self, index: int) -> None:
         """Attaches pointer to the specified element.
 
@@ -2242,6 +3022,8 @@ class MArraySlidingWindow(VGroup):
         Represents the label of the sliding window.
     __updater_pos : :data:`typing.Callable`\0[[], None]
         The updater function that keeps the sliding window intact with the array.
+    __pos_key : :class:`tuple`
+        The layout the sliding window was last positioned for, see :meth:`__calc_pos_key`.
     """
 
     __dir_map = [
@@ -2354,11 +3136,34 @@ class MArraySlidingWindow(VGroup):
                 self.__label_gap,
             )
 
+    def __calc_pos_key(self) -> tuple:
+        """Calculates a key that changes whenever the sliding window has to be repositioned.
+
+        Returns
+        -------
+        :class:`tuple`
+            :attr:`__index`, :attr:`__size`, the center and size of the first enclosed element's body and the center of :attr:`__mob_window`.
+        """
+
+        mob_body = self.__arr.fetch_mob_arr()[self.__index].fetch_mob_body()
+        return (
+            self.__index,
+            self.__size,
+            *mob_body.get_center(),
+            mob_body.width,
+            mob_body.height,
+            *self.__mob_window.get_center(),
+        )
+
     def __add_updater(self) -> None:
         """Attaches the position updater function with the pointer."""
 
         def updater_pos(mob: Mobject) -> None:
+            pos_key = self.__calc_pos_key()
+            if pos_key == self.__pos_key:
+                return
             self.__init_pos()
+            self.__pos_key = self.__calc_pos_key()
 
         self.__updater_pos = updater_pos
 
@@ -2412,6 +3217,7 @@ class MArraySlidingWindow(VGroup):
         self.__label: str = label
         self.__label_gap: float = label_gap
         self.__label_pos: MArrayDirection = label_pos
+        self.__pos_key: tuple = None
 
     def __update_props(
         self, mob_window_args: dict = {}, mob_label_args: dict = {}
@@ -2462,6 +3268,7 @@ class MArraySlidingWindow(VGroup):
 
         self.__pos_mobs(True, True)
 
+    @traced
     def __init__(
         self,
         scene: Scene,
@@ -2537,6 +3344,7 @@ class MArraySlidingWindow(VGroup):
 
         return self.__mob_label
 
+    @traced
     def update_mob_label(
         self,
         label: str,
@@ -2613,6 +3421,7 @@ class MArraySlidingWindow(VGroup):
 
         return self.__mob_label.animate
 
+    @traced
     def shift_to_elem(
         self, index: int, play_anim: bool = True, play_anim_args: dict = {}
     ) -> ApplyFunction:
@@ -2642,6 +3451,7 @@ class MArraySlidingWindow(VGroup):
         self.__index = index
         return self.resize_window(self.__size, play_anim, play_anim_args)
 
+    @traced
     def attach_to_elem(self, index: int) -> None:
         """Attaches pointer to the specified element.
 
@@ -2660,6 +3470,7 @@ class MArraySlidingWindow(VGroup):
         self.__index = index
         self.__init_pos()
 
+    @traced
     def resize_window(
         self, size: int, play_anim: bool = True, play_anim_args: dict = {}
     ) -> ApplyFunction:
@@ -2716,3 +3527,6 @@ class MArraySlidingWindow(VGroup):
             self.__scene.play(resize_anim, **play_anim_args)
 
         return resize_anim
+
+
+utils.register_content_hash(MArrayElement, MArray)
@@ -0,0 +1,1542 @@
+"""Contains classes to validate array scripts without building mobjects or rendering."""
+
+import typing
+from contextlib import contextmanager
+from difflib import SequenceMatcher
+
+from .m_enum import MArrayDirection, MArrayElementComp, MArrayPermutationMode
+
+DEFAULT_RUN_TIME: float = 1.0
+"""Run time assumed for a :py:meth:`Scene.play() <manim.scene.scene.Scene.play>` without an explicit `run_time`, same as manim's default."""
+
+
+class DryRunScene:
+    """A stand-in for :class:`~manim.scene.scene.Scene` that logs operations instead of rendering them.
+
+    Pass it as the `scene` of :class:`DryRunMArray`, :class:`DryRunMArrayPointer`, :class:`DryRunMArraySlidingWindow` and :class:`DryRunMVariable`.
+
+    Attributes
+    ----------
+    __op_log : :class:`~typing.List`\0[:class:`dict`]
+        The logged operations, each with the name of the object (`obj`), the operation (`op`), its arguments (`args`) and its estimated run time (`run_time`).
+    __run_time : :class:`float`
+        The estimated run time of all logged operations.
+    __play_count : :class:`int`
+        The number of :py:meth:`Scene.play() <manim.scene.scene.Scene.play>` calls the logged operations would make.
+    __obj_count : :class:`int`
+        The number of registered objects.
+    __updaters : :class:`~typing.List`\0[:data:`~typing.Callable`\0[[], None]]
+        The functions called before each logged play or wait.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the class."""
+
+        self.__op_log: typing.List[dict] = []
+        self.__run_time: float = 0.0
+        self.__play_count: int = 0
+        self.__obj_count: int = 0
+        self.__updaters: typing.List[typing.Callable[[], None]] = []
+
+    def register(self, obj: typing.Any) -> str:
+        """Registers an object and names it for the operation log.
+
+        Parameters
+        ----------
+        obj
+            Specifies the object to register.
+
+        Returns
+        -------
+        :class:`str`
+            Name of the object, e.g. `DryRunMArray#0`.
+        """
+
+        name = "{}#{}".format(type(obj).__name__, self.__obj_count)
+        self.__obj_count += 1
+        return name
+
+    def add_updater(self, updater: typing.Callable[[], None]) -> None:
+        """Registers a function that is called before each logged play or wait, like the updaters manim calls on every frame.
+
+        Parameters
+        ----------
+        updater
+            Specifies the function to call, e.g. one that raises if a pointer is no longer attached to an element.
+        """
+
+        self.__updaters.append(updater)
+
+    def log_op(
+        self,
+        obj_name: str,
+        op: str,
+        args: dict = {},
+        run_times: typing.List[float] = [],
+    ) -> None:
+        """Logs an operation.
+
+        Parameters
+        ----------
+        obj_name
+            Specifies the name of the object the operation is performed on.
+        op
+            Specifies the name of the operation.
+        args
+            Specifies the arguments of the operation.
+        run_times
+            Specifies the run time of each :py:meth:`Scene.play() <manim.scene.scene.Scene.play>` the operation would make.
+        """
+
+        if len(run_times):
+            for updater in self.__updaters:
+                updater()
+
+        self.__op_log.append(
+            {"obj": obj_name, "op": op, "args": dict(args), "run_time": sum(run_times)}
+        )
+        self.__run_time += sum(run_times)
+        self.__play_count += len(run_times)
+
+    def play(self, *animations, run_time: float = DEFAULT_RUN_TIME, **kwargs) -> None:
+        """Logs a play call of the script itself.
+
+        Parameters
+        ----------
+        *animations
+            Ignored.
+        run_time
+            Specifies the run time of the play.
+        **kwargs
+            Ignored.
+        """
+
+        self.log_op("scene", "play", {}, [run_time])
+
+    def wait(self, duration: float = DEFAULT_RUN_TIME, **kwargs) -> None:
+        """Logs a wait call of the script itself.
+
+        Parameters
+        ----------
+        duration
+            Specifies the duration of the wait.
+        **kwargs
+            Ignored.
+        """
+
+        self.log_op("scene", "wait", {"duration": duration}, [duration])
+
+    def add(self, *mobjects) -> "DryRunScene":
+        """Does nothing, there are no mobjects to add.
+
+        Returns
+        -------
+        :class:`DryRunScene`
+            The scene itself.
+        """
+
+        return self
+
+    def remove(self, *mobjects) -> "DryRunScene":
+        """Does nothing, there are no mobjects to remove.
+
+        Returns
+        -------
+        :class:`DryRunScene`
+            The scene itself.
+        """
+
+        return self
+
+    def fetch_op_log(self) -> typing.List[dict]:
+        """Fetches the operation log.
+
+        Returns
+        -------
+        :class:`~typing.List`\0[:class:`dict`]
+            :attr:`__op_log`.
+        """
+
+        return self.__op_log
+
+    def fetch_run_time(self) -> float:
+        """Fetches the estimated run time of the logged operations.
+
+        Returns
+        -------
+        :class:`float`
+            :attr:`__run_time`.
+        """
+
+        return self.__run_time
+
+    def fetch_play_count(self) -> int:
+        """Fetches the number of plays the logged operations would make.
+
+        Returns
+        -------
+        :class:`int`
+            :attr:`__play_count`.
+        """
+
+        return self.__play_count
+
+
+class DryRunMArray:
+    """Logical counterpart of :class:`~.m_array.MArray` that validates operations and logs them to a :class:`DryRunScene`.
+
+    It accepts the arguments of :class:`~.m_array.MArray` (mobject arguments are ignored) and offers the same operations; animations are returned as `None`.
+
+    Parameters
+    ----------
+    scene
+        Specifies the scene where the operations are logged.
+    arr
+        Specifies the array to represent.
+    label
+        Specifies the value of the array label.
+    index_offset
+        Specifies the difference between successive displayable indices.
+    index_start
+        Specifies the starting value of displayable index.
+    index_hex_display
+        If `True`, displays indices in hex.
+    hide_index
+        If `True`, doesn't display indices.
+    arr_dir
+        Specifies the growth direction of the array.
+    **kwargs
+        Ignored, accepts the remaining arguments of :class:`~.m_array.MArray`.
+
+    Attributes
+    ----------
+    __scene : :class:`DryRunScene`
+        The scene where the operations are logged.
+    __name : :class:`str`
+        The name of the array in the operation log.
+    __arr : :class:`list`
+        The array to represent.
+    __indices : :class:`list`
+        The displayable indices of the elements.
+    __label : :class:`str`
+        The value of the array label.
+    __index_offset : :class:`int`
+        The difference between successive displayable indices.
+    __index_start : :class:`int`
+        The starting value of displayable index.
+    __index_hex_display : :class:`bool`
+        If `True`, displays indices in hex.
+    __hide_index : :class:`bool`
+        If `True`, doesn't display indices.
+    __arr_dir : :class:`~.m_enum.MArrayDirection`
+        The growth direction of the array.
+    __batch : :class:`~typing.List`\0[:class:`~typing.Tuple`\0[:class:`float`, :class:`set`]]
+        Run times and targets of the plays collected by :meth:`batch`; `None` outside of a batch.
+    """
+
+    def __calc_index(self, index: int) -> typing.Union[int, str]:
+        """Calculates the displayable index of the specified element.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the element for which to compute the displayable index.
+
+        Returns
+        -------
+        :data:`~typing.Union`\0[:class:`int`, :class:`str`]
+            Displayable index.
+        """
+
+        return (
+            ""
+            if self.__hide_index
+            else (
+                self.__index_start + self.__index_offset * index
+                if self.__index_hex_display is False
+                else hex(self.__index_start + self.__index_offset * index)
+            )
+        )
+
+    def __check_index(self, *indices: int) -> None:
+        """Raises if any of the specified indices is out of bounds.
+
+        Parameters
+        ----------
+        *indices
+            Specifies the indices to check.
+        """
+
+        for index in indices:
+            if index < 0 or index >= len(self.__arr):
+                raise Exception("Index out of bounds!")
+
+    def __play(
+        self,
+        op: str,
+        args: dict,
+        plays: typing.List[typing.Tuple[float, set]],
+        play_anim: bool,
+        play_anim_args: dict,
+    ) -> None:
+        """Logs an operation along with the plays it makes, or collects the plays if a :meth:`batch` is open.
+
+        Parameters
+        ----------
+        op
+            Specifies the name of the operation.
+        args
+            Specifies the arguments of the operation.
+        plays
+            Specifies the default run time and the targets of each play.
+        play_anim
+            If `False`, no plays are logged.
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`; only `run_time` is used.
+        """
+
+        if not play_anim:
+            plays = []
+
+        plays = [
+            (play_anim_args.get("run_time", run_time), targets)
+            for run_time, targets in plays
+        ]
+
+        if self.__batch is not None:
+            self.__batch.extend(plays)
+            plays = []
+
+        self.__scene.log_op(self.__name, op, args, [run_time for run_time, _ in plays])
+
+    def __init__(
+        self,
+        scene: DryRunScene,
+        arr: list = [],
+        label: str = "",
+        index_offset: int = 1,
+        index_start: int = 0,
+        index_hex_display: bool = False,
+        hide_index: bool = False,
+        arr_dir: MArrayDirection = MArrayDirection.RIGHT,
+        **kwargs
+    ) -> None:
+        """Initializes the class.
+
+        Parameters
+        ----------
+        scene
+            Specifies the scene where the operations are logged.
+        arr
+            Specifies the array to represent.
+        label
+            Specifies the value of the array label.
+        index_offset
+            Specifies the difference between successive displayable indices.
+        index_start
+            Specifies the starting value of displayable index.
+        index_hex_display
+            If `True`, displays indices in hex.
+        hide_index
+            If `True`, doesn't display indices.
+        arr_dir
+            Specifies the growth direction of the array.
+        **kwargs
+            Ignored, accepts the remaining arguments of :class:`~.m_array.MArray`.
+        """
+
+        self.__scene: DryRunScene = scene
+        self.__name: str = scene.register(self)
+        self.__arr: list = arr
+        self.__label: str = label
+        self.__index_offset: int = index_offset
+        self.__index_start: int = index_start
+        self.__index_hex_display: bool = index_hex_display
+        self.__hide_index: bool = hide_index
+        self.__arr_dir: MArrayDirection = arr_dir
+        self.__indices: list = [self.__calc_index(i) for i in range(len(arr))]
+        self.__batch: typing.List[typing.Tuple[float, set]] = None
+
+    @classmethod
+    def from_values(
+        cls, scene: DryRunScene, values: typing.Iterable, **kwargs
+    ) -> "DryRunMArray":
+        """Builds an array from any iterable of values.
+
+        Parameters
+        ----------
+        scene
+            Specifies the scene where the operations are logged.
+        values
+            Specifies the values of the array.
+        **kwargs
+            Forwarded to the constructor of :class:`DryRunMArray`.
+
+        Returns
+        -------
+        :class:`DryRunMArray`
+            The constructed array.
+        """
+
+        if hasattr(values, "tolist"):
+            values = values.tolist()
+
+        return cls(scene, list(values), **kwargs)
+
+    def fetch_name(self) -> str:
+        """Fetches the name of the array in the operation log.
+
+        Returns
+        -------
+        :class:`str`
+            :attr:`__name`.
+        """
+
+        return self.__name
+
+    def fetch_arr(self) -> list:
+        """Fetches the original array.
+
+        Returns
+        -------
+        :class:`list`
+            :attr:`__arr`.
+        """
+
+        return self.__arr
+
+    def fetch_indices(self) -> list:
+        """Fetches the displayable indices of the elements.
+
+        Returns
+        -------
+        :class:`list`
+            :attr:`__indices`.
+        """
+
+        return self.__indices
+
+    def fetch_label(self) -> str:
+        """Fetches the value of the array label.
+
+        Returns
+        -------
+        :class:`str`
+            :attr:`__label`.
+        """
+
+        return self.__label
+
+    def fetch_arr_dir(self) -> MArrayDirection:
+        """Fetches the growth direction enum of the array.
+
+        Returns
+        -------
+        :class:`~.m_enum.MArrayDirection`
+            :attr:`__arr_dir`.
+        """
+
+        return self.__arr_dir
+
+    @contextmanager
+    def batch(
+        self, run_time: float = None, play_anim_args: dict = {}
+    ) -> typing.Iterator["DryRunMArray"]:
+        """Collects the plays of the array's operations and logs them as one play on exit, see :meth:`.MArray.batch`.
+
+        The run time of the batch is estimated the way :meth:`.MArray.batch` groups animations: consecutive plays with disjoint targets run together.
+
+        Parameters
+        ----------
+        run_time
+            Specifies the total run time of the batch.
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`; only `run_time` is used.
+
+        Yields
+        ------
+        :class:`DryRunMArray`
+            The array itself.
+        """
+
+        if self.__batch is not None:
+            yield self
+            return
+
+        self.__batch = []
+        try:
+            yield self
+        except BaseException:
+            self.__batch = None
+            raise
+
+        plays, self.__batch = self.__batch, None
+        if not len(plays):
+            return
+
+        total_run_time = 0.0
+        group_run_time = 0.0
+        group_targets: set = set()
+        for play_run_time, targets in plays:
+            if not targets.isdisjoint(group_targets):
+                total_run_time += group_run_time
+                group_run_time = 0.0
+                group_targets = set()
+            group_run_time = max(group_run_time, play_run_time)
+            group_targets |= targets
+        total_run_time += group_run_time
+
+        if run_time is None:
+            run_time = play_anim_args.get("run_time", total_run_time)
+
+        self.__scene.log_op(self.__name, "batch", {"plays": len(plays)}, [run_time])
+
+    def update_elem_value(
+        self,
+        index: int,
+        value,
+        mob_value_args: dict = {},
+        update_anim=None,
+        update_anim_args: dict = {},
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> None:
+        """Updates the elements value.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of element whose value to update.
+        value
+            New value to be assigned to the element.
+        mob_value_args
+            Ignored.
+        update_anim
+            Ignored.
+        update_anim_args
+            Ignored.
+        play_anim
+            If `True`, logs the play.
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`; only `run_time` is used.
+        """
+
+        self.__check_index(index)
+
+        self.__arr[index] = value
+        self.__play(
+            "update_elem_value",
+            {"index": index, "value": value},
+            [(DEFAULT_RUN_TIME, {index})],
+            play_anim,
+            play_anim_args,
+        )
+
+    def update_elem_index(
+        self,
+        index: int,
+        value,
+        mob_index_args: dict = {},
+        update_anim=None,
+        update_anim_args: dict = {},
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> None:
+        """Updates the elements index.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of element whose index to update.
+        value
+            New value to be assigned to the index of the element.
+        mob_index_args
+            Ignored.
+        update_anim
+            Ignored.
+        update_anim_args
+            Ignored.
+        play_anim
+            If `True`, logs the play.
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`; only `run_time` is used.
+        """
+
+        self.__check_index(index)
+
+        self.__indices[index] = value
+        self.__play(
+            "update_elem_index",
+            {"index": index, "value": value},
+            [(DEFAULT_RUN_TIME, {index})],
+            play_anim,
+            play_anim_args,
+        )
+
+    def update_mob_arr_label(
+        self,
+        label: str,
+        mob_arr_label_args: dict = {},
+        update_anim=None,
+        update_anim_args: dict = {},
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> None:
+        """Updates the array label.
+
+        Parameters
+        ----------
+        label
+            New value to be assigned to the array label.
+        mob_arr_label_args
+            Ignored.
+        update_anim
+            Ignored.
+        update_anim_args
+            Ignored.
+        play_anim
+            If `True`, logs the play.
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`; only `run_time` is used.
+        """
+
+        self.__label = label
+        self.__play(
+            "update_mob_arr_label",
+            {"label": label},
+            [(DEFAULT_RUN_TIME, {"label"})],
+            play_anim,
+            play_anim_args,
+        )
+
+    def append_elem(
+        self,
+        value: typing.Any,
+        append_anim=None,
+        append_anim_args: dict = {},
+        append_anim_target: MArrayElementComp = None,
+        mob_elem_body_args: dict = {},
+        mob_elem_value_args: dict = {},
+        mob_elem_index_args: dict = {},
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> typing.List[None]:
+        """Appends a new element to the array.
+
+        Parameters
+        ----------
+        value
+            Specifies the value of the new element.
+        append_anim
+            Ignored.
+        append_anim_args
+            Ignored.
+        append_anim_target
+            Ignored.
+        mob_elem_body_args
+            Ignored.
+        mob_elem_value_args
+            Ignored.
+        mob_elem_index_args
+            Ignored.
+        play_anim
+            If `True`, logs the play.
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`; only `run_time` is used.
+
+        Returns
+        -------
+        :class:`~typing.List`\0[`None`]
+            Empty list in place of the append animations.
+        """
+
+        self.__arr.append(value)
+        self.__indices.append(self.__calc_index(len(self.__arr) - 1))
+        self.__play(
+            "append_elem",
+            {"value": value},
+            [(DEFAULT_RUN_TIME, {len(self.__arr) - 1, "label"})],
+            play_anim,
+            play_anim_args,
+        )
+
+        return []
+
+    def remove_elem(
+        self,
+        index: int,
+        removal_anim=None,
+        update_anim=None,
+        removal_anim_args: dict = {},
+        update_anim_args: dict = {},
+        removal_anim_target: MArrayElementComp = None,
+        update_anim_target: MArrayElementComp = MArrayElementComp.INDEX,
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+        reuse_index_mobs: bool = False,
+    ) -> typing.Tuple[None, typing.Callable[[bool], typing.List[None]]]:
+        """Removes the element from the array at the specified index.
+
+        The removal is estimated as a fade out followed by a shift of the following elements (two default run times) and a separate play that updates their indices.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the element to remove.
+        removal_anim
+            Ignored.
+        update_anim
+            Ignored.
+        removal_anim_args
+            Ignored.
+        update_anim_args
+            Ignored.
+        removal_anim_target
+            Ignored.
+        update_anim_target
+            Specifies the target of the index update; nothing is played for hidden indices.
+        play_anim
+            If `True`, logs the plays.
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`; only `run_time` is used.
+        reuse_index_mobs
+            Ignored.
+
+        Returns
+        -------
+        `None`
+            In place of the removal animation.
+        :data:`~typing.Callable`\0[[:class:`bool`], :class:`~typing.List`\0[`None`]]
+            Method that logs the index update play.
+        """
+
+        self.__check_index(index)
+
+        self.__arr = self.__arr[0:index] + self.__arr[index + 1 :]
+        del self.__indices[index]
+
+        def update_indices(
+            play_anim: bool = True, play_anim_args: dict = {}
+        ) -> typing.List[None]:
+            """Renumbers the elements that occur after the removal.
+
+            Parameters
+            ----------
+            play_anim : :class:`bool`, default: `True`
+                If `True`, logs the play.
+            play_anim_args : :class:`dict, default: `{}`
+                Arguments for :meth:`manim.Scene.play`.
+
+            Returns
+            -------
+            List[`None`]
+                Empty list in place of the update animations.
+            """
+
+            targets = set(range(index, len(self.__arr)))
+            for i in targets:
+                self.__indices[i] = self.__calc_index(i)
+
+            if self.__hide_index and update_anim_target == MArrayElementComp.INDEX:
+                targets = set()
+
+            self.__play(
+                "update_indices",
+                {"index": index},
+                [(DEFAULT_RUN_TIME, targets)] if len(targets) else [],
+                play_anim,
+                play_anim_args,
+            )
+
+            return []
+
+        self.__play(
+            "remove_elem",
+            {"index": index},
+            [(2 * DEFAULT_RUN_TIME, set(range(index, len(self.__arr) + 1)))],
+            play_anim,
+            play_anim_args,
+        )
+
+        if play_anim:
+            update_indices(play_anim_args=play_anim_args)
+
+        return (None, update_indices)
+
+    def swap_elems(
+        self,
+        index_1: int,
+        index_2: int,
+        swap_body: bool = False,
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> typing.Tuple[None, typing.Callable[[], None]]:
+        """Swap two elements of the array.
+
+        Parameters
+        ----------
+        index_1
+            Specifies the index of the first element to swap.
+        index_2
+            Specifies the index of the second element to swap.
+        swap_body
+            Ignored.
+        play_anim
+            If `True`, logs the play.
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`; only `run_time` is used.
+
+        Returns
+        -------
+        `None`
+            In place of the swap animation.
+        :data:`~typing.Callable`\0[`[]`, `None`]
+            Does nothing, the values are swapped immediately.
+        """
+
+        self.__check_index(index_1, index_2)
+
+        self.__arr[index_1], self.__arr[index_2] = (
+            self.__arr[index_2],
+            self.__arr[index_1],
+        )
+        self.__play(
+            "swap_elems",
+            {"index_1": index_1, "index_2": index_2},
+            [(DEFAULT_RUN_TIME, {index_1, index_2})],
+            play_anim,
+            play_anim_args,
+        )
+
+        return (None, lambda: None)
+
+    def apply_permutation(
+        self,
+        perm: typing.Iterable[int],
+        mode: MArrayPermutationMode = MArrayPermutationMode.SIMULTANEOUS,
+        swap_body: bool = False,
+        wave_size: int = 8,
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> typing.Tuple[None, typing.Callable[[], None]]:
+        """Reorders the array so that the element at index `perm[i]` moves to index `i`.
+
+        Parameters
+        ----------
+        perm
+            Specifies the permutation, containing each index of the array exactly once.
+        mode
+            Specifies whether the elements move at once or in staggered waves.
+        swap_body
+            Ignored.
+        wave_size
+            Specifies the number of neighbouring destinations per wave in :attr:`~.m_enum.MArrayPermutationMode.STAGGERED` mode.
+        play_anim
+            If `True`, logs the play.
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`; only `run_time` is used.
+
+        Returns
+        -------
+        `None`
+            In place of the permutation animation.
+        :data:`~typing.Callable`\0[`[]`, `None`]
+            Does nothing, the values are reordered immediately.
+        """
+
+        order = list(perm)
+        if sorted(order) != list(range(len(self.__arr))):
+            raise Exception("Invalid permutation!")
+
+        self.__arr = [self.__arr[i] for i in order]
+
+        # Elements are assumed to share their length, so fixed points don't move
+        targets = {i for i, j in enumerate(order) if i != j}
+        run_time = DEFAULT_RUN_TIME
+        if mode == MArrayPermutationMode.STAGGERED:
+            waves = len({i // max(wave_size, 1) for i in targets})
+            run_time *= 1 + 0.5 * max(waves - 1, 0)
+        self.__play(
+            "apply_permutation",
+            {"perm": order},
+            [(run_time, targets)],
+            play_anim,
+            play_anim_args,
+        )
+
+        return (None, lambda: None)
+
+    def morph_to(
+        self,
+        new_values: typing.Iterable,
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> None:
+        """Changes the array to the specified values, reusing the values kept by a diff.
+
+        Parameters
+        ----------
+        new_values
+            Specifies the values of the array after the change.
+        play_anim
+            If `True`, logs the play.
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`; only `run_time` is used.
+
+        Returns
+        -------
+        `None`
+            In place of the morph animation.
+        """
+
+        new_values = list(new_values)
+        old_keys = [str(value) for value in self.__arr]
+        new_keys = [str(value) for value in new_values]
+
+        # Every phase (fade out, move, fade in) with something to do takes a run time
+        targets = set()
+        phases = [False, False, False]
+        for tag, i1, i2, j1, j2 in SequenceMatcher(
+            None, old_keys, new_keys, autojunk=False
+        ).get_opcodes():
+            if tag == "equal":
+                if i1 != j1:
+                    targets |= set(range(j1, j2))
+                    phases[1] = True
+                continue
+            if i2 > i1:
+                phases[0] = True
+            if j2 > j1:
+                phases[2] = True
+            targets |= set(range(j1, j2))
+        if len(new_values) != len(self.__arr):
+            # The label follows the end of the array
+            targets.add("label")
+            phases[1] = True
+
+        self.__arr = new_values
+        self.__indices = self.__indices[: len(new_values)] + [
+            self.__calc_index(i) for i in range(len(self.__indices), len(new_values))
+        ]
+        run_time = DEFAULT_RUN_TIME * sum(phases)
+        self.__play(
+            "morph_to",
+            {"new_values": new_values},
+            [(run_time, targets)] if run_time else [],
+            play_anim,
+            play_anim_args,
+        )
+
+
+class DryRunMArrayPointer:
+    """Logical counterpart of :class:`~.m_array.MArrayPointer` attached to a :class:`DryRunMArray`.
+
+    Parameters
+    ----------
+    scene
+        Specifies the scene where the operations are logged.
+    arr
+        Specifies the array to which the pointer is to be attached.
+    index
+        Specifies the index of the element to which the pointer is to be attached.
+    label
+        Specifies the value of the pointer label.
+    **kwargs
+        Ignored, accepts the remaining arguments of :class:`~.m_array.MArrayPointer`.
+
+    Attributes
+    ----------
+    __scene : :class:`DryRunScene`
+        The scene where the operations are logged.
+    __name : :class:`str`
+        The name of the pointer in the operation log.
+    __arr : :class:`DryRunMArray`
+        The array to which the pointer is attached to.
+    __index : :class:`int`
+        The index of the element to which the pointer is attached to.
+    __label : :class:`str`
+        The value of the pointer label.
+    """
+
+    def __check_index(self, index: int) -> None:
+        """Raises if the specified index is out of bounds.
+
+        Parameters
+        ----------
+        index
+            Specifies the index to check.
+        """
+
+        if index < 0 or index >= len(self.__arr.fetch_arr()):
+            raise Exception("Index out of bounds!")
+
+    def __init__(
+        self,
+        scene: DryRunScene,
+        arr: DryRunMArray,
+        index: int = 0,
+        label: str = "",
+        **kwargs
+    ) -> None:
+        """Initializes the class.
+
+        Parameters
+        ----------
+        scene
+            Specifies the scene where the operations are logged.
+        arr
+            Specifies the array to which the pointer is to be attached.
+        index
+            Specifies the index of the element to which the pointer is to be attached.
+        label
+            Specifies the value of the pointer label.
+        **kwargs
+            Ignored, accepts the remaining arguments of :class:`~.m_array.MArrayPointer`.
+        """
+
+        self.__scene: DryRunScene = scene
+        self.__name: str = scene.register(self)
+        self.__arr: DryRunMArray = arr
+        self.__check_index(index)
+        self.__index: int = index
+        self.__label: str = label
+
+        # Like the position updater of the pointer, which fetches the attached element on every frame
+        self.__scene.add_updater(lambda: self.__check_index(self.__index))
+
+    def fetch_index(self) -> int:
+        """Fetches the index that the pointer is attached to.
+
+        Returns
+        -------
+        :class:`int`
+            :attr:`__index`.
+        """
+
+        return self.__index
+
+    def fetch_label(self) -> str:
+        """Fetches the value of the pointer label.
+
+        Returns
+        -------
+        :class:`str`
+            :attr:`__label`.
+        """
+
+        return self.__label
+
+    def update_mob_label(
+        self,
+        label: str,
+        mob_label_args: dict = {},
+        update_anim=None,
+        update_anim_args: dict = {},
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> None:
+        """Updates the pointer label.
+
+        Parameters
+        ----------
+        label
+            New value to be assigned to the pointer label.
+        mob_label_args
+            Ignored.
+        update_anim
+            Ignored.
+        update_anim_args
+            Ignored.
+        play_anim
+            If `True`, logs the play.
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`; only `run_time` is used.
+        """
+
+        self.__label = label
+        self.__scene.log_op(
+            self.__name,
+            "update_mob_label",
+            {"label": label},
+            [play_anim_args.get("run_time", DEFAULT_RUN_TIME)] if play_anim else [],
+        )
+
+    def shift_to_elem(
+        self, index: int, play_anim: bool = True, play_anim_args: dict = {}
+    ) -> None:
+        """Shifts pointer to the specified element.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the element to which the pointer is to be shifted.
+        play_anim
+            If `True`, logs the play.
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`; only `run_time` is used.
+        """
+
+        self.__check_index(index)
+
+        self.__index = index
+        self.__scene.log_op(
+            self.__name,
+            "shift_to_elem",
+            {"index": index},
+            [play_anim_args.get("run_time", DEFAULT_RUN_TIME)] if play_anim else [],
+        )
+
+    def attach_to_elem(self, index: int) -> None:
+        """Attaches pointer to the specified element.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the element to which the pointer is to be attached.
+        """
+
+        self.__check_index(index)
+
+        self.__index = index
+        self.__scene.log_op(self.__name, "attach_to_elem", {"index": index})
+
+
+class DryRunMArraySlidingWindow:
+    """Logical counterpart of :class:`~.m_array.MArraySlidingWindow` attached to a :class:`DryRunMArray`.
+
+    Parameters
+    ----------
+    scene
+        Specifies the scene where the operations are logged.
+    arr
+        Specifies the array to which the sliding window is to be attached.
+    index
+        Specifies the index of the element to which the sliding window is to be attached.
+    size
+        Specifies the number of elements the sliding window should enclose.
+    label
+        Specifies the value of the sliding window label.
+    **kwargs
+        Ignored, accepts the remaining arguments of :class:`~.m_array.MArraySlidingWindow`.
+
+    Attributes
+    ----------
+    __scene : :class:`DryRunScene`
+        The scene where the operations are logged.
+    __name : :class:`str`
+        The name of the sliding window in the operation log.
+    __arr : :class:`DryRunMArray`
+        The array to which the sliding window is attached to.
+    __index : :class:`int`
+        The index of the element to which the sliding window is attached to.
+    __size : :class:`int`
+        The number of elements the sliding window encloses.
+    __label : :class:`str`
+        The value of the sliding window label.
+    """
+
+    def __check_window(self, index: int, size: int) -> None:
+        """Raises if the specified window does not fit in the array.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the first enclosed element.
+        size
+            Specifies the number of enclosed elements.
+        """
+
+        if index >= len(self.__arr.fetch_arr()) or index < 0:
+            raise Exception("Index out of bounds!")
+
+        if size < 1 or index + size > len(self.__arr.fetch_arr()):
+            raise Exception("Invalid window size!")
+
+    def __init__(
+        self,
+        scene: DryRunScene,
+        arr: DryRunMArray,
+        index: int = 0,
+        size: int = 1,
+        label: str = "",
+        **kwargs
+    ) -> None:
+        """Initializes the class.
+
+        Parameters
+        ----------
+        scene
+            Specifies the scene where the operations are logged.
+        arr
+            Specifies the array to which the sliding window is to be attached.
+        index
+            Specifies the index of the element to which the sliding window is to be attached.
+        size
+            Specifies the number of elements the sliding window should enclose.
+        label
+            Specifies the value of the sliding window label.
+        **kwargs
+            Ignored, accepts the remaining arguments of :class:`~.m_array.MArraySlidingWindow`.
+        """
+
+        self.__scene: DryRunScene = scene
+        self.__name: str = scene.register(self)
+        self.__arr: DryRunMArray = arr
+        self.__check_window(index, size)
+        self.__index: int = index
+        self.__size: int = size
+        self.__label: str = label
+
+        # Like the position updater of the sliding window, which fetches the enclosed elements on every frame
+        self.__scene.add_updater(lambda: self.__check_window(self.__index, self.__size))
+
+    def fetch_index(self) -> int:
+        """Fetches the index of the first element enclosed by the sliding window.
+
+        Returns
+        -------
+        :class:`int`
+            :attr:`__index`.
+        """
+
+        return self.__index
+
+    def fetch_size(self) -> int:
+        """Fetches the number of elements enclosed by the sliding window.
+
+        Returns
+        -------
+        :class:`int`
+            :attr:`__size`.
+        """
+
+        return self.__size
+
+    def fetch_range(self) -> range:
+        """Fetches the indices enclosed by the sliding window.
+
+        Returns
+        -------
+        :class:`range`
+            Indices from :attr:`__index` to :attr:`__index` + :attr:`__size` (exclusive).
+        """
+
+        return range(self.__index, self.__index + self.__size)
+
+    def fetch_label(self) -> str:
+        """Fetches the value of the sliding window label.
+
+        Returns
+        -------
+        :class:`str`
+            :attr:`__label`.
+        """
+
+        return self.__label
+
+    def update_mob_label(
+        self,
+        label: str,
+        mob_label_args: dict = {},
+        update_anim=None,
+        update_anim_args: dict = {},
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> None:
+        """Updates the window label.
+
+        Parameters
+        ----------
+        label
+            New value to be assigned to the window label.
+        mob_label_args
+            Ignored.
+        update_anim
+            Ignored.
+        update_anim_args
+            Ignored.
+        play_anim
+            If `True`, logs the play.
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`; only `run_time` is used.
+        """
+
+        self.__label = label
+        self.__scene.log_op(
+            self.__name,
+            "update_mob_label",
+            {"label": label},
+            [play_anim_args.get("run_time", DEFAULT_RUN_TIME)] if play_anim else [],
+        )
+
+    def shift_to_elem(
+        self, index: int, play_anim: bool = True, play_anim_args: dict = {}
+    ) -> None:
+        """Shifts sliding window to the specified element.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the element to which the sliding window is to be shifted.
+        play_anim
+            If `True`, logs the play.
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`; only `run_time` is used.
+        """
+
+        self.__check_window(index, self.__size)
+
+        self.__index = index
+        self.__scene.log_op(
+            self.__name,
+            "shift_to_elem",
+            {"index": index},
+            [play_anim_args.get("run_time", DEFAULT_RUN_TIME)] if play_anim else [],
+        )
+
+    def attach_to_elem(self, index: int) -> None:
+        """Attaches sliding window to the specified element.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the element to which the sliding window is to be attached.
+        """
+
+        self.__check_window(index, self.__size)
+
+        self.__index = index
+        self.__scene.log_op(self.__name, "attach_to_elem", {"index": index})
+
+    def resize_window(
+        self, size: int, play_anim: bool = True, play_anim_args: dict = {}
+    ) -> None:
+        """Expands or shrinks the window according to the specified size.
+
+        Parameters
+        ----------
+        size
+            Specifies the number of elements the sliding window should enclose.
+        play_anim
+            If `True`, logs the play.
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`; only `run_time` is used.
+        """
+
+        self.__check_window(self.__index, size)
+
+        self.__size = size
+        self.__scene.log_op(
+            self.__name,
+            "resize_window",
+            {"size": size},
+            [play_anim_args.get("run_time", DEFAULT_RUN_TIME)] if play_anim else [],
+        )
+
+
+class DryRunMVariable:
+    """Logical counterpart of :class:`~.m_variable.MVariable`.
+
+    Parameters
+    ----------
+    scene
+        Specifies the scene where the operations are logged.
+    value
+        Specifies the value of the variable.
+    index
+        Specifies the index of the variable.
+    label
+        Specifies the label of the variable.
+    **kwargs
+        Ignored, accepts the remaining arguments of :class:`~.m_variable.MVariable`.
+
+    Attributes
+    ----------
+    __scene : :class:`DryRunScene`
+        The scene where the operations are logged.
+    __name : :class:`str`
+        The name of the variable in the operation log.
+    __value : typing.Any
+        The value of the variable.
+    __index : :data:`~typing.Union`\0[:class:`str`, :class:`int`]
+        The value of the index.
+    __label : :class:`str`
+        The value of the label.
+    """
+
+    def __init__(
+        self,
+        scene: DryRunScene,
+        value: typing.Any = "",
+        index: typing.Union[str, int] = "",
+        label: str = "",
+        **kwargs
+    ) -> None:
+        """Initializes the class.
+
+        Parameters
+        ----------
+        scene
+            Specifies the scene where the operations are logged.
+        value
+            Specifies the value of the variable.
+        index
+            Specifies the index of the variable.
+        label
+            Specifies the label of the variable.
+        **kwargs
+            Ignored, accepts the remaining arguments of :class:`~.m_variable.MVariable`.
+        """
+
+        self.__scene: DryRunScene = scene
+        self.__name: str = scene.register(self)
+        self.__value: typing.Any = value
+        self.__index: typing.Union[str, int] = index
+        self.__label: str = label
+
+    def __log_update(
+        self, op: str, args: dict, play_anim: bool, play_anim_args: dict
+    ) -> None:
+        """Logs an update of the variable.
+
+        Parameters
+        ----------
+        op
+            Specifies the name of the operation.
+        args
+            Specifies the arguments of the operation.
+        play_anim
+            If `True`, logs the play.
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`; only `run_time` is used.
+        """
+
+        self.__scene.log_op(
+            self.__name,
+            op,
+            args,
+            [play_anim_args.get("run_time", DEFAULT_RUN_TIME)] if play_anim else [],
+        )
+
+    def fetch_value(self) -> typing.Any:
+        """Fetches the value of the variable.
+
+        Returns
+        -------
+        typing.Any
+            :attr:`__value`.
+        """
+
+        return self.__value
+
+    def fetch_index(self) -> typing.Union[str, int]:
+        """Fetches the index of the variable.
+
+        Returns
+        -------
+        :data:`~typing.Union`\0[:class:`str`, :class:`int`]
+            :attr:`__index`.
+        """
+
+        return self.__index
+
+    def fetch_label(self) -> str:
+        """Fetches the label of the variable.
+
+        Returns
+        -------
+        :class:`str`
+            :attr:`__label`.
+        """
+
+        return self.__label
+
+    def update_value(
+        self,
+        value: typing.Any,
+        mob_value_args: dict = {},
+        update_anim=None,
+        update_anim_args: dict = {},
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> None:
+        """Updates the value of the variable.
+
+        Parameters
+        ----------
+        value
+            New value to be assigned to the variable.
+        mob_value_args
+            Ignored.
+        update_anim
+            Ignored.
+        update_anim_args
+            Ignored.
+        play_anim
+            If `True`, logs the play.
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`; only `run_time` is used.
+        """
+
+        self.__value = value
+        self.__log_update("update_value", {"value": value}, play_anim, play_anim_args)
+
+    def update_index(
+        self,
+        index: typing.Union[str, int],
+        mob_index_args: dict = {},
+        update_anim=None,
+        update_anim_args: dict = {},
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> None:
+        """Updates the index of the variable.
+
+        Parameters
+        ----------
+        index
+            New index to be assigned to the variable.
+        mob_index_args
+            Ignored.
+        update_anim
+            Ignored.
+        update_anim_args
+            Ignored.
+        play_anim
+            If `True`, logs the play.
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`; only `run_time` is used.
+        """
+
+        self.__index = index
+        self.__log_update("update_index", {"index": index}, play_anim, play_anim_args)
+
+    def update_label(
+        self,
+        label: str,
+        mob_label_args: dict = {},
+        update_anim=None,
+        update_anim_args: dict = {},
+        play_anim: bool = True,
+        play_anim_args: dict = {},
+    ) -> None:
+        """Updates the label of the variable.
+
+        Parameters
+        ----------
+        label
+            New label to be assigned to the variable.
+        mob_label_args
+            Ignored.
+        update_anim
+            Ignored.
+        update_anim_args
+            Ignored.
+        play_anim
+            If `True`, logs the play.
+        play_anim_args
+            Arguments for :py:meth:`Scene.play() <manim.scene.scene.Scene.play>`; only `run_time` is used.
+        """
+
+        self.__label = label
+        self.__log_update("update_label", {"label": label}, play_anim, play_anim_args)
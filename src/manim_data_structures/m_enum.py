@@ -33,3 +33,13 @@ class MArrayDirection(Enum):
 
     LEFT = 3
     """Leftward direction."""
+
+
+class MArrayPermutationMode(Enum):
+    """Serves as the way :meth:`~.m_array.MArray.apply_permutation` moves the elements."""
+
+    SIMULTANEOUS = 0
+    """All elements move at once."""
+
+    STAGGERED = 1
+    """Elements move in successive waves of neighbouring destinations."""
@@ -0,0 +1,549 @@
+"""Contains classes to record the operations of a scene as a JSON-lines trace and replay them."""
+
+import functools
+import json
+import typing
+from contextlib import ExitStack, contextmanager
+from enum import Enum
+
+import manim
+import numpy as np
+
+from . import m_enum
+from .m_dry_run import DryRunScene
+
+
+def traced(method: typing.Callable) -> typing.Callable:
+    """A decorator that records calls of the method while a :class:`TraceRecorder` is active.
+
+    Decorating `__init__` records the construction of the object. Calls made while another traced method runs (e.g. :meth:`~.m_array.MArraySlidingWindow.shift_to_elem` calling :meth:`~.m_array.MArraySlidingWindow.resize_window`) are not recorded.
+    Callbacks returned by the method (e.g. the one of :meth:`~.m_array.MArray.remove_elem`) record their invocations as well.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        recorder = TraceRecorder.fetch_active()
+        if recorder is None or recorder.is_nested():
+            return method(self, *args, **kwargs)
+
+        # Arguments are encoded up front since the methods update their dicts in place
+        record = recorder.encode_call(self, method.__name__, args, kwargs)
+
+        with recorder.nested():
+            result = method(self, *args, **kwargs)
+
+        recorder.write_call(self, record)
+        return recorder.trace_callbacks(record, result)
+
+    return wrapper
+
+
+def traced_context(method: typing.Callable) -> typing.Callable:
+    """A decorator for methods returning a context manager (e.g. :meth:`~.m_array.MArray.batch`) that records entering and exiting it."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        recorder = TraceRecorder.fetch_active()
+        if recorder is None or recorder.is_nested():
+            return method(self, *args, **kwargs)
+
+        return _TracedContext(
+            recorder,
+            self,
+            recorder.encode_call(self, method.__name__, args, kwargs),
+            method(self, *args, **kwargs),
+        )
+
+    return wrapper
+
+
+@contextmanager
+def _open_trace(
+    file: typing.Union[str, typing.TextIO], mode: str
+) -> typing.Iterator[typing.TextIO]:
+    """Opens the trace file at the specified path, or yields the specified text stream as is (without closing it)."""
+
+    if not isinstance(file, str):
+        yield file
+        return
+
+    with open(file, mode) as stream:
+        yield stream
+
+
+class _TracedContext:
+    """Records entering and exiting the wrapped context manager."""
+
+    def __init__(
+        self,
+        recorder: "TraceRecorder",
+        obj: typing.Any,
+        record: dict,
+        context: typing.ContextManager,
+    ) -> None:
+        self.__recorder = recorder
+        self.__obj = obj
+        self.__record = record
+        self.__context = context
+
+    def __enter__(self) -> typing.Any:
+        result = self.__context.__enter__()
+        self.__recorder.write_call(self.__obj, self.__record)
+        return result
+
+    def __exit__(self, *exc_info) -> typing.Optional[bool]:
+        suppress = self.__context.__exit__(*exc_info)
+        self.__recorder.write_call(self.__obj, {"t": "exit", "id": self.__record["id"]})
+        return suppress
+
+
+class TraceRecorder:
+    """Records the operations of :class:`~.m_array.MArray`, :class:`~.m_array.MArrayPointer`, :class:`~.m_array.MArraySlidingWindow` and :class:`~.m_variable.MVariable` as a JSON-lines trace.
+
+    Each line is one record:
+
+    - `{"t": "new", "id": ..., "cls": ..., "args": [...], "kwargs": {...}}` for a constructed object,
+    - `{"t": "op", "id": ..., "op": ..., "call": ..., "args": [...], "kwargs": {...}}` for the `call`-th call of one of its operations,
+    - `{"t": "callback", "call": ..., "index": ..., "args": [...], "kwargs": {...}}` for an invocation of the callback at `index` in the result of that call (e.g. the `update_indices` of :meth:`~.m_array.MArray.remove_elem` with `play_anim=False`),
+    - `{"t": "exit", "id": ...}` when the context of an operation (e.g. :meth:`~.m_array.MArray.batch`) is exited.
+
+    Only the operations and the callbacks they return are recorded; animations the script plays itself from returned values, :py:meth:`Scene.add() <manim.scene.scene.Scene.add>` and :py:meth:`Scene.wait() <manim.scene.scene.Scene.wait>` are not. Objects must be constructed while the recorder is active.
+
+    Parameters
+    ----------
+    file
+        Specifies the path or the text stream to write the trace to.
+
+    Attributes
+    ----------
+    __file : :data:`~typing.Union`\0[:class:`str`, :class:`~typing.TextIO`]
+        The path or the text stream to write the trace to.
+    __stream : :class:`~typing.TextIO`
+        The stream being written to while the recorder is active.
+    __files : :class:`~contextlib.ExitStack`
+        Closes :attr:`__stream` when the recorder exits, if it opened it.
+    __obj_ids : :class:`dict`
+        Maps `id()` of the recorded objects to their ids in the trace.
+    __objs : :class:`list`
+        The recorded objects, kept alive so their `id()`\0s are not reused.
+    __depth : :class:`int`
+        The number of traced methods (and callbacks) currently running.
+    __call_count : :class:`int`
+        The number of operation calls written so far.
+
+    Examples
+    --------
+    ::
+
+        with TraceRecorder("quicksort.jsonl"):
+            arr = MArray(self, [3, 1, 2])
+            arr.swap_elems(0, 1)
+    """
+
+    __active: "TraceRecorder" = None
+    """The recorder that traced methods currently report to."""
+
+    def __init__(self, file: typing.Union[str, typing.TextIO]) -> None:
+        """Initializes the class.
+
+        Parameters
+        ----------
+        file
+            Specifies the path or the text stream to write the trace to.
+        """
+
+        self.__file: typing.Union[str, typing.TextIO] = file
+        self.__stream: typing.TextIO = None
+        self.__files: ExitStack = None
+        self.__obj_ids: dict = {}
+        self.__objs: list = []
+        self.__depth: int = 0
+        self.__call_count: int = 0
+
+    def __enter__(self) -> "TraceRecorder":
+        if TraceRecorder.__active is not None:
+            raise Exception("Another trace is already being recorded!")
+
+        self.__files = ExitStack()
+        self.__stream = self.__files.enter_context(_open_trace(self.__file, "w"))
+        TraceRecorder.__active = self
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        TraceRecorder.__active = None
+        self.__files.close()
+        self.__files = None
+        self.__stream = None
+
+    @classmethod
+    def fetch_active(cls) -> typing.Optional["TraceRecorder"]:
+        """Fetches the active recorder.
+
+        Returns
+        -------
+        :class:`TraceRecorder`
+            :attr:`__active`, `None` if no trace is being recorded.
+        """
+
+        return cls.__active
+
+    def is_nested(self) -> bool:
+        """Checks whether a traced method (or callback) is running, so calls it makes aren't recorded.
+
+        Returns
+        -------
+        :class:`bool`
+            `True` if :attr:`__depth` is greater than `0`.
+        """
+
+        return self.__depth > 0
+
+    @contextmanager
+    def nested(self) -> typing.Iterator[None]:
+        """Marks a traced method (or callback) as running for the duration of the context."""
+
+        self.__depth += 1
+        try:
+            yield
+        finally:
+            self.__depth -= 1
+
+    def __encode(self, value: typing.Any) -> typing.Any:
+        """Encodes an argument into a JSON serializable value.
+
+        Parameters
+        ----------
+        value
+            Specifies the argument to encode.
+
+        Returns
+        -------
+        :data:`~typing.Any`
+            The encoded argument.
+        """
+
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        if isinstance(value, (list, tuple)):
+            return [self.__encode(v) for v in value]
+        if isinstance(value, dict):
+            return {
+                "$dict": [
+                    [self.__encode(k), self.__encode(v)] for k, v in value.items()
+                ]
+            }
+        if isinstance(value, np.ndarray):
+            return {"$nd": value.tolist()}
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, Enum):
+            return {"$enum": "{}.{}".format(type(value).__name__, value.name)}
+        if isinstance(value, (manim.Scene, DryRunScene)):
+            return {"$scene": True}
+        if id(value) in self.__obj_ids:
+            return {"$ref": self.__obj_ids[id(value)]}
+        if hasattr(value, "to_hex"):
+            return {"$color": value.to_hex()}
+        if getattr(manim, getattr(value, "__name__", ""), None) is value:
+            return {"$manim": value.__name__}
+
+        raise TypeError("Cannot encode {!r} in a trace!".format(value))
+
+    def encode_call(
+        self, obj: typing.Any, name: str, args: tuple, kwargs: dict
+    ) -> dict:
+        """Encodes a call of a traced method.
+
+        Parameters
+        ----------
+        obj
+            Specifies the object the method is called on.
+        name
+            Specifies the name of the method.
+        args
+            Specifies the positional arguments.
+        kwargs
+            Specifies the keyword arguments.
+
+        Returns
+        -------
+        :class:`dict`
+            The record of the call; `id` is `None` for an object under construction.
+        """
+
+        record = (
+            {"t": "new", "id": None, "cls": type(obj).__name__}
+            if name == "__init__"
+            else {"t": "op", "id": self.__obj_ids.get(id(obj)), "op": name}
+        )
+        if record["t"] == "op" and record["id"] is None:
+            raise Exception(
+                "{} was constructed before the trace started!".format(
+                    type(obj).__name__
+                )
+            )
+
+        record["args"] = [self.__encode(v) for v in args]
+        record["kwargs"] = {k: self.__encode(v) for k, v in kwargs.items()}
+
+        return record
+
+    def write_call(self, obj: typing.Any, record: dict) -> None:
+        """Writes the record of a call, registering the object if it was constructed and numbering the call of an operation.
+
+        Parameters
+        ----------
+        obj
+            Specifies the object the method was called on.
+        record
+            Specifies the record of the call.
+        """
+
+        if record["t"] == "new":
+            record["id"] = len(self.__objs)
+            self.__obj_ids[id(obj)] = record["id"]
+            self.__objs.append(obj)
+        elif record["t"] == "op":
+            record["call"] = self.__call_count
+            self.__call_count += 1
+
+        self.__stream.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def trace_callbacks(self, record: dict, result: typing.Any) -> typing.Any:
+        """Wraps the callbacks in the result of a recorded call so that their invocations are recorded too.
+
+        Parameters
+        ----------
+        record
+            Specifies the written record of the call.
+        result
+            Specifies the result of the call.
+
+        Returns
+        -------
+        :data:`~typing.Any`
+            The result, with every callable item of a tuple result wrapped.
+        """
+
+        if record["t"] != "op" or not isinstance(result, tuple):
+            return result
+
+        def wrap(index: int, callback: typing.Callable) -> typing.Callable:
+            @functools.wraps(callback)
+            def traced_callback(*args, **kwargs):
+                if TraceRecorder.fetch_active() is not self or self.is_nested():
+                    return callback(*args, **kwargs)
+
+                callback_record = {
+                    "t": "callback",
+                    "call": record["call"],
+                    "index": index,
+                    "args": [self.__encode(v) for v in args],
+                    "kwargs": {k: self.__encode(v) for k, v in kwargs.items()},
+                }
+                with self.nested():
+                    callback_result = callback(*args, **kwargs)
+                self.write_call(None, callback_record)
+                return callback_result
+
+            return traced_callback
+
+        return tuple(
+            wrap(i, item) if callable(item) else item for i, item in enumerate(result)
+        )
+
+
+class TraceReplayer:
+    """Re-drives a scene from a trace written by :class:`TraceRecorder`.
+
+    Parameters
+    ----------
+    scene
+        Specifies the scene to replay the trace in.
+    classes
+        Maps the class names of the trace to the classes to construct. Defaults to the dry-run classes of :mod:`.m_dry_run` for a :class:`~.m_dry_run.DryRunScene` and to the rendering classes otherwise.
+    add_objects
+        If `True`, adds every constructed object to the scene.
+
+    Attributes
+    ----------
+    __scene : :class:`~manim.scene.scene.Scene`
+        The scene to replay the trace in.
+    __classes : :class:`dict`
+        Maps the class names of the trace to the classes to construct.
+    __add_objects : :class:`bool`
+        If `True`, adds every constructed object to the scene.
+    __objs : :class:`list`
+        The objects constructed so far, indexed by their ids in the trace.
+    """
+
+    def __init__(
+        self,
+        scene: typing.Union[manim.Scene, DryRunScene],
+        classes: typing.Dict[str, type] = None,
+        add_objects: bool = True,
+    ) -> None:
+        """Initializes the class.
+
+        Parameters
+        ----------
+        scene
+            Specifies the scene to replay the trace in.
+        classes
+            Maps the class names of the trace to the classes to construct.
+        add_objects
+            If `True`, adds every constructed object to the scene.
+        """
+
+        if classes is None:
+            if isinstance(scene, DryRunScene):
+                from . import m_dry_run as module
+
+                classes = {
+                    "MArray": module.DryRunMArray,
+                    "MArrayPointer": module.DryRunMArrayPointer,
+                    "MArraySlidingWindow": module.DryRunMArraySlidingWindow,
+                    "MVariable": module.DryRunMVariable,
+                }
+            else:
+                from .m_array import MArray, MArrayPointer, MArraySlidingWindow
+                from .m_variable import MVariable
+
+                classes = {
+                    "MArray": MArray,
+                    "MArrayPointer": MArrayPointer,
+                    "MArraySlidingWindow": MArraySlidingWindow,
+                    "MVariable": MVariable,
+                }
+
+        self.__scene: typing.Union[manim.Scene, DryRunScene] = scene
+        self.__classes: typing.Dict[str, type] = classes
+        self.__add_objects: bool = add_objects
+        self.__objs: list = []
+
+    def __decode(self, value: typing.Any) -> typing.Any:
+        """Decodes an argument encoded by :class:`TraceRecorder`.
+
+        Parameters
+        ----------
+        value
+            Specifies the encoded argument.
+
+        Returns
+        -------
+        :data:`~typing.Any`
+            The decoded argument.
+        """
+
+        if isinstance(value, list):
+            return [self.__decode(v) for v in value]
+        if not isinstance(value, dict):
+            return value
+
+        if "$dict" in value:
+            return {self.__decode(k): self.__decode(v) for k, v in value["$dict"]}
+        if "$nd" in value:
+            return np.array(value["$nd"])
+        if "$enum" in value:
+            enum_name, member_name = value["$enum"].split(".")
+            return getattr(getattr(m_enum, enum_name), member_name)
+        if "$scene" in value:
+            return self.__scene
+        if "$ref" in value:
+            return self.__objs[value["$ref"]]
+        if "$color" in value:
+            return getattr(manim, "ManimColor", str)(value["$color"])
+        if "$manim" in value:
+            return getattr(manim, value["$manim"])
+
+        raise TypeError("Cannot decode {!r} from a trace!".format(value))
+
+    def fetch_objs(self) -> list:
+        """Fetches the objects constructed so far.
+
+        Returns
+        -------
+        :class:`list`
+            :attr:`__objs`, indexed by their ids in the trace.
+        """
+
+        return self.__objs
+
+    def replay(self, file: typing.Union[str, typing.TextIO]) -> list:
+        """Replays a trace.
+
+        Parameters
+        ----------
+        file
+            Specifies the path or the text stream to read the trace from.
+
+        Returns
+        -------
+        :class:`list`
+            The constructed objects, indexed by their ids in the trace.
+        """
+
+        with _open_trace(file, "r") as stream:
+            contexts: typing.List[ExitStack] = []
+            results: list = []
+            for line in stream:
+                if not line.strip():
+                    continue
+
+                record = json.loads(line)
+                if record["t"] == "exit":
+                    contexts.pop().close()
+                    continue
+
+                args = self.__decode(record["args"])
+                kwargs = {k: self.__decode(v) for k, v in record["kwargs"].items()}
+
+                if record["t"] == "new":
+                    obj = self.__classes[record["cls"]](*args, **kwargs)
+                    self.__objs.append(obj)
+                    if self.__add_objects:
+                        self.__scene.add(obj)
+                    continue
+
+                if record["t"] == "callback":
+                    results[record["call"]][record["index"]](*args, **kwargs)
+                    continue
+
+                result = getattr(self.__objs[record["id"]], record["op"])(
+                    *args, **kwargs
+                )
+                results.append(result)
+                if hasattr(result, "__enter__") and hasattr(result, "__exit__"):
+                    context = ExitStack()
+                    context.enter_context(result)
+                    contexts.append(context)
+
+            for context in reversed(contexts):
+                context.close()
+
+        return self.__objs
+
+
+def replay_trace(
+    scene: typing.Union[manim.Scene, DryRunScene],
+    file: typing.Union[str, typing.TextIO],
+    **kwargs
+) -> list:
+    """Replays a trace in the scene, see :class:`TraceReplayer`.
+
+    Parameters
+    ----------
+    scene
+        Specifies the scene to replay the trace in.
+    file
+        Specifies the path or the text stream to read the trace from.
+    **kwargs
+        Forwarded to the constructor of :class:`TraceReplayer`.
+
+    Returns
+    -------
+    :class:`list`
+        The constructed objects, indexed by their ids in the trace.
+    """
+
+    return TraceReplayer(scene, **kwargs).replay(file)
@@ -4,6 +4,10 @@ from manim import *
 
 import typing
 from .m_array import MArrayElement
+from .m_trace import traced
+
+# Keeps the star import of the package from re-exporting manim's own `utils`
+__all__ = ["MVariable"]
 
 
 class MVariable(MArrayElement):
@@ -40,6 +44,7 @@ class MVariable(MArrayElement):
         The value of the label.
     """
 
+    @traced
     def __init__(
         self,
         scene: Scene,
@@ -126,6 +131,7 @@ class MVariable(MArrayElement):
 
         return self.__label
 
+    @traced
     def update_value(
         self,
         value: typing.Any,
@@ -164,6 +170,7 @@ class MVariable(MArrayElement):
             mob_value_args, update_anim, update_anim_args, play_anim, play_anim_args
         )
 
+    @traced
     def update_index(
         self,
         index: typing.Union[str, int],
@@ -202,6 +209,7 @@ class MVariable(MArrayElement):
             mob_index_args, update_anim, update_anim_args, play_anim, play_anim_args
         )
 
+    @traced
     def update_label(
         self,
         label: str,
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import bisect
 import copy
 import sys
+from contextlib import contextmanager
+from difflib import SequenceMatcher
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Generic,
     Iterable,
+    Iterator,
     SupportsIndex,
     TypeVar,
     Union,
@@ -21,7 +25,18 @@ else:
     Self = Any
     SupportsRichComparison = Any
 
-from manim import ORIGIN, RIGHT, Integer, Mobject, Square, VMobject
+from manim import (
+    DEFAULT_MOBJECT_TO_MOBJECT_BUFFER,
+    ORIGIN,
+    RIGHT,
+    Integer,
+    Mobject,
+    Square,
+    VMobject,
+)
+
+from .m_animation import TranslateMobjects
+from .utils import FenwickTree, LRUCache, freeze
 
 _V = TypeVar("_V")
 _D = TypeVar("_D", bound=Mobject)
@@ -29,19 +44,334 @@ _C = TypeVar("_C", bound=Mobject)
 _Delimiter = TypeVar("_Delimiter", bound=Mobject)
 
 
+def _index_of(
+    __values: list | np.ndarray,
+    __value: Any,
+    __start: int = 0,
+    __stop: int = sys.maxsize,
+) -> int:
+    """Finds the first index of a value in a list or a 1-D array, like list.index.
+
+    Parameters
+    ----------
+    __values : list | np.ndarray
+        the values to search
+    __value : Any
+        the value to search for
+    __start : int, optional
+        the index to start searching from, by default 0
+    __stop : int, optional
+        the index to stop searching at, by default sys.maxsize
+
+    Returns
+    -------
+    int
+        the index of __value if it is present (ValueError otherwise)
+    """
+    if not isinstance(__values, np.ndarray):
+        return __values.index(__value, __start, __stop)
+
+    start, stop, _ = slice(__start, __stop).indices(len(__values))
+    matches = np.flatnonzero(__values[start:stop] == __value)
+    if len(matches) == 0:
+        raise ValueError(f"{__value!r} is not in LinearCollection")
+    return start + int(matches[0])
+
+
+def _count_of(__values: list | np.ndarray, __value: Any) -> int:
+    """Counts the instances of a value in a list or a 1-D array, like list.count.
+
+    Parameters
+    ----------
+    __values : list | np.ndarray
+        the values to search
+    __value : Any
+        the value to count
+
+    Returns
+    -------
+    int
+        the number of times __value occurred
+    """
+    if not isinstance(__values, np.ndarray):
+        return __values.count(__value)
+    return int(np.count_nonzero(__values == __value))
+
+
+class _PositionIndex:
+    """Maps each hashable value of a LinearCollection to its sorted positions.
+
+    Every value holds a slot, numbered in the order of the values when the index was
+    last rebuilt and handed out in order to appended values. Deleting a value only
+    marks its slot dead in a FenwickTree over the slots, so the position of a live
+    slot is the number of live slots before it and deletions anywhere keep the index
+    valid. Inserting anywhere but the end has no slot to take, so from then on the
+    positions are only trusted below self.__valid_to: the rest are looked up with a
+    scan of the values from self.__valid_to onwards until the index is rebuilt.
+    """
+
+    __slots_of: dict[Any, list[int]]
+    __live: FenwickTree
+    __dead: int
+    __counts: dict[Any, int]
+    __unhashable: int
+    __valid_to: int
+    __shifted: bool
+    __scanned: bool
+
+    def __init__(self, __values: list = ()):
+        """Constructs a new _PositionIndex.
+
+        Parameters
+        ----------
+        __values : list, optional
+            the values to index, by default ()
+        """
+        self.rebuild(__values)
+
+    @staticmethod
+    def __is_hashable(__value: Any) -> bool:
+        try:
+            hash(__value)
+            return True
+        except TypeError:
+            return False
+
+    def __count(self, __value: Any, __delta: int) -> None:
+        if not self.__is_hashable(__value):
+            self.__unhashable += __delta
+            return
+        count = self.__counts.get(__value, 0) + __delta
+        if count:
+            self.__counts[__value] = count
+        else:
+            del self.__counts[__value]
+
+    def __invalidate(self, __index: int) -> None:
+        self.__valid_to = min(self.__valid_to, __index)
+        self.__shifted = True
+        self.__scanned = False
+
+    def __slot_at(self, __index: int) -> int:
+        # The live slot with __index live slots before it
+        return self.__live.search_prefix_sum(__index)
+
+    def __position_of(self, __slot: int) -> int:
+        return int(self.__live.prefix_sum(__slot))
+
+    def __unlink(self, __value: Any, __slot: int) -> None:
+        if not self.__is_hashable(__value):
+            return
+        slots = self.__slots_of[__value]
+        del slots[bisect.bisect_left(slots, __slot)]
+        if not slots:
+            del self.__slots_of[__value]
+
+    def __link(self, __value: Any, __slot: int) -> None:
+        if self.__is_hashable(__value):
+            bisect.insort(self.__slots_of.setdefault(__value, []), __slot)
+
+    def __compact(self) -> None:
+        # Renumbers the live slots in order, dropping the dead ones
+        renumbered = {}
+        for slot, live in enumerate(self.__live.fetch_values()):
+            if live:
+                renumbered[slot] = len(renumbered)
+        for slots in self.__slots_of.values():
+            slots[:] = [renumbered[slot] for slot in slots]
+        self.__live.rebuild([1] * len(renumbered))
+        self.__dead = 0
+
+    def rebuild(self, __values: list | np.ndarray) -> None:
+        """Indexes the values from scratch.
+
+        Parameters
+        ----------
+        __values : list | np.ndarray
+            the values to index
+        """
+        self.__slots_of = {}
+        self.__counts = {}
+        self.__unhashable = 0
+        for i, value in enumerate(__values):
+            if self.__is_hashable(value):
+                self.__slots_of.setdefault(value, []).append(i)
+                self.__counts[value] = self.__counts.get(value, 0) + 1
+            else:
+                self.__unhashable += 1
+        self.__live = FenwickTree([1] * len(__values))
+        self.__dead = 0
+        self.__valid_to = len(__values)
+        self.__shifted = False
+        self.__scanned = False
+
+    def copy(self) -> _PositionIndex:
+        """Copies the index.
+
+        Returns
+        -------
+        _PositionIndex
+            an independent index with the same entries
+        """
+        index_copy = copy.copy(self)
+        index_copy.__slots_of = {
+            value: slots.copy() for value, slots in self.__slots_of.items()
+        }
+        index_copy.__live = FenwickTree(self.__live.fetch_values())
+        index_copy.__counts = self.__counts.copy()
+        return index_copy
+
+    def insert(self, __index: int, __value: Any, __length: int) -> None:
+        """Records a value inserted at a (non-negative) index.
+
+        Parameters
+        ----------
+        __index : int
+            the index the value was inserted at
+        __value : Any
+            the inserted value
+        __length : int
+            the number of values before the insertion
+        """
+        self.__count(__value, 1)
+        if not self.__shifted and __index == __length:
+            slot = len(self.__live)
+            self.__live.append(1)
+            self.__link(__value, slot)
+            self.__valid_to += 1
+        else:
+            self.__invalidate(__index)
+
+    def delete(self, __index: int, __value: Any, __length: int) -> None:
+        """Records the value deleted from a (non-negative) index.
+
+        Parameters
+        ----------
+        __index : int
+            the index the value was deleted from
+        __value : Any
+            the deleted value
+        __length : int
+            the number of values before the deletion
+        """
+        self.__count(__value, -1)
+        if __index >= self.__valid_to:
+            # Past the trusted positions, whose slots are stale already
+            return
+
+        slot = self.__slot_at(__index)
+        self.__unlink(__value, slot)
+        self.__valid_to -= 1
+        if slot == len(self.__live) - 1:
+            self.__live.delete(slot)
+        else:
+            self.__live.update(slot, 0)
+            self.__dead += 1
+            if self.__dead > len(self.__live) // 2:
+                self.__compact()
+
+    def replace(self, __index: int, __old: Any, __new: Any) -> None:
+        """Records the value at a (non-negative) index being replaced.
+
+        Parameters
+        ----------
+        __index : int
+            the index of the value
+        __old : Any
+            the replaced value
+        __new : Any
+            the new value
+        """
+        self.__count(__old, -1)
+        self.__count(__new, 1)
+        if __index >= self.__valid_to:
+            return
+
+        slot = self.__slot_at(__index)
+        self.__unlink(__old, slot)
+        self.__link(__new, slot)
+
+    def find(
+        self, __values: list | np.ndarray, __value: Any, __start: int, __stop: int
+    ) -> int:
+        """Finds the first index of a value within [__start, __stop).
+
+        Parameters
+        ----------
+        __values : list | np.ndarray
+            the indexed values
+        __value : Any
+            the value to search for
+        __start : int
+            the index to start searching from
+        __stop : int
+            the index to stop searching at
+
+        Returns
+        -------
+        int
+            the index of __value if it is present (ValueError otherwise)
+        """
+        if self.__unhashable or not self.__is_hashable(__value):
+            return _index_of(__values, __value, __start, __stop)
+        if __value not in self.__counts:
+            raise ValueError(f"{__value!r} is not in LinearCollection")
+
+        start, stop, _ = slice(__start, __stop).indices(len(__values))
+        if self.__valid_to < min(stop, len(__values)) and self.__scanned:
+            # Repeated lookups on an unchanged collection: pay for one rebuild
+            self.rebuild(__values)
+
+        if start < self.__valid_to:
+            slots = self.__slots_of.get(__value, [])
+            i = bisect.bisect_left(slots, self.__slot_at(start))
+            if i < len(slots):
+                position = self.__position_of(slots[i])
+                if position < min(stop, self.__valid_to):
+                    return position
+        if self.__valid_to < stop:
+            self.__scanned = True
+            return _index_of(__values, __value, max(start, self.__valid_to), stop)
+        raise ValueError(f"{__value!r} is not in LinearCollection")
+
+    def count(self, __values: list | np.ndarray, __value: Any) -> int:
+        """Counts the number of instances of a value.
+
+        Parameters
+        ----------
+        __values : list | np.ndarray
+            the indexed values
+        __value : Any
+            the value to count
+
+        Returns
+        -------
+        int
+            the number of times __value occurred
+        """
+        if self.__unhashable or not self.__is_hashable(__value):
+            return _count_of(__values, __value)
+        return self.__counts.get(__value, 0)
+
+
 class LinearCollection(
     VMobject,
     Generic[_V, _D, _C, _Delimiter],
 ):
 
-    __values: list[_V]
+    __values: list[_V] | np.ndarray
     __datas: list[_D]
     __containers: list[_C]
     __data_constructor: Callable[[_V], _D]
+    __data_memo: LRUCache
     __container_constructor: Callable[[], _C]
     __delimiter: _Delimiter
     __arrangement: dict
-    __rearrange: bool
+    __rearrange_from: int
+    __layout_depth: int
+    __extents: list[np.ndarray]
+    __arranged_with: Any
+    __position_index: _PositionIndex | None
 
     def __init__(
         self,
@@ -51,6 +381,8 @@ class LinearCollection(
         __delimiter: _Delimiter = None,
         __arrangement={"direction": RIGHT, "buff": 0.0},
         *args,
+        position_index: bool = False,
+        data_memo_size: int = 0,
         **kwargs,
     ):
         """Constructs a new LinearCollection.
@@ -58,7 +390,10 @@ class LinearCollection(
         Parameters
         ----------
         __values : Iterable[_V], optional
-            the iterable of values to convert, by default ()
+            the iterable of values to convert, by default (). A 1-D np.ndarray is used
+            as the backing store without copying it: set_values, apply and item
+            assignment write into it, while inserting or deleting values reallocates it
+            (casting new values to its dtype)
         __data_constructor : Callable[[_V], _D], optional
             a callable that converts values to an Mobject representation, by default Integer
         __container_constructor : Callable[[], _C], optional
@@ -67,6 +402,12 @@ class LinearCollection(
             an optional delimiter that is placed between containers, by default None
         __arrangement : dict, optional
             a dict of kwargs that is passed to self.arrange, by default {"direction": RIGHT, "buff": 0.0}
+        position_index : bool, optional
+            whether to keep a map of each hashable value to its positions, making index,
+            count and remove avoid a linear scan, by default False
+        data_memo_size : int, optional
+            the number of data mobjects to memoize by value, handing out copies of them
+            instead of calling the data constructor again, by default 0 (disabled)
         """
         super().__init__(*args, **kwargs)
 
@@ -74,32 +415,223 @@ class LinearCollection(
         self.__datas = []
         self.__containers = []
         self.__data_constructor = __data_constructor
+        self.__data_memo = LRUCache(data_memo_size)
         self.__container_constructor = lambda data: __container_constructor().add(
             data.move_to(ORIGIN)
         )
         self.__delimiter = __delimiter
         self.__arrangement = __arrangement
-        self.__rearrange = False
+        self.__rearrange_from = sys.maxsize
+        self.__layout_depth = 0
+        self.__extents = []
+        self.__arranged_with = None
+        self.__position_index = _PositionIndex() if position_index else None
+
+        if isinstance(__values, np.ndarray):
+            self.__values = __values
+            if self.__position_index is not None:
+                self.__position_index.rebuild(__values)
+            self.__append_mobs(list(__values))
+        else:
+            self.extend(__values)
+
+    def __construct_data(self, __value: _V) -> _D:
+        """Constructs the data of a value, copying a memoized prototype when enabled.
+
+        Parameters
+        ----------
+        __value : _V
+            the value to convert
+
+        Returns
+        -------
+        _D
+            a data mobject that is never shared with the memo
+        """
+        if not self.__data_memo.is_enabled():
+            return self.__data_constructor(__value)
+
+        key = (type(__value), __value)
+        try:
+            hash(key)
+        except TypeError:
+            return self.__data_constructor(__value)
+        return self.__data_memo.fetch(
+            key, lambda: self.__data_constructor(__value)
+        ).copy()
+
+    @staticmethod
+    def __bounds(mob: Mobject) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the center and half extents of the bounding box of a mobject.
+
+        Parameters
+        ----------
+        mob : Mobject
+            the mobject to measure
 
-        self.extend(__values)
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            the center and the half extents along each dimension
+        """
+        points = mob.get_points_defining_boundary()
+        if len(points) == 0:
+            return np.zeros(3), np.zeros(3)
+        low, high = points.min(axis=0), points.max(axis=0)
+        return (low + high) / 2, (high - low) / 2
 
-        self.updaters.append(LinearCollection.__update)
+    def __rearrange(self, __submobject_index: int = 0, __force: bool = False) -> None:
+        """Rearranges the submobjects from the given index onwards.
 
-    @classmethod
-    def __update(cls, lc: Self, dt=0):
-        """An updater that is applied to each LinearCollection before every frame.
+        Called synchronously at the end of every mutation, so that an idle collection
+        costs nothing per frame. Inside deferred_layout only the index is recorded,
+        unless forced.
 
         Parameters
         ----------
-        lc : Self
-            the target to format
-        dt : int, optional
-            the time that has passed since the last update, by default 0
+        __submobject_index : int, optional
+            the index in submobjects of the first submobject to reposition, by default 0
+        __force : bool, optional
+            whether to rearrange even inside deferred_layout, by default False
+        """
+        self.__rearrange_from = min(self.__rearrange_from, __submobject_index)
+        del self.__extents[__submobject_index:]
+        if self.__layout_depth == 0 or __force:
+            self.__arrange()
+
+    @contextmanager
+    def deferred_layout(self) -> Iterator[Self]:
+        """Defers the rearrangement after each mutation to the end of the context.
+
+        Every insertion or deletion rearranges the submobjects after it, so a loop of
+        edits near the front costs O(n) each. Inside the context the submobjects are
+        left where they are and rearranged once on exit (of the outermost context).
+        Without centering, the arrangement then starts from wherever the first
+        submobject was left, as it does after every edit otherwise.
+
+        Yields
+        ------
+        Self
+            a reference to self
         """
-        # Only rearrange if we need to
-        if lc.__rearrange:
-            lc.arrange(**lc.__arrangement)
-            lc.__rearrange = False
+        self.__layout_depth += 1
+        try:
+            yield self
+        finally:
+            self.__layout_depth -= 1
+            if self.__layout_depth == 0 and self.__rearrange_from != sys.maxsize:
+                self.__arrange()
+
+    def __arrange(self):
+        """Arranges the submobjects, falling back to a full self.arrange only when the
+        arrangement changed or can't be applied incrementally."""
+        arrangement = freeze(self.__arrangement)
+        if arrangement != self.__arranged_with or not self.__arrange_incrementally():
+            self.arrange(**self.__arrangement)
+            self.__extents = [self.__bounds(mob)[1] for mob in self.submobjects]
+            self.__arranged_with = arrangement
+        self.__rearrange_from = sys.maxsize
+
+    def __arrange_incrementally(self) -> bool:
+        """Repositions the submobjects from self.__rearrange_from onwards next to their
+        predecessor, using the cached extents of the untouched ones to center the whole.
+
+        Returns
+        -------
+        bool
+            False if the arrangement or the cached extents don't allow it
+        """
+        if not set(self.__arrangement) <= {"direction", "buff", "center"}:
+            return False
+        if len(self.submobjects) == 0:
+            return True
+
+        direction = np.array(self.__arrangement.get("direction", RIGHT))
+        buff = self.__arrangement.get("buff", DEFAULT_MOBJECT_TO_MOBJECT_BUFFER)
+        sign = np.sign(direction)
+
+        start = max(min(self.__rearrange_from, len(self.submobjects)), 1)
+        if len(self.__extents) != min(self.__rearrange_from, start):
+            return False
+
+        # The submobject before the touched ones stays where it is
+        anchor_center, anchor_extent = self.__bounds(self.submobjects[start - 1])
+        if start <= len(self.__extents):
+            if not np.allclose(anchor_extent, self.__extents[start - 1]):
+                return False
+        else:
+            self.__extents.append(anchor_extent)
+
+        prev_center, prev_extent = anchor_center, anchor_extent
+        for mob in self.submobjects[start:]:
+            center, extent = self.__bounds(mob)
+            target = prev_center + (prev_extent + extent) * sign + buff * direction
+            if not np.allclose(target, center):
+                mob.shift(target - center)
+            self.__extents.append(extent)
+            prev_center, prev_extent = target, extent
+
+        self.__recenter(start - 1, anchor_center)
+        return True
+
+    def __recenter(self, __index: int, __center: np.ndarray) -> None:
+        """Moves the arranged whole to the origin with one shift if the arrangement
+        centers it, measuring it from the cached extents.
+
+        Parameters
+        ----------
+        __index : int
+            the index in submobjects of a submobject whose center is known
+        __center : np.ndarray
+            the center of that submobject
+        """
+        if not self.__arrangement.get("center", True) or len(self.__extents) == 0:
+            return
+
+        extents = np.array(self.__extents)
+        centers = self.__calc_centers(extents, __index, __center)
+        low = (centers - extents).min(axis=0)
+        high = (centers + extents).max(axis=0)
+        self.shift(-(low + high) / 2)
+
+    def __calc_centers(
+        self, __extents: np.ndarray, __index: int, __center: np.ndarray
+    ) -> np.ndarray:
+        """Computes the centers of arranged submobjects in one vectorized pass.
+
+        Parameters
+        ----------
+        __extents : np.ndarray
+            the half extents of the submobjects
+        __index : int
+            the index of the submobject whose center is known
+        __center : np.ndarray
+            the center of that submobject
+
+        Returns
+        -------
+        np.ndarray
+            the center of each submobject when arranged next to its predecessor
+        """
+        direction = np.array(self.__arrangement.get("direction", RIGHT))
+        buff = self.__arrangement.get("buff", DEFAULT_MOBJECT_TO_MOBJECT_BUFFER)
+        steps = (__extents[:-1] + __extents[1:]) * np.sign(direction) + buff * direction
+        centers = np.vstack([np.zeros(3), np.cumsum(steps, axis=0)])
+        return centers + (__center - centers[__index])
+
+    def __can_calc_centers(self) -> bool:
+        """Returns whether the cached extents describe the current arrangement.
+
+        Returns
+        -------
+        bool
+            True if __calc_centers can stand in for self.arrange
+        """
+        return (
+            set(self.__arrangement) <= {"direction", "buff", "center"}
+            and freeze(self.__arrangement) == self.__arranged_with
+            and len(self.__extents) == len(self.submobjects)
+        )
 
     def __submobject_index(self, __index: int) -> int:
         """Returns the index in submobjects of the given container index.
@@ -117,19 +649,6 @@ class LinearCollection(
         __index = __index if self.__delimiter is None else 2 * __index
         return __index if __index >= 0 else __index + 1
 
-    def __rebuild_submobjects(self):
-        """Rebuilds the submobject list to obey the order of self.__containers."""
-        self.submobjects.clear()
-        for container in self.__containers:
-            self.submobjects.append(container)
-            if (
-                self.__delimiter is not None
-                and len(self.submobjects) < 2 * len(self) - 1
-            ):
-                self.submobjects.append(self.__delimiter.copy())
-
-        self.__rearrange = True
-
     # Python list style methods
     def append(self, __value: _V) -> Self:
         """Appends the value.
@@ -146,6 +665,65 @@ class LinearCollection(
         """
         return self.insert(len(self), __value)
 
+    def appendleft(self, __value: _V) -> Self:
+        """Prepends the value.
+
+        Only the new container (and delimiter) is positioned, next to the first one,
+        after which the whole is recentered with one shift instead of rearranging
+        every submobject.
+
+        Parameters
+        ----------
+        __value : _V
+            the value to prepend
+
+        Returns
+        -------
+        Self
+            a reference to self
+        """
+        if (
+            len(self) == 0
+            or not self.__can_calc_centers()
+            or not self.__arrangement.get("center", True)
+        ):
+            return self.insert(0, __value)
+
+        # Insert into the values first, which raises for a value of the wrong dtype
+        length = len(self)
+        if isinstance(self.__values, np.ndarray):
+            self.__values = np.insert(self.__values, 0, __value)
+        else:
+            self.__values.insert(0, __value)
+        if self.__position_index is not None:
+            self.__position_index.insert(0, __value, length)
+        new_data = self.__construct_data(__value)
+        self.__datas.insert(0, new_data)
+        new_container = self.__container_constructor(new_data)
+        self.__containers.insert(0, new_container)
+
+        new_mobs = [new_container]
+        if self.__delimiter is not None:
+            new_mobs.append(self.__delimiter.copy())
+
+        # Place the new submobjects before the first one, last to first
+        direction = np.array(self.__arrangement.get("direction", RIGHT))
+        buff = self.__arrangement.get("buff", DEFAULT_MOBJECT_TO_MOBJECT_BUFFER)
+        sign = np.sign(direction)
+        next_center, next_extent = self.__bounds(self.submobjects[0])
+        new_extents = []
+        for mob in reversed(new_mobs):
+            center, extent = self.__bounds(mob)
+            target = next_center - (next_extent + extent) * sign - buff * direction
+            mob.shift(target - center)
+            new_extents.insert(0, extent)
+            next_center, next_extent = target, extent
+
+        self.submobjects[0:0] = new_mobs
+        self.__extents[0:0] = new_extents
+        self.__recenter(0, next_center)
+        return self
+
     def extend(self, __iterable: Iterable[_V]) -> Self:
         """Appends all items from the iterable.
 
@@ -159,12 +737,64 @@ class LinearCollection(
         Self
             a reference to self
         """
-        for value in __iterable:
-            self.append(value)
+        values = list(__iterable)
+        if len(values) == 0:
+            return self
+
+        length = len(self)
+        if isinstance(self.__values, np.ndarray):
+            self.__values = np.append(self.__values, values)
+        else:
+            self.__values.extend(values)
+        if self.__position_index is not None:
+            for i, value in enumerate(values, length):
+                self.__position_index.insert(i, value, i)
+        self.__append_mobs(values)
+
+        return self
+
+    def __append_mobs(self, __values: list[_V]) -> None:
+        """Appends the datas, containers and delimiters of values that were appended to
+        self.__values.
+
+        All datas and containers are built up front and spliced into submobjects at
+        once, rearranging only once.
+
+        Parameters
+        ----------
+        __values : list[_V]
+            the appended values
+        """
+        datas = [self.__construct_data(value) for value in __values]
+        containers = [self.__container_constructor(data) for data in datas]
+
+        submobject_index = len(self.submobjects)
+        new_submobjects = []
+        for container in containers:
+            if self.__delimiter is not None and (self.submobjects or new_submobjects):
+                new_submobjects.append(self.__delimiter.copy())
+            new_submobjects.append(container)
+
+        self.__datas.extend(datas)
+        self.__containers.extend(containers)
+        self.submobjects.extend(new_submobjects)
+
+        # Rearrange the touched submobjects
+        self.__rearrange(submobject_index)
 
     def insert(self, __index: SupportsIndex, __value: _V) -> Self:
-        self.__values.insert(__index, __value)
-        new_data = self.__data_constructor(__value)
+        index = max(min(__index.__index__(), len(self)), -len(self))
+        index = index if index >= 0 else index + len(self)
+
+        # Insert into the values first, which raises for a value of the wrong dtype
+        length = len(self)
+        if isinstance(self.__values, np.ndarray):
+            self.__values = np.insert(self.__values, index, __value)
+        else:
+            self.__values.insert(__index, __value)
+        if self.__position_index is not None:
+            self.__position_index.insert(index, __value, length)
+        new_data = self.__construct_data(__value)
         self.__datas.insert(__index, new_data)
         new_container = self.__container_constructor(new_data)
         self.__containers.insert(__index, new_container)
@@ -176,8 +806,8 @@ class LinearCollection(
             submobject_index -= 1
         super().insert(submobject_index, new_container)
 
-        # Flag for rearrangement
-        self.__rearrange = True
+        # Rearrange the touched submobjects
+        self.__rearrange(max(self.__submobject_index(index) - 1, 0))
         return self
 
     def remove(self, __value: _V) -> Self:
@@ -196,7 +826,6 @@ class LinearCollection(
         index = self.index(__value)
         self.__delitem__(index)
 
-        self.__rearrange = True
         return self
 
     def pop(self, __index: SupportsIndex = -1) -> _V:
@@ -220,7 +849,38 @@ class LinearCollection(
         value = self.__values[__index]
         del self[__index]
 
-        self.__rearrange = True
+        return value
+
+    def popleft(self) -> _V:
+        """Removes the first value and returns it.
+
+        Only the first container (and delimiter) is removed, after which the whole is
+        recentered with one shift instead of rearranging every submobject.
+
+        Returns
+        -------
+        _V
+            the value that was at index 0
+        """
+        if len(self) == 0 or not self.__can_calc_centers():
+            return self.pop(0)
+
+        value = self.__values[0]
+        if self.__position_index is not None:
+            self.__position_index.delete(0, value, len(self))
+        if isinstance(self.__values, np.ndarray):
+            self.__values = self.__values[1:].copy()
+        else:
+            del self.__values[0]
+        del self.__datas[0]
+        del self.__containers[0]
+
+        count = min(1 if self.__delimiter is None else 2, len(self.submobjects))
+        del self.submobjects[:count]
+        del self.__extents[:count]
+        if self.submobjects:
+            self.__recenter(0, self.__bounds(self.submobjects[0])[0])
+
         return value
 
     def clear(self) -> Self:
@@ -231,10 +891,16 @@ class LinearCollection(
         Self
             a reference to self
         """
-        self.__values.clear()
+        if isinstance(self.__values, np.ndarray):
+            self.__values = self.__values[:0]
+        else:
+            self.__values.clear()
         self.__datas.clear()
         self.__containers.clear()
         self.submobjects.clear()
+        self.__extents.clear()
+        if self.__position_index is not None:
+            self.__position_index.rebuild(self.__values)
 
         return self
 
@@ -260,7 +926,11 @@ class LinearCollection(
         int
             the index of __value if it is present (ValueError otherwise)
         """
-        return self.__values.index(__value, __start, __stop)
+        if self.__position_index is not None:
+            return self.__position_index.find(
+                self.__values, __value, __start.__index__(), __stop.__index__()
+            )
+        return _index_of(self.__values, __value, __start, __stop)
 
     def count(self, __value: _V) -> int:
         """Counts the number of instances of __value.
@@ -275,11 +945,16 @@ class LinearCollection(
         int
             the number of times __value occurred
         """
-        return self.__values.count(__value)
+        if self.__position_index is not None:
+            return self.__position_index.count(self.__values, __value)
+        return _count_of(self.__values, __value)
 
     def sort(
-        self, key: Callable[[_V], SupportsRichComparison] = lambda x: x, reverse=False
-    ) -> Self:
+        self,
+        key: Callable[[_V], SupportsRichComparison] = lambda x: x,
+        reverse=False,
+        animate=False,
+    ) -> Self | TranslateMobjects:
         """Sorts the list inplace according to the given key.
 
         Parameters
@@ -288,27 +963,92 @@ class LinearCollection(
             a callable to convert values to a sortable type, by default lambda x: x
         reverse : bool, optional
             False for ascending order, True for descending order, by default False
+        animate : bool, optional
+            whether to return a single animation moving the containers to their sorted
+            positions (see permute), by default False
 
         Returns
         -------
-        Self
-            a reference to self
+        Self | TranslateMobjects
+            a reference to self, or the animation if animate is True
         """
-        if len(self) == 0:
-            return
-
-        self.__values, self.__datas, self.__containers = map(
-            list,
-            zip(
-                *sorted(
-                    zip(self.__values, self.__datas, self.__containers),
-                    key=(lambda x: key(x[0])),
-                    reverse=reverse,
-                )
-            ),
+        order = sorted(
+            range(len(self)), key=(lambda i: key(self.__values[i])), reverse=reverse
         )
-        self.__rebuild_submobjects()
+        return self.permute(order, animate)
+
+    def permute(
+        self, __perm: Iterable[SupportsIndex], animate: bool = False
+    ) -> Self | TranslateMobjects:
+        """Reorders the values so that the value at index __perm[i] moves to index i.
 
+        The datas, containers and delimiters are reused and their target positions
+        are computed in one vectorized pass over the cached extents.
+
+        Parameters
+        ----------
+        __perm : Iterable[SupportsIndex]
+            the permutation, containing each index exactly once
+        animate : bool, optional
+            whether to leave the mobjects in place and return a single animation that
+            moves all of them to their new positions, by default False
+
+        Returns
+        -------
+        Self | TranslateMobjects
+            a reference to self, or the animation if animate is True
+        """
+        order = [i.__index__() for i in __perm]
+        if sorted(order) != list(range(len(self))):
+            raise ValueError("permutation must contain each index exactly once")
+
+        mobs = list(self.submobjects)
+        can_calc_centers = self.__can_calc_centers() and len(mobs) > 0
+        if can_calc_centers:
+            starts = self.__calc_centers(
+                np.array(self.__extents), 0, self.__bounds(mobs[0])[0]
+            )
+        else:
+            starts = np.array([self.__bounds(mob)[0] for mob in mobs])
+
+        # Reorder everything, keeping the delimiters in place
+        if isinstance(self.__values, np.ndarray):
+            self.__values = self.__values[order]
+        else:
+            self.__values = [self.__values[i] for i in order]
+        self.__datas = [self.__datas[i] for i in order]
+        self.__containers = [self.__containers[i] for i in order]
+        step = 1 if self.__delimiter is None else 2
+        self.submobjects[::step] = self.__containers
+        if can_calc_centers:
+            container_extents = self.__extents[::step]
+            self.__extents[::step] = [container_extents[i] for i in order]
+        if self.__position_index is not None:
+            self.__position_index.rebuild(self.__values)
+
+        old_index = {id(mob): i for i, mob in enumerate(mobs)}
+        starts = np.array([starts[old_index[id(mob)]] for mob in self.submobjects])
+        if can_calc_centers:
+            extents = np.array(self.__extents)
+            targets = self.__calc_centers(extents, 0, starts[0])
+            if self.__arrangement.get("center", True):
+                low = (targets - extents).min(axis=0)
+                high = (targets + extents).max(axis=0)
+                targets -= (low + high) / 2
+            if not animate:
+                for mob, start, target in zip(self.submobjects, starts, targets):
+                    mob.shift(target - start)
+        else:
+            # Let the layout pass move the mobjects and read where they ended up (even
+            # inside deferred_layout, since the animation needs them)
+            self.__rearrange(0, animate)
+            targets = np.array([self.__bounds(mob)[0] for mob in self.submobjects])
+            if animate:
+                for mob, start, target in zip(self.submobjects, starts, targets):
+                    mob.shift(start - target)
+
+        if animate:
+            return TranslateMobjects(self, self.submobjects, targets - starts)
         return self
 
     def reverse(self) -> Self:
@@ -319,20 +1059,153 @@ class LinearCollection(
         Self
             _description_
         """
-        self.__values.reverse()
+        if isinstance(self.__values, np.ndarray):
+            self.__values = self.__values[::-1].copy()
+        else:
+            self.__values.reverse()
         self.__datas.reverse()
         self.__containers.reverse()
         self.submobjects.reverse()
+        if self.__position_index is not None:
+            self.__position_index.rebuild(self.__values)
+
+        self.__rearrange()
+        return self
+
+    def roll(
+        self, __shift: SupportsIndex, animate: bool = False
+    ) -> Self | TranslateMobjects:
+        """Rolls the values towards the end, wrapping around like numpy.roll and
+        collections.deque.rotate.
+
+        The datas and containers move along with their values, so nothing is
+        constructed, and their new positions are computed like in permute.
+
+        Parameters
+        ----------
+        __shift : SupportsIndex
+            the number of positions to roll by (negative rolls towards the front)
+        animate : bool, optional
+            whether to return a single animation that moves the containers to their
+            new positions, by default False
+
+        Returns
+        -------
+        Self | TranslateMobjects
+            a reference to self, or the animation if animate is True
+        """
+        n = len(self)
+        shift = __shift.__index__() % n if n > 0 else 0
+        if shift == 0 and not animate:
+            return self
+
+        return self.permute([(i - shift) % n for i in range(n)], animate)
+
+    def set_values(self, __indices: Any, __values: Any) -> Self:
+        """Assigns values at the given indices in one vectorized step, rebuilding only
+        the datas whose value actually changed.
+
+        Parameters
+        ----------
+        __indices : Any
+            an index, slice, boolean mask or array of indices
+        __values : Any
+            the new values, broadcast against the selected indices (so a scalar, or a
+            string for a string dtype, is assigned to every index)
 
-        self.__rearrange = True
+        Returns
+        -------
+        Self
+            a reference to self
+        """
+        indices = np.atleast_1d(np.arange(len(self))[__indices])
+        touched = np.unique(indices)
+        if isinstance(self.__values, np.ndarray):
+            old_values = self.__values[touched].copy()
+            self.__values[indices] = __values
+            is_changed = np.asarray(old_values != self.__values[touched])
+            changed, old_values = touched[is_changed].tolist(), old_values[is_changed]
+        else:
+            old_values = [self.__values[i] for i in touched]
+            new_values = np.empty(len(indices), dtype=object)
+            new_values[:] = __values
+            for i, value in zip(indices.tolist(), new_values):
+                self.__values[i] = value
+            changed = []
+            for i, old_value in zip(touched.tolist(), old_values):
+                if old_value != self.__values[i]:
+                    changed.append((i, old_value))
+            changed, old_values = [i for i, _ in changed], [v for _, v in changed]
+
+        self.__replace_datas(changed, list(old_values))
         return self
 
+    def apply(self, __func: Callable[..., Any], *args, **kwargs) -> Self:
+        """Applies a vectorized function (e.g. a NumPy ufunc) to all values, rebuilding
+        only the datas whose value actually changed.
+
+        Parameters
+        ----------
+        __func : Callable[..., Any]
+            a function that maps an array of the values to an array of new values
+        *args, **kwargs
+            forwarded to __func
+
+        Returns
+        -------
+        Self
+            a reference to self
+        """
+        new_values = __func(np.asarray(self.__values), *args, **kwargs)
+        if not isinstance(self.__values, np.ndarray):
+            new_values = np.asarray(new_values).tolist()
+        return self.set_values(slice(None), new_values)
+
+    def __replace_datas(self, __indices: list[int], __old_values: list[_V]) -> None:
+        """Rebuilds the datas of values that were assigned in self.__values.
+
+        Parameters
+        ----------
+        __indices : list[int]
+            the (non-negative) indices of the assigned values
+        __old_values : list[_V]
+            the values that were replaced
+        """
+        for i, old_value in zip(__indices, __old_values):
+            data = self.__construct_data(self.__values[i]).move_to(self.__containers[i])
+            self.__datas[i] = data
+            self.__containers[i].submobjects[0] = data
+            if self.__position_index is not None:
+                self.__position_index.replace(i, old_value, self.__values[i])
+
+        # Only rearrange if a new data changed the extent of its container
+        for i in __indices:
+            submobject_index = self.__submobject_index(i)
+            if submobject_index >= len(self.__extents) or not np.allclose(
+                self.__bounds(self.__containers[i])[1],
+                self.__extents[submobject_index],
+            ):
+                self.__rearrange(submobject_index)
+                break
+
+    def __value_list(self) -> list[_V]:
+        """Returns the values as a list, converting a backing np.ndarray.
+
+        Returns
+        -------
+        list[_V]
+            the values
+        """
+        if isinstance(self.__values, np.ndarray):
+            return self.__values.tolist()
+        return self.__values
+
     # Comparison Operators
     def __lt__(self, rhs):
         if isinstance(rhs, LinearCollection):
-            return self.__values.__lt__(rhs.__values)
+            return self.__value_list().__lt__(rhs.__value_list())
         if isinstance(rhs, list):
-            return self.__values.__lt__(rhs)
+            return self.__value_list().__lt__(rhs)
 
         raise TypeError(
             f"'<' not supported between instances of 'LinearCollection' and '{type(rhs)}'"
@@ -340,9 +1213,9 @@ class LinearCollection(
 
     def __le__(self, rhs):
         if isinstance(rhs, LinearCollection):
-            return self.__values.__le__(rhs.__values)
+            return self.__value_list().__le__(rhs.__value_list())
         if isinstance(rhs, list):
-            return self.__values.__le__(rhs)
+            return self.__value_list().__le__(rhs)
 
         raise TypeError(
             f"'<=' not supported between instances of 'LinearCollection' and '{type(rhs)}'"
@@ -353,17 +1226,17 @@ class LinearCollection(
 
     def __ne__(self, rhs: LinearCollection):
         if isinstance(rhs, LinearCollection):
-            return self.__values.__ne__(rhs.__values)
+            return self.__value_list().__ne__(rhs.__value_list())
         if isinstance(rhs, list):
-            return self.__values.__ne__(rhs)
+            return self.__value_list().__ne__(rhs)
 
         return True
 
     def __gt__(self, rhs: Union[Iterable, LinearCollection]):
         if isinstance(rhs, LinearCollection):
-            return self.__values.__gt__(rhs.__values)
+            return self.__value_list().__gt__(rhs.__value_list())
         if isinstance(rhs, list):
-            return self.__values.__gt__(rhs)
+            return self.__value_list().__gt__(rhs)
 
         raise TypeError(
             f"'>' not supported between instances of 'LinearCollection' and '{type(rhs)}'"
@@ -371,9 +1244,9 @@ class LinearCollection(
 
     def __ge__(self, rhs: LinearCollection):
         if isinstance(rhs, LinearCollection):
-            return self.__values.__ge__(rhs.__values)
+            return self.__value_list().__ge__(rhs.__value_list())
         if isinstance(rhs, list):
-            return self.__values.__ge__(rhs)
+            return self.__value_list().__ge__(rhs)
 
         raise TypeError(
             f"'>=' not supported between instances of 'LinearCollection' and '{type(rhs)}'"
@@ -386,17 +1259,23 @@ class LinearCollection(
         return self.__values.__getitem__(index)
 
     def __setitem__(self, index: SupportsIndex, value: Any) -> None:
-        self.__values.__setitem__(index, value)
-        try:
-            self.__datas[index] = (self.__data_constructor(val) for val in value)
-            for data, container in zip(self.__datas[index], self.__containers[index]):
-                data.move_to(container)
-                container.submobjects[0] = data
-        except TypeError:
-            self.__datas[index] = self.__data_constructor(value).move_to(
-                self.__containers[index]
-            )
-            self.__containers[index].submobjects[0] = self.__datas[index]
+        if isinstance(index, slice):
+            # Scalars (strings included) are broadcast like in NumPy, sequences must
+            # match the length of the slice since the collection isn't resized
+            if isinstance(value, Iterable) and not isinstance(value, (str, bytes)):
+                value = list(value)
+                length = len(range(len(self))[index])
+                if len(value) != length:
+                    raise ValueError(
+                        f"attempt to assign sequence of size {len(value)} to slice of size {length}"
+                    )
+            self.set_values(index, value)
+            return
+
+        index = range(len(self))[index]
+        old_value = self.__values[index]
+        self.__values[index] = value
+        self.__replace_datas([index], [old_value])
 
     def __delitem__(self, index: SupportsIndex) -> None:
         if index < 0:
@@ -414,10 +1293,15 @@ class LinearCollection(
             else:
                 self.submobjects.__delitem__(submobject_index - 1)
 
-        self.__values.__delitem__(index)
+        if self.__position_index is not None:
+            self.__position_index.delete(index, self.__values[index], len(self))
+        if isinstance(self.__values, np.ndarray):
+            self.__values = np.delete(self.__values, index)
+        else:
+            self.__values.__delitem__(index)
         self.__datas.__delitem__(index)
         self.__containers.__delitem__(index)
-        self.__rearrange = True
+        self.__rearrange(max(submobject_index - 1, 0))
 
     def __iter__(self):
         return self.__values.__iter__()
@@ -441,11 +1325,8 @@ class LinearCollection(
             )
 
         num_repeats = rhs.__index__() - 1
-        self_copy = self.copy()
-        for _ in range(num_repeats):
-            self += self_copy
+        self.extend(list(self.__values) * num_repeats)
 
-        self.__rearrange = True
         return self
 
     def __mul__(self, rhs: SupportsIndex):
@@ -460,23 +1341,31 @@ class LinearCollection(
     def __copy__(self) -> Self:
         """Performs a shallow copy of self.__values and a deepcopy of the graphical components.
 
+        The graphical components are copied in a single deepcopy pass, so the copied
+        containers, datas and delimiters are the copy's submobjects and keep their
+        arrangement. The delimiter prototype, the constructors and the arrangement are
+        shared with self. The point arrays are not: manim shifts points in place, so
+        the copy takes as much memory as the graphical components of self.
+
         Returns
         -------
         Self
             a copy of this LinearCollection
         """
-        self_copy = super().copy()
-        self_copy.__values = self.__values.copy()
-        self_copy.__containers = copy.deepcopy(self.__containers)
-        self_copy.__datas = [
-            container.submobjects[0] for container in self_copy.__containers
-        ]
-        self_copy.__data_constructor = copy.copy(self.__data_constructor)
-        self_copy.__container_constructor = copy.copy(self.__container_constructor)
-        self_copy.__delimiter = self.__delimiter
-        self_copy.__arrangement = self.__arrangement
-        self_copy.__rearrange = self.__rearrange
-        self_copy.__rebuild_submobjects()
+        memo = {
+            id(self.__values): self.__values.copy(),
+            id(self.__delimiter): self.__delimiter,
+            id(self.__arrangement): self.__arrangement,
+            id(self.__data_memo): self.__data_memo,
+        }
+        if self.__position_index is not None:
+            memo[id(self.__position_index)] = self.__position_index.copy()
+        self_copy = copy.deepcopy(self, memo)
+
+        # The copy isn't inside the deferred_layout of self
+        self_copy.__layout_depth = 0
+        if self_copy.__rearrange_from != sys.maxsize:
+            self_copy.__arrange()
 
         return self_copy
 
@@ -499,3 +1388,438 @@ class LinearCollection(
             a hash
         """
         return hash(tuple(self))
+
+
+class VirtualLinearCollection(
+    VMobject,
+    Generic[_V, _D, _C, _Delimiter],
+):
+    """A LinearCollection that only materializes mobjects for a window of its values.
+
+    All values stay in memory and the list style API works on all of them, while the
+    datas, containers and delimiters only exist for the visible values plus a margin
+    on each side. Only the visible ones are submobjects, so the margin stays off the
+    scene, and the first visible container keeps its position across edits. seek and
+    scroll move the window, recycling containers.
+    """
+
+    __values: list[_V]
+    __start: int
+    __visible: int
+    __margin: int
+    __delimited: bool
+    __arrangement: dict
+    __anchor: np.ndarray
+    __window: LinearCollection
+
+    def __init__(
+        self,
+        __values: Iterable[_V] = (),
+        __data_constructor: Callable[[_V], _D] = Integer,
+        __container_constructor: Callable[[], _C] = Square,
+        __delimiter: _Delimiter = None,
+        __arrangement={"direction": RIGHT, "buff": 0.0},
+        *args,
+        visible: int = 10,
+        margin: int = 2,
+        data_memo_size: int = 0,
+        **kwargs,
+    ):
+        """Constructs a new VirtualLinearCollection.
+
+        Parameters
+        ----------
+        __values : Iterable[_V], optional
+            the iterable of values to hold, by default ()
+        __data_constructor : Callable[[_V], _D], optional
+            a callable that converts values to an Mobject representation, by default Integer
+        __container_constructor : Callable[[], _C], optional
+            a callable that constructs a container, by default Square
+        __delimiter : _Delimiter, optional
+            an optional delimiter that is placed between containers, by default None
+        __arrangement : dict, optional
+            a dict of kwargs that is passed to self.arrange, by default {"direction": RIGHT, "buff": 0.0}
+        visible : int, optional
+            the number of values in view, by default 10
+        margin : int, optional
+            the number of values materialized on each side of the view, by default 2
+        data_memo_size : int, optional
+            the number of data mobjects to memoize by value, by default 0 (disabled)
+        """
+        super().__init__(*args, **kwargs)
+
+        self.__values = list(__values)
+        self.__start = 0
+        self.__visible = visible
+        self.__margin = margin
+        self.__delimited = __delimiter is not None
+        self.__arrangement = __arrangement
+        self.__window = LinearCollection(
+            self.__values[slice(*self.__materialized_range())],
+            __data_constructor,
+            __container_constructor,
+            __delimiter,
+            __arrangement,
+            data_memo_size=data_memo_size,
+        )
+
+        # Center the view (rather than the whole window) on the origin
+        self.__anchor = ORIGIN
+        self.__show()
+        if len(self.submobjects) > 0:
+            self.__anchor = self.__anchor - self.get_center()
+            self.__show()
+
+    def __materialized_range(self) -> tuple[int, int]:
+        """Returns the range of values that have mobjects.
+
+        Returns
+        -------
+        tuple[int, int]
+            the first (inclusive) and last (exclusive) index of the materialized values
+        """
+        return (
+            max(self.__start - self.__margin, 0),
+            min(self.__start + self.__visible + self.__margin, len(self.__values)),
+        )
+
+    def __sync(self, __roll: int = 0) -> None:
+        """Updates the window to hold the materialized values with as few edits as
+        possible, reusing the containers of replaced values.
+
+        Parameters
+        ----------
+        __roll : int, optional
+            the number of positions to roll the window by first, aligning the values it
+            keeps when the materialized range moved, by default 0
+        """
+        self.__capture_anchor()
+        self.__start = max(min(self.__start, len(self.__values) - self.__visible), 0)
+        desired = self.__values[slice(*self.__materialized_range())]
+
+        if 0 < abs(__roll) < len(self.__window):
+            self.__window.roll(__roll)
+
+        try:
+            opcodes = SequenceMatcher(
+                None, list(self.__window), desired, autojunk=False
+            ).get_opcodes()
+        except TypeError:
+            # Unhashable values: replace everything in place
+            opcodes = [("replace", 0, len(self.__window), 0, len(desired))]
+
+        # Apply from the end so that the earlier indices stay valid
+        with self.__window.deferred_layout():
+            for tag, i1, i2, j1, j2 in reversed(opcodes):
+                if tag == "equal":
+                    continue
+                common = min(i2 - i1, j2 - j1)
+                for k in range(common):
+                    if self.__window[i1 + k] != desired[j1 + k]:
+                        self.__window[i1 + k] = desired[j1 + k]
+                for k in range(i2 - 1, i1 + common - 1, -1):
+                    del self.__window[k]
+                for k in range(common, j2 - j1):
+                    self.__window.insert(i1 + k, desired[j1 + k])
+
+        self.__show()
+
+    def __visible_submobjects(self) -> list[Mobject]:
+        """Returns the submobjects of the window that belong to the values in view.
+
+        Returns
+        -------
+        list[Mobject]
+            the containers in view and the delimiters between them
+        """
+        first = self.__materialized_range()[0]
+        start, stop = (i - first for i in self.fetch_visible_range())
+        if stop <= start:
+            return []
+        if not self.__delimited:
+            return self.__window.submobjects[start:stop]
+        return self.__window.submobjects[2 * start : 2 * stop - 1]
+
+    def __show(self) -> None:
+        """Lays out the window with its first value in view at the anchor, and makes
+        the submobjects in view (and only them) the submobjects of self.
+
+        The whole window is rearranged since only the part in view moves along when
+        self is transformed, but it is never much larger than the view.
+        """
+        visible = self.__visible_submobjects()
+        if len(visible) == 0:
+            self.submobjects = []
+            return
+
+        self.__window.arrange(**self.__arrangement)
+        self.__window.shift(self.__anchor - visible[0].get_center())
+        self.submobjects = list(visible)
+
+    def seek(self, __index: SupportsIndex) -> Self:
+        """Moves the view to start at the given index.
+
+        Parameters
+        ----------
+        __index : SupportsIndex
+            the index of the first value in view
+
+        Returns
+        -------
+        Self
+            a reference to self
+        """
+        first = self.__materialized_range()[0]
+        self.__start = __index.__index__()
+        self.__start = max(min(self.__start, len(self.__values) - self.__visible), 0)
+        self.__sync(first - self.__materialized_range()[0])
+        return self
+
+    def scroll(self, __count: SupportsIndex) -> Self:
+        """Moves the view by the given number of values.
+
+        Parameters
+        ----------
+        __count : SupportsIndex
+            the number of values to move by (negative moves towards the front)
+
+        Returns
+        -------
+        Self
+            a reference to self
+        """
+        return self.seek(self.__start + __count.__index__())
+
+    def fetch_visible_range(self) -> tuple[int, int]:
+        """Returns the range of values in view.
+
+        Returns
+        -------
+        tuple[int, int]
+            the first (inclusive) and last (exclusive) index of the values in view
+        """
+        return self.__start, min(self.__start + self.__visible, len(self.__values))
+
+    def __capture_anchor(self) -> None:
+        """Records where the first value in view is displayed, following any transform
+        of self since the last edit."""
+        if len(self.submobjects) > 0:
+            self.__anchor = self.submobjects[0].get_center()
+
+    def fetch_window(self) -> LinearCollection:
+        """Returns the LinearCollection holding the materialized values.
+
+        Returns
+        -------
+        LinearCollection
+            the window of materialized values, which isn't a submobject of self; only
+            its part in view is
+        """
+        return self.__window
+
+    # Python list style methods
+    def append(self, __value: _V) -> Self:
+        """Appends the value.
+
+        Parameters
+        ----------
+        __value : _V
+            the value to append
+
+        Returns
+        -------
+        Self
+            a reference to self
+        """
+        return self.extend((__value,))
+
+    def extend(self, __iterable: Iterable[_V]) -> Self:
+        """Appends all items from the iterable.
+
+        Parameters
+        ----------
+        __iterable : Iterable[_V]
+            an iterable of values to append
+
+        Returns
+        -------
+        Self
+            a reference to self
+        """
+        self.__values.extend(__iterable)
+        self.__sync()
+        return self
+
+    def insert(self, __index: SupportsIndex, __value: _V) -> Self:
+        """Inserts the value before the given index.
+
+        Parameters
+        ----------
+        __index : SupportsIndex
+            the index to insert before
+        __value : _V
+            the value to insert
+
+        Returns
+        -------
+        Self
+            a reference to self
+        """
+        self.__values.insert(__index, __value)
+        self.__sync()
+        return self
+
+    def remove(self, __value: _V) -> Self:
+        """Removes the first value that is equal to __value.
+
+        Parameters
+        ----------
+        __value : _V
+            the value to remove
+
+        Returns
+        -------
+        Self
+            a reference to self
+        """
+        self.__values.remove(__value)
+        self.__sync()
+        return self
+
+    def pop(self, __index: SupportsIndex = -1) -> _V:
+        """Removes the value at the given index and returns it.
+
+        Parameters
+        ----------
+        __index : SupportsIndex, optional
+            the index to pop, by default -1
+
+        Returns
+        -------
+        _V
+            the value that was at __index
+        """
+        value = self.__values.pop(__index)
+        self.__sync()
+        return value
+
+    def clear(self) -> Self:
+        """Clears all values from the list.
+
+        Returns
+        -------
+        Self
+            a reference to self
+        """
+        self.__capture_anchor()
+        self.__values.clear()
+        self.__window.clear()
+        self.__start = 0
+        self.submobjects = []
+        return self
+
+    def index(
+        self,
+        __value: _V,
+        __start: SupportsIndex = 0,
+        __stop: SupportsIndex = sys.maxsize,
+    ) -> int:
+        """Finds the first instance of __value and returns its index.
+
+        Parameters
+        ----------
+        __value : _V
+            the value to search for
+        __start : SupportsIndex
+            the index to start searching from
+        __stop : SupportsIndex, optional
+            the index to stop searching at, by default sys.maxsize
+
+        Returns
+        -------
+        int
+            the index of __value if it is present (ValueError otherwise)
+        """
+        return self.__values.index(__value, __start, __stop)
+
+    def count(self, __value: _V) -> int:
+        """Counts the number of instances of __value.
+
+        Parameters
+        ----------
+        __value : _V
+            the value to count
+
+        Returns
+        -------
+        int
+            the number of times __value occurred
+        """
+        return self.__values.count(__value)
+
+    def sort(
+        self, key: Callable[[_V], SupportsRichComparison] = lambda x: x, reverse=False
+    ) -> Self:
+        """Sorts the list inplace according to the given key.
+
+        Parameters
+        ----------
+        key : (_V) -> SupportsRichComparison, optional
+            a callable to convert values to a sortable type, by default lambda x: x
+        reverse : bool, optional
+            False for ascending order, True for descending order, by default False
+
+        Returns
+        -------
+        Self
+            a reference to self
+        """
+        self.__values.sort(key=key, reverse=reverse)
+        self.__sync()
+        return self
+
+    def reverse(self) -> Self:
+        """Reverses the order of the values.
+
+        Returns
+        -------
+        Self
+            a reference to self
+        """
+        self.__values.reverse()
+        self.__sync()
+        return self
+
+    def __len__(self) -> int:
+        return self.__values.__len__()
+
+    def __getitem__(self, index: SupportsIndex) -> Any:
+        return self.__values.__getitem__(index)
+
+    def __setitem__(self, index: SupportsIndex, value: Any) -> None:
+        self.__values.__setitem__(index, value)
+        self.__sync()
+
+    def __delitem__(self, index: SupportsIndex) -> None:
+        self.__values.__delitem__(index)
+        self.__sync()
+
+    def __iter__(self):
+        return self.__values.__iter__()
+
+    def __eq__(self, rhs):
+        if isinstance(rhs, VirtualLinearCollection):
+            return self.__values == rhs.__values
+        if isinstance(rhs, (list, LinearCollection)):
+            return rhs == self.__values
+        return False
+
+    def __hash__(self) -> int:
+        """Naive hash of the value of the tuple representation.
+
+        Returns
+        -------
+        int
+            a hash
+        """
+        return hash(tuple(self))
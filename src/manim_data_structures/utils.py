@@ -1,4 +1,10 @@
 import copy
+import hashlib
+import typing
+from collections import OrderedDict
+
+import numpy as np
+from manim import Mobject, Text
 
 
 def exclude_from_deepcopy(*exclude_list):
@@ -21,6 +27,566 @@ def exclude_from_deepcopy(*exclude_list):
     return _
 
 
+def freeze(value: typing.Any) -> typing.Hashable:
+    """Converts a value (e.g. a dict of mobject arguments) into a hashable key.
+
+    Parameters
+    ----------
+    value
+        Specifies the value to convert.
+
+    Returns
+    -------
+    :class:`~typing.Hashable`
+        A hashable representation of the value.
+    """
+
+    if isinstance(value, dict):
+        return tuple(
+            sorted(
+                ((k, freeze(v)) for k, v in value.items()), key=lambda kv: repr(kv[0])
+            )
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, np.ndarray):
+        return freeze(value.tolist())
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
+
+
+class LRUCache:
+    """A size-bounded cache that evicts the least recently used entry first.
+
+    Parameters
+    ----------
+    max_size
+        Specifies the maximum number of entries to keep. `0` disables caching.
+
+    Attributes
+    ----------
+    __entries : :class:`~collections.OrderedDict`
+        The cached entries ordered from least to most recently used.
+    __max_size : :class:`int`
+        The maximum number of entries to keep.
+    __hits : :class:`int`
+        The number of lookups served from the cache.
+    __misses : :class:`int`
+        The number of lookups that had to create their entry.
+    __evictions : :class:`int`
+        The number of entries dropped to respect :attr:`__max_size`.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        """Initializes the class.
+
+        Parameters
+        ----------
+        max_size
+            Specifies the maximum number of entries to keep. `0` disables caching.
+        """
+
+        self.__entries: OrderedDict = OrderedDict()
+        self.__max_size: int = max_size
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__evictions: int = 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, key: typing.Hashable) -> bool:
+        return key in self.__entries
+
+    def __evict(self) -> None:
+        """Drops least recently used entries until the cache respects its size bound."""
+
+        while len(self.__entries) > self.__max_size:
+            self.__entries.popitem(last=False)
+            self.__evictions += 1
+
+    def is_enabled(self) -> bool:
+        """Checks whether the cache stores entries at all.
+
+        Returns
+        -------
+        :class:`bool`
+            `True` if :attr:`__max_size` is greater than `0`.
+        """
+
+        return self.__max_size > 0
+
+    def fetch(
+        self, key: typing.Hashable, factory: typing.Callable[[], typing.Any]
+    ) -> typing.Any:
+        """Fetches the entry for the specified key, creating it on a miss.
+
+        Parameters
+        ----------
+        key
+            Specifies the key of the entry.
+        factory
+            Creates the entry when it is not cached.
+
+        Returns
+        -------
+        :data:`~typing.Any`
+            The cached (or newly created) entry.
+        """
+
+        if key in self.__entries:
+            self.__hits += 1
+            self.__entries.move_to_end(key)
+            return self.__entries[key]
+
+        self.__misses += 1
+        value = factory()
+        if self.__max_size > 0:
+            self.__entries[key] = value
+            self.__evict()
+        return value
+
+    def resize(self, max_size: int) -> None:
+        """Changes the size bound of the cache, evicting entries if required.
+
+        Parameters
+        ----------
+        max_size
+            Specifies the maximum number of entries to keep. `0` disables caching.
+        """
+
+        self.__max_size = max_size
+        self.__evict()
+
+    def clear(self) -> None:
+        """Drops all entries and resets the counters."""
+
+        self.__entries.clear()
+        self.__hits = self.__misses = self.__evictions = 0
+
+    def fetch_stats(self) -> dict:
+        """Fetches the counters of the cache.
+
+        Returns
+        -------
+        :class:`dict`
+            Number of `hits`, `misses` and `evictions` along with the current `size` and `max_size`.
+        """
+
+        return {
+            "hits": self.__hits,
+            "misses": self.__misses,
+            "evictions": self.__evictions,
+            "size": len(self.__entries),
+            "max_size": self.__max_size,
+        }
+
+
+class FenwickTree:
+    """A binary indexed tree that answers prefix sums of a list of numbers in O(log n).
+
+    Parameters
+    ----------
+    values
+        Specifies the initial values.
+
+    Attributes
+    ----------
+    __values : :class:`list`
+        The values whose prefix sums are kept.
+    __tree : :class:`list`
+        The 1-based binary indexed tree over :attr:`__values`.
+    """
+
+    def __init__(self, values: typing.Iterable[float] = ()) -> None:
+        """Initializes the class.
+
+        Parameters
+        ----------
+        values
+            Specifies the initial values.
+        """
+
+        self.__values: typing.List[float] = []
+        self.__tree: typing.List[float] = [0]
+        self.rebuild(values)
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    def rebuild(self, values: typing.Iterable[float]) -> None:
+        """Replaces all values, rebuilding the tree in O(n).
+
+        Parameters
+        ----------
+        values
+            Specifies the new values.
+        """
+
+        self.__values = list(values)
+        self.__tree = [0] + self.__values
+        for i in range(1, len(self.__tree)):
+            j = i + (i & -i)
+            if j < len(self.__tree):
+                self.__tree[j] += self.__tree[i]
+
+    def fetch(self, index: int) -> float:
+        """Fetches the value at the specified index.
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the value.
+
+        Returns
+        -------
+        :class:`float`
+            The value.
+        """
+
+        return self.__values[index]
+
+    def fetch_values(self) -> typing.List[float]:
+        """Fetches all values.
+
+        Returns
+        -------
+        :class:`list`
+            :attr:`__values`.
+        """
+
+        return self.__values
+
+    def update(self, index: int, value: float) -> None:
+        """Sets the value at the specified index in O(log n).
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the value.
+        value
+            Specifies the new value.
+        """
+
+        delta = value - self.__values[index]
+        self.__values[index] = value
+        i = index + 1
+        while i < len(self.__tree):
+            self.__tree[i] += delta
+            i += i & -i
+
+    def append(self, value: float) -> None:
+        """Appends a value in O(log n).
+
+        Parameters
+        ----------
+        value
+            Specifies the value to append.
+        """
+
+        n = len(self.__values) + 1
+        self.__tree.append(
+            value + self.prefix_sum(n - 1) - self.prefix_sum(n - (n & -n))
+        )
+        self.__values.append(value)
+
+    def delete(self, index: int) -> None:
+        """Deletes the value at the specified index.
+
+        Deleting the last value takes O(1); any other index rebuilds the tree in O(n).
+
+        Parameters
+        ----------
+        index
+            Specifies the index of the value.
+        """
+
+        if index < 0:
+            index += len(self.__values)
+
+        if index == len(self.__values) - 1:
+            self.__values.pop()
+            self.__tree.pop()
+        else:
+            del self.__values[index]
+            self.rebuild(self.__values)
+
+    def prefix_sum(self, end: int) -> float:
+        """Sums the values before the specified index.
+
+        Parameters
+        ----------
+        end
+            Specifies the index to stop at (exclusive).
+
+        Returns
+        -------
+        :class:`float`
+            Sum of the values in `[0, end)`.
+        """
+
+        total = 0
+        i = end
+        while i > 0:
+            total += self.__tree[i]
+            i -= i & -i
+        return total
+
+    def search_prefix_sum(self, total: float) -> int:
+        """Finds the first index at which the running sum of the values exceeds the specified total, in O(log n).
+
+        Assumes the values are non-negative.
+
+        Parameters
+        ----------
+        total
+            Specifies the total to exceed.
+
+        Returns
+        -------
+        :class:`int`
+            The smallest index whose inclusive prefix sum exceeds `total`; the number of values if there is none.
+        """
+
+        index = 0
+        step = 1 << (len(self.__values).bit_length())
+        while step:
+            if index + step < len(self.__tree) and self.__tree[index + step] <= total:
+                index += step
+                total -= self.__tree[index]
+            step >>= 1
+        return index
+
+    def range_sum(self, index_start: int, index_end: int) -> float:
+        """Sums the values between the specified range.
+
+        Parameters
+        ----------
+        index_start
+            Starting index of the range (inclusive).
+        index_end
+            Ending index of the range (inclusive).
+
+        Returns
+        -------
+        :class:`float`
+            Sum of the values in `[index_start, index_end]`.
+        """
+
+        if index_end < index_start:
+            return 0
+        return self.prefix_sum(index_end + 1) - self.prefix_sum(index_start)
+
+
+_HASHED_MOB_ATTRS = (
+    "points",
+    "fill_rgbas",
+    "stroke_rgbas",
+    "background_stroke_rgbas",
+    "stroke_width",
+    "background_stroke_width",
+    "sheen_factor",
+    "sheen_direction",
+    "z_index",
+    "color",
+)
+"""Attributes of each family member that affect how a mobject renders."""
+
+_content_hash_types: tuple = ()
+"""Classes whose instances manim's scene caching serializes via `fetch_content_hash`."""
+
+
+def content_hash(mobject: Mobject, *state: typing.Any) -> str:
+    """Hashes the logical state of a mobject along with the raw geometry and style of its family.
+
+    The geometry is hashed as well since the mobjects can be changed without the logical state noticing (e.g. by
+    `.animate` on a submobject, :class:`~manim.animation.transform.Transform` or an updater), and a stale cache hit
+    would render the wrong frames. The buffers are hashed in place, which is far cheaper than manim's default JSON
+    serialization of them.
+
+    Parameters
+    ----------
+    mobject
+        Specifies the mobject to hash.
+    *state
+        Specifies the logical state (e.g. values and props) to include.
+
+    Returns
+    -------
+    :class:`str`
+        Hex digest that only changes when the mobject would render differently.
+    """
+
+    digest = hashlib.blake2b(repr(freeze(state)).encode(), digest_size=16)
+    for mob in mobject.get_family():
+        digest.update(type(mob).__name__.encode())
+        for name in _HASHED_MOB_ATTRS:
+            value = getattr(mob, name, None)
+            if isinstance(value, np.ndarray):
+                digest.update(repr((value.shape, value.dtype.str)).encode())
+                digest.update(np.ascontiguousarray(value))
+            else:
+                digest.update(repr(value).encode())
+        for updater in mob.get_updaters():
+            digest.update(getattr(updater, "__qualname__", repr(updater)).encode())
+    return digest.hexdigest()
+
+
+def register_content_hash(*classes: type) -> None:
+    """Registers classes implementing `fetch_content_hash` for :func:`enable_content_hash`.
+
+    Parameters
+    ----------
+    *classes
+        Specifies the classes implementing `fetch_content_hash`.
+    """
+
+    global _content_hash_types
+
+    _content_hash_types += tuple(c for c in classes if c not in _content_hash_types)
+
+
+def _fetch_cache_encoder() -> typing.Optional[type]:
+    """Fetches the JSON encoder manim's scene caching serializes mobjects with.
+
+    Returns
+    -------
+    :data:`~typing.Optional`\0[:class:`type`]
+        The encoder class, or `None` if the installed manim version doesn't expose it.
+    """
+
+    try:
+        from manim.utils import hashing
+    except ImportError:
+        return None
+
+    encoder = getattr(hashing, "_CustomEncoder", None)
+    if encoder is None or not hasattr(encoder, "default"):
+        return None
+    return encoder
+
+
+def enable_content_hash() -> bool:
+    """Makes manim's scene caching serialize instances of the registered classes via their `fetch_content_hash` method.
+
+    By default manim serializes the whole `__dict__` of every mobject (and its submobjects) before each play call.
+    This patches manim's cache encoder, so it is opt-in; see :func:`disable_content_hash`.
+
+    Returns
+    -------
+    :class:`bool`
+        `True` if the hook is installed, `False` if the installed manim version doesn't expose the expected encoder.
+    """
+
+    encoder = _fetch_cache_encoder()
+    if encoder is None:
+        return False
+
+    if not getattr(encoder.default, "_content_hash_hook", False):
+        default = encoder.default
+
+        def default_with_content_hash(self, obj: typing.Any) -> typing.Any:
+            if isinstance(obj, _content_hash_types):
+                return {"content_hash": obj.fetch_content_hash()}
+            return default(self, obj)
+
+        default_with_content_hash._content_hash_hook = True
+        default_with_content_hash._content_hash_default = default
+        encoder.default = default_with_content_hash
+
+    return True
+
+
+def disable_content_hash() -> None:
+    """Restores manim's own serialization after :func:`enable_content_hash`."""
+
+    encoder = _fetch_cache_encoder()
+    if encoder is not None and getattr(encoder.default, "_content_hash_hook", False):
+        encoder.default = encoder.default._content_hash_default
+
+
+def find_shared_mobjects(
+    mobjects: typing.Iterable[Mobject],
+) -> typing.List[typing.Tuple[Mobject, int]]:
+    """Finds the mobjects reachable through more than one path of a scene graph.
+
+    Such mobjects are drawn (and hashed by the scene cache) once per path.
+
+    Parameters
+    ----------
+    mobjects
+        Specifies the top level mobjects (e.g. :attr:`Scene.mobjects <manim.scene.scene.Scene.mobjects>`).
+
+    Returns
+    -------
+    :class:`~typing.List`\0[:class:`~typing.Tuple`\0[:class:`~manim.mobject.mobject.Mobject`, :class:`int`]]
+        Each shared mobject along with its number of paths, in the order they are first reached.
+    """
+
+    # Visit every mobject once, recording how often it is referenced
+    order = []
+    parents = {}
+    stack = list(reversed(list(mobjects)))
+    for mob in stack:
+        parents.setdefault(id(mob), []).append(None)
+    visited = set()
+    while stack:
+        mob = stack.pop()
+        if id(mob) in visited:
+            continue
+        visited.add(id(mob))
+        order.append(mob)
+        for submob in reversed(mob.submobjects):
+            parents.setdefault(id(submob), []).append(mob)
+            stack.append(submob)
+
+    # Count the paths in topological order, parents before children
+    in_degree = {id(mob): 0 for mob in order}
+    for mob in order:
+        for submob in mob.submobjects:
+            in_degree[id(submob)] += 1
+    paths = {}
+    ready = [mob for mob in order if in_degree[id(mob)] == 0]
+    while ready:
+        mob = ready.pop()
+        paths[id(mob)] = sum(
+            1 if parent is None else paths[id(parent)] for parent in parents[id(mob)]
+        )
+        for submob in mob.submobjects:
+            in_degree[id(submob)] -= 1
+            if in_degree[id(submob)] == 0:
+                ready.append(submob)
+
+    return [(mob, paths[id(mob)]) for mob in order if paths.get(id(mob), 0) > 1]
+
+
+text_cache = LRUCache(1024)
+"""Process-wide cache of :class:`~manim.mobject.text.text_mobject.Text` prototypes keyed on their arguments."""
+
+
+def build_text(props: dict) -> Text:
+    """Builds a :class:`~manim.mobject.text.text_mobject.Text`, copying a cached prototype when possible.
+
+    Parameters
+    ----------
+    props
+        Arguments for :class:`~manim.mobject.text.text_mobject.Text`.
+
+    Returns
+    -------
+    :class:`~manim.mobject.text.text_mobject.Text`
+        A mobject that is never shared with the cache.
+    """
+
+    if not text_cache.is_enabled():
+        return Text(**props)
+
+    return text_cache.fetch(freeze(props), lambda: Text(**props)).copy()
+
+
 if __name__ == "__main__":
 
     @exclude_from_deepcopy("a")
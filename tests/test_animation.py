@@ -0,0 +1,39 @@
+from manim import *
+
+from manim_data_structures import TranslateMobjects
+
+
+def test_translate_mobjects():
+    squares = [Square(), Square().shift(2 * RIGHT)]
+    anim = TranslateMobjects(VGroup(*squares), squares, [UP, DOWN])
+    anim.begin()
+    anim.interpolate(1)
+
+    assert np.allclose(squares[0].get_center(), UP)
+    assert np.allclose(squares[1].get_center(), 2 * RIGHT + DOWN)
+
+
+def test_translate_mobjects_shared_displacement():
+    squares = [Square(), Square().shift(2 * RIGHT)]
+    anim = TranslateMobjects(VGroup(*squares), squares, 2 * LEFT)
+    anim.begin()
+    anim.interpolate(0.5)
+
+    assert np.allclose(squares[0].get_center(), LEFT)
+    assert np.allclose(squares[1].get_center(), RIGHT)
+
+
+def test_translate_mobjects_path_arc():
+    squares = [Square(), Square().shift(2 * RIGHT)]
+    anim = TranslateMobjects(
+        VGroup(*squares), squares, [2 * RIGHT, 2 * LEFT], path_arc=PI / 2
+    )
+    anim.begin()
+    anim.interpolate(0.5)
+
+    assert squares[0].get_center()[1] < 0 < squares[1].get_center()[1]
+
+    anim.interpolate(1)
+
+    assert np.allclose(squares[0].get_center(), 2 * RIGHT)
+    assert np.allclose(squares[1].get_center(), ORIGIN)
@@ -0,0 +1,156 @@
+import inspect
+
+import pytest
+
+from manim_data_structures import (
+    DryRunMArray,
+    DryRunMArrayPointer,
+    DryRunMArraySlidingWindow,
+    DryRunMVariable,
+    DryRunScene,
+    MArray,
+    MArrayPermutationMode,
+    MArrayPointer,
+    MArraySlidingWindow,
+    MVariable,
+)
+
+# Methods that only concern the mobjects, besides the `animate_*` and `fetch_mob*` accessors
+MOBJECT_METHODS = {"shift", "apply_points_function_about_point", "fetch_content_hash"}
+
+
+def public_ops(cls):
+    return {
+        name: member
+        for name, member in vars(cls).items()
+        if callable(member)
+        and not name.startswith(("_", "animate_", "fetch_mob"))
+        and name not in MOBJECT_METHODS
+    }
+
+
+@pytest.mark.parametrize(
+    "cls, dry_run_cls",
+    [
+        (MArray, DryRunMArray),
+        (MArrayPointer, DryRunMArrayPointer),
+        (MArraySlidingWindow, DryRunMArraySlidingWindow),
+        (MVariable, DryRunMVariable),
+    ],
+)
+def test_parity(cls, dry_run_cls):
+    ops = public_ops(cls)
+    assert set(ops) <= set(public_ops(dry_run_cls))
+
+    # Every argument of the real operations is accepted
+    for name, op in [("__init__", cls.__init__), *ops.items()]:
+        dry_run_params = inspect.signature(getattr(dry_run_cls, name)).parameters
+        if any(p.kind == p.VAR_KEYWORD for p in dry_run_params.values()):
+            continue
+        assert set(inspect.signature(op).parameters) <= set(dry_run_params), name
+
+
+def test_marray_ops():
+    scene = DryRunScene()
+    arr = DryRunMArray(scene, [3, 1, 2], index_start=1)
+    arr.append_elem(4)
+    arr.swap_elems(0, 1)
+    arr.update_elem_value(2, 9)
+    arr.remove_elem(0)
+
+    assert arr.fetch_arr() == [3, 9, 4]
+    assert arr.fetch_indices() == [1, 2, 3]
+    assert [op["op"] for op in scene.fetch_op_log()] == [
+        "append_elem",
+        "swap_elems",
+        "update_elem_value",
+        "remove_elem",
+        "update_indices",
+    ]
+    assert scene.fetch_play_count() == 5
+    assert scene.fetch_run_time() == 6
+
+
+def test_marray_bounds():
+    arr = DryRunMArray(DryRunScene(), [1, 2])
+
+    with pytest.raises(Exception, match="Index out of bounds!"):
+        arr.swap_elems(0, 2)
+
+
+def test_marray_batch():
+    scene = DryRunScene()
+    arr = DryRunMArray(scene, [1, 2, 3])
+    with arr.batch():
+        arr.update_elem_value(0, 4)
+        arr.update_elem_value(1, 5)
+        arr.update_elem_value(0, 6)
+
+    assert arr.fetch_arr() == [6, 5, 3]
+    assert scene.fetch_play_count() == 1
+    assert scene.fetch_run_time() == 2
+
+
+def test_pointer_and_window():
+    scene = DryRunScene()
+    arr = DryRunMArray(scene, [1, 2, 3, 4])
+    pointer = DryRunMArrayPointer(scene, arr, 1)
+    window = DryRunMArraySlidingWindow(scene, arr, 0, 2)
+    pointer.shift_to_elem(3)
+    window.shift_to_elem(1)
+    window.resize_window(3, play_anim_args={"run_time": 0.5})
+
+    assert pointer.fetch_index() == 3
+    assert list(window.fetch_range()) == [1, 2, 3]
+    assert scene.fetch_run_time() == 2.5
+    with pytest.raises(Exception, match="Invalid window size!"):
+        window.resize_window(4)
+
+
+def test_detached_pointer_and_window():
+    scene = DryRunScene()
+    arr = DryRunMArray(scene, [1, 2, 3])
+    pointer = DryRunMArrayPointer(scene, arr, 2)
+    arr.remove_elem(0, play_anim=False)
+    pointer.attach_to_elem(1)
+    scene.wait()
+    arr.morph_to([1], play_anim=False)
+
+    # Like the pointer's updater on the next frame
+    with pytest.raises(Exception, match="Index out of bounds!"):
+        scene.wait()
+
+    scene = DryRunScene()
+    arr = DryRunMArray(scene, [1, 2, 3])
+    DryRunMArraySlidingWindow(scene, arr, 1, 2)
+
+    with pytest.raises(Exception, match="Invalid window size!"):
+        arr.remove_elem(0)
+
+
+def test_marray_apply_permutation():
+    scene = DryRunScene()
+    arr = DryRunMArray(scene, [5, 3, 4, 1, 2])
+    arr.apply_permutation([3, 4, 1, 2, 0])
+    arr.apply_permutation(
+        [1, 0, 2, 3, 4], mode=MArrayPermutationMode.STAGGERED, wave_size=1
+    )
+
+    assert arr.fetch_arr() == [2, 1, 3, 4, 5]
+    assert scene.fetch_play_count() == 2
+    assert scene.fetch_run_time() == 2.5
+
+    with pytest.raises(Exception, match="Invalid permutation!"):
+        arr.apply_permutation([0, 0, 1, 2, 3])
+
+
+def test_marray_morph_to():
+    scene = DryRunScene()
+    arr = DryRunMArray(scene, [1, 2, 3, 4], index_start=1)
+    arr.morph_to([2, 3, 4])
+    arr.morph_to([2, 3, 5])
+
+    assert arr.fetch_arr() == [2, 3, 5]
+    assert arr.fetch_indices() == [1, 2, 3]
+    assert scene.fetch_play_count() == 2
+    assert scene.fetch_run_time() == 4
@@ -1,3 +1,10 @@
+from manim import *
+import pytest
+
+from manim_data_structures import *
+from manim_data_structures import utils
+
+
 # TODO: Fill with appropriate tests
 def test_getitem():
     pass
@@ -9,3 +16,270 @@ def test_setitem():
 
 def test_iteration():
     pass
+
+
+def test_morph_to():
+    arr = MArray(Scene(), [1, 2, 3, 4])
+    kept = [elem.fetch_mob_value() for elem in arr.fetch_mob_arr()[1:3]]
+    anim = arr.morph_to([2, 3, 5], play_anim=False)
+
+    assert isinstance(anim, AnimationGroup)
+    assert arr.fetch_arr() == [2, 3, 5]
+    assert len(arr.fetch_mob_arr()) == 3
+    assert all(
+        elem.fetch_mob_value() is value
+        for elem, value in zip(arr.fetch_mob_arr(), kept)
+    )
+
+
+def test_morph_to_prepend(monkeypatch):
+    arr = MArray(Scene(), [1, 2])
+    kept = [elem.fetch_mob_value() for elem in arr.fetch_mob_arr()]
+    built = []
+    build_text = utils.build_text
+    monkeypatch.setattr(
+        utils,
+        "build_text",
+        lambda props: built.append(props["text"]) or build_text(props),
+    )
+    arr.morph_to([0, 1, 2], play_anim=False)
+
+    # Only the new value and the index of the appended element are built
+    assert sorted(built) == ["0", "2"]
+    elems = arr.fetch_mob_arr()
+    assert [elem.fetch_mob_value() for elem in elems[1:]] == kept
+    assert np.allclose(
+        elems[0].fetch_mob_value().get_center(), elems[0].fetch_mob_body().get_center()
+    )
+
+
+def test_morph_to_unchanged():
+    arr = MArray(Scene(), [1, 2])
+    anim = arr.morph_to([1, 2], play_anim=False)
+
+    assert isinstance(anim, TranslateMobjects)
+    assert arr.fetch_arr() == [1, 2]
+
+
+def test_remove_elem_shift():
+    arr = MArray(Scene(), [1, 2, 3])
+    elems = arr.fetch_mob_arr()[1:]
+    centers = [elem.fetch_mob_body().get_center() for elem in elems]
+    remove_anim, _ = arr.remove_elem(0, play_anim=False)
+
+    shift_anim = remove_anim.animations[1].animations[0]
+    assert isinstance(shift_anim, TranslateMobjects)
+    assert id(arr) not in {id(mob) for mob in shift_anim.mobject.get_family()}
+
+    shift_anim.begin()
+    shift_anim.finish()
+    for elem, center in zip(elems, centers):
+        assert np.allclose(elem.fetch_mob_body().get_center(), center + LEFT)
+
+
+def test_fetch_mob_index_lazy():
+    elem = MArray(Scene(), [1], hide_index=True).fetch_mob_arr()[0]
+
+    assert elem.fetch_mob_index(materialize=False) is None
+    assert elem.fetch_mob_index() is elem.fetch_mob_index(materialize=False)
+
+
+def test_batch_replaced_value():
+    with tempconfig({"dry_run": True}):
+        scene = Scene()
+        arr = MArray(scene, [1, 2])
+        scene.add(arr)
+        with arr.batch():
+            arr.update_elem_value(0, 3)
+            arr.update_elem_value(0, 4)
+            arr.update_elem_index(1, "a")
+            arr.update_elem_index(1, "b")
+
+    assert arr.fetch_arr() == [4, 2]
+    assert arr.fetch_mob_arr()[0].fetch_mob_value().text == "4"
+    assert arr.fetch_mob_arr()[1].fetch_mob_index().text == "b"
+    assert len(scene.mobjects) == 1 and scene.mobjects[0] is arr
+
+
+def test_remove_elem_reuse_index_mobs():
+    arr = MArray(Scene(), [1, 2, 3, 4, 5])
+    indices = [elem.fetch_mob_index() for elem in arr.fetch_mob_arr()]
+    _, update_indices = arr.remove_elem(2, play_anim=False, reuse_index_mobs=True)
+    update_indices(play_anim=False)
+
+    elems = arr.fetch_mob_arr()
+    assert arr.fetch_arr() == [1, 2, 4, 5]
+    for i, elem in enumerate(elems):
+        assert elem.fetch_mob_index().text == str(i)
+        assert np.isclose(
+            elem.fetch_mob_index().get_center()[0],
+            elem.fetch_mob_body().get_center()[0],
+        )
+    # The index mobjects before the removed element stay in place, the ones
+    # after it are handed down to the next element
+    assert elems[0].fetch_mob_index() is indices[0]
+    assert elems[1].fetch_mob_index() is indices[1]
+    assert elems[3].fetch_mob_index() is indices[3]
+
+
+def test_pointer_follows_array(monkeypatch):
+    arr = MArray(Scene(), [1, 2, 3])
+    pointer = MArrayPointer(Scene(), arr, 1)
+    pointer.update()
+    center = pointer.fetch_mob_arrow().get_center()
+
+    positioned = []
+    next_to = pointer.next_to
+    monkeypatch.setattr(
+        pointer,
+        "next_to",
+        lambda *args, **kwargs: positioned.append(args) or next_to(*args, **kwargs),
+    )
+
+    # An unchanged array leaves the pointer alone
+    pointer.update()
+    assert positioned == []
+    assert np.allclose(pointer.fetch_mob_arrow().get_center(), center)
+
+    arr.shift(2 * UP)
+    pointer.update()
+    assert len(positioned) == 1
+    assert np.allclose(pointer.fetch_mob_arrow().get_center(), center + 2 * UP)
+
+    # Scaling keeps the center of the middle element but not its bottom
+    arr.scale(2)
+    pointer.update()
+    assert len(positioned) == 2
+    assert pointer.fetch_mob_arrow().get_top()[1] < center[1] + 2 * UP[1]
+    assert np.isclose(
+        pointer.fetch_mob_arrow().get_top()[1],
+        arr.fetch_mob_arr()[1].fetch_mob_body().get_bottom()[1] - 0.25,
+    )
+
+
+@pytest.mark.parametrize(
+    "arr_dir",
+    [MArrayDirection.RIGHT, MArrayDirection.LEFT, MArrayDirection.DOWN],
+)
+def test_append_elems_bulk(arr_dir):
+    values = [1, 22, 333, 4]
+    body_args = {"side_length": 1.5}
+    arr = MArray(Scene(), values, arr_dir=arr_dir, mob_elem_body_args=body_args)
+    appended = MArray(Scene(), [], arr_dir=arr_dir, mob_elem_body_args=body_args)
+    for value in values:
+        appended.append_elem(value, play_anim=False)
+
+    assert arr.fetch_arr() == appended.fetch_arr()
+    for elem, appended_elem in zip(arr.fetch_mob_arr(), appended.fetch_mob_arr()):
+        for comp in [MArrayElementComp.BODY, MArrayElementComp.VALUE]:
+            assert np.allclose(
+                elem.fetch_mob(comp).get_center(),
+                appended_elem.fetch_mob(comp).get_center(),
+            )
+        assert elem.fetch_mob_value().text == appended_elem.fetch_mob_value().text
+        assert elem.fetch_mob_index().text == appended_elem.fetch_mob_index().text
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        (np.array([3, 1, 2]), [3, 1, 2]),
+        ((value for value in [3, 1, 2]), [3, 1, 2]),
+        (range(3, 0, -1), [3, 2, 1]),
+    ],
+)
+def test_from_values(values, expected):
+    arr = MArray.from_values(Scene(), values)
+    constructed = MArray(Scene(), expected)
+
+    assert arr.fetch_arr() == constructed.fetch_arr() == expected
+    assert all(type(value) == int for value in arr.fetch_arr())
+    assert len(arr.fetch_mob_arr()) == len(constructed.fetch_mob_arr())
+    for elem, constructed_elem in zip(arr.fetch_mob_arr(), constructed.fetch_mob_arr()):
+        assert elem.fetch_mob_value().text == constructed_elem.fetch_mob_value().text
+        assert (
+            elem.fetch_mob_body().side_length
+            == constructed_elem.fetch_mob_body().side_length
+        )
+
+
+@pytest.mark.parametrize("swap_body", [True, False])
+def test_apply_permutation(swap_body):
+    values = [1, 2, 3, 4]
+    lens = [1, 2, 1.5, 1]
+    order = [2, 0, 3, 1]
+    with tempconfig({"dry_run": True}):
+        scene = Scene()
+        arr = MArray(scene, [])
+        for value, side_length in zip(values, lens):
+            arr.append_elem(
+                value, mob_elem_body_args={"side_length": side_length}, play_anim=False
+            )
+        scene.add(arr)
+        elems = arr.fetch_mob_arr()
+        mob_values = [elem.fetch_mob_value() for elem in elems]
+        mob_bodies = [elem.fetch_mob_body() for elem in elems]
+        start = mob_bodies[0].get_left()
+        centers = [body.get_center() for body in mob_bodies]
+
+        arr.apply_permutation(order, swap_body=swap_body)
+
+    assert arr.fetch_arr() == [values[i] for i in order]
+    new_lens = [lens[i] for i in order] if swap_body else lens
+    for i, elem in enumerate(arr.fetch_mob_arr()):
+        assert elem.fetch_mob_value() is mob_values[order[i]]
+        assert elem.fetch_mob_value().text == str(values[order[i]])
+        body = elem.fetch_mob_body()
+        if swap_body:
+            # The bodies are packed again in their new order
+            assert body is mob_bodies[order[i]]
+            assert np.allclose(
+                body.get_center(),
+                start + RIGHT * (sum(new_lens[:i]) + new_lens[i] / 2),
+            )
+        else:
+            assert body is mob_bodies[i]
+            assert np.allclose(body.get_center(), centers[i])
+        assert np.allclose(elem.fetch_mob_value().get_center(), body.get_center())
+    assert len(scene.mobjects) == 1 and scene.mobjects[0] is arr
+
+
+@pytest.mark.parametrize("swap_body", [True, False])
+def test_swap_elems(swap_body):
+    with tempconfig({"dry_run": True}):
+        scene = Scene()
+        arr = MArray(scene, [])
+        for value, color in [(1, RED), (2, WHITE), (3, BLUE)]:
+            arr.append_elem(
+                value, mob_elem_value_args={"color": color}, play_anim=False
+            )
+        scene.add(arr)
+        elems = arr.fetch_mob_arr()
+        mob_values = [elem.fetch_mob_value() for elem in elems]
+        mob_bodies = [elem.fetch_mob_body() for elem in elems]
+        mob_indices = [elem.fetch_mob_index() for elem in elems]
+
+        arr.swap_elems(0, 2, swap_body=swap_body)
+
+        assert arr.fetch_arr() == [3, 2, 1]
+        for i, j in [(0, 2), (1, 1), (2, 0)]:
+            elem = arr.fetch_mob_arr()[i]
+            assert elem.fetch_mob_value() is mob_values[j]
+            assert [mob for mob in elem.submobjects if mob in mob_values] == [
+                mob_values[j]
+            ]
+            assert elem.fetch_mob_body() is (
+                mob_bodies[j] if swap_body else mob_bodies[i]
+            )
+            assert elem.fetch_mob_index() is mob_indices[i]
+            assert np.allclose(
+                elem.fetch_mob_value().get_center(), elem.fetch_mob_body().get_center()
+            )
+        # Nothing but the array is left at the top level of the scene
+        assert len(scene.mobjects) == 1 and scene.mobjects[0] is arr
+
+        # The value props went along with the values
+        arr.update_elem_value(0, 4, play_anim=False)
+        arr.update_elem_value(2, 5, play_anim=False)
+    assert arr.fetch_mob_arr()[0].fetch_mob_value().get_color() == BLUE
+    assert arr.fetch_mob_arr()[2].fetch_mob_value().get_color() == RED
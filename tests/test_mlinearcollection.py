@@ -2,7 +2,12 @@ from manim import *
 import pytest
 from manim.utils.testing.frames_comparison import frames_comparison
 
-from manim_data_structures import LinearCollection
+from manim_data_structures import (
+    LinearCollection,
+    TranslateMobjects,
+    VirtualLinearCollection,
+    mlinearcollection,
+)
 
 __module_test__ = "mlinearcollection"
 
@@ -32,7 +37,7 @@ def lc(request, lc_data):
 
 def is_valid(lc):
     assert type(lc) == LinearCollection
-    assert type(lc._LinearCollection__values) == list
+    assert isinstance(lc._LinearCollection__values, (list, np.ndarray))
     assert type(lc._LinearCollection__datas) == list
     assert type(lc._LinearCollection__containers) == list
     assert isinstance(lc, Mobject)
@@ -115,6 +120,30 @@ def test_insert_super_positive(lc):
     is_valid(lc)
 
 
+def test_extend(lc):
+    lc_data = lc._LinearCollection__values.copy()
+    lc.extend(iter([4, 5, 6]))
+    lc.extend([])
+    lc_data.extend([4, 5, 6])
+
+    assert lc._LinearCollection__values == lc_data
+    is_valid(lc)
+
+
+def test_incremental_arrangement(lc):
+    lc.insert(len(lc) // 2, 222)
+    lc.append(333)
+    del lc[0]
+    lc[0] = 44444
+
+    assert len(lc.updaters) == 0
+
+    arranged = lc.copy()
+    arranged.arrange(**arranged._LinearCollection__arrangement)
+    for mob, arranged_mob in zip(lc.submobjects, arranged.submobjects):
+        assert np.allclose(mob.get_center(), arranged_mob.get_center())
+
+
 def test_remove(lc):
     lc_data = lc._LinearCollection__values.copy()
     original_count = lc.count(3)
@@ -158,6 +187,160 @@ def test_index(lc):
         assert 7 not in lc_data
 
 
+def test_position_index(lc_data):
+    lc = LinearCollection(lc_data, position_index=True)
+    lc_data = lc_data.copy()
+
+    for mutate in [
+        lambda values: values.append(7),
+        lambda values: values.insert(0, 7),
+        lambda values: values.remove(7),
+        lambda values: values.__setitem__(-1, 3),
+        lambda values: values.sort(),
+        lambda values: values.reverse(),
+        lambda values: values.pop(len(values) // 2),
+    ]:
+        mutate(lc)
+        mutate(lc_data)
+        for value in [3, 7, 8]:
+            assert lc.count(value) == lc_data.count(value)
+            try:
+                assert lc.index(value) == lc_data.index(value)
+            except ValueError:
+                assert value not in lc_data
+    is_valid(lc)
+
+
+def test_position_index_remove(monkeypatch):
+    lc = LinearCollection([i % 5 for i in range(20)], position_index=True)
+    lc_data = [i % 5 for i in range(20)]
+
+    # Removing from anywhere keeps the index valid, so nothing is scanned
+    def scan(*args):
+        raise AssertionError("scanned the values")
+
+    monkeypatch.setattr(mlinearcollection, "_index_of", scan)
+    for value in [2, 0, 4, 2, 1, 3, 3]:
+        lc.remove(value)
+        lc_data.remove(value)
+        for other in range(5):
+            assert lc.index(other) == lc_data.index(other)
+            assert lc.count(other) == lc_data.count(other)
+    is_valid(lc)
+
+
+def test_data_memo():
+    constructed = []
+
+    def data_constructor(value):
+        constructed.append(value)
+        return Integer(value)
+
+    lc = LinearCollection([1, 2, 1, 2], data_constructor, data_memo_size=8)
+    lc *= 3
+    lc[0] = 2
+    assert constructed == [1, 2]
+    assert lc == [2, 2, 1, 2] + [1, 2, 1, 2] * 2
+    is_valid(lc)
+
+    lc_datas = lc._LinearCollection__datas
+    assert len(set(map(id, lc_datas))) == len(lc_datas)
+
+
+def test_roll(lc):
+    lc_data = lc._LinearCollection__values.copy()
+    containers = lc._LinearCollection__containers.copy()
+    lc.roll(3)
+
+    shift = 3 % len(lc_data) if lc_data else 0
+    assert lc == lc_data[len(lc_data) - shift :] + lc_data[: len(lc_data) - shift]
+    assert set(map(id, lc._LinearCollection__containers)) == set(map(id, containers))
+    is_valid(lc)
+    is_arranged(lc)
+
+
+def test_appendleft_popleft(lc):
+    lc_data = list(lc._LinearCollection__values)
+    containers = lc._LinearCollection__containers.copy()
+    lc.appendleft(0)
+    lc.appendleft(-1)
+
+    assert lc == [-1, 0] + lc_data
+    assert list(map(id, lc._LinearCollection__containers[2:])) == list(
+        map(id, containers)
+    )
+    is_valid(lc)
+    is_arranged(lc)
+
+    assert lc.popleft() == -1
+    assert lc.popleft() == 0
+    assert lc == lc_data
+    is_valid(lc)
+    is_arranged(lc)
+
+    while len(lc) > 0:
+        assert lc.popleft() == lc_data.pop(0)
+    with pytest.raises(IndexError):
+        lc.popleft()
+
+
+def test_roll_animate(lc):
+    lc_data = list(lc._LinearCollection__values)
+    anim = lc.roll(-2, animate=True)
+
+    assert isinstance(anim, TranslateMobjects)
+    shift = 2 % len(lc_data) if lc_data else 0
+    assert lc == lc_data[shift:] + lc_data[:shift]
+
+
+def test_deferred_layout(lc):
+    lc_copy = lc.copy()
+    with lc.deferred_layout():
+        for i in range(5):
+            lc.insert(0, i)
+        lc.pop(2)
+    for i in range(5):
+        lc_copy.insert(0, i)
+    lc_copy.pop(2)
+
+    assert lc == lc_copy
+    for mob, mob_copy in zip(lc.submobjects, lc_copy.submobjects):
+        assert np.allclose(mob.get_center(), mob_copy.get_center())
+    is_valid(lc)
+
+
+def test_numpy_values():
+    values = np.arange(10)
+    lc = LinearCollection(values)
+    assert lc._LinearCollection__values is values
+
+    def changed_by(mutate):
+        datas = lc._LinearCollection__datas.copy()
+        mutate()
+        return [
+            i
+            for i, (data, new_data) in enumerate(
+                zip(datas, lc._LinearCollection__datas)
+            )
+            if data is not new_data
+        ]
+
+    assert changed_by(lambda: lc.set_values([1, 3], [1, 30])) == [3]
+    assert values[3] == 30
+    assert changed_by(lambda: lc.apply(np.minimum, 6)) == [3, 7, 8, 9]
+    assert changed_by(lambda: lc.__setitem__(slice(0, 2), 0)) == [1]
+    assert lc == [0, 0, 2, 6, 4, 5, 6, 6, 6, 6]
+    is_valid(lc)
+
+    lc.insert(2, 1)
+    lc.sort(reverse=True)
+    del lc[0]
+    assert lc.index(6) == 0
+    assert lc.count(6) == 4
+    assert lc == [6, 6, 6, 6, 5, 4, 2, 1, 0, 0]
+    is_valid(lc)
+
+
 def test_sort(lc):
     lc_data = lc._LinearCollection__values.copy()
     lc.sort()
@@ -167,6 +350,38 @@ def test_sort(lc):
     is_valid(lc)
 
 
+def is_arranged(lc):
+    arranged = lc.copy()
+    arranged.arrange(**arranged._LinearCollection__arrangement)
+    for mob, arranged_mob in zip(lc.submobjects, arranged.submobjects):
+        assert np.allclose(mob.get_center(), arranged_mob.get_center())
+
+
+def test_permute(lc):
+    lc_data = lc._LinearCollection__values.copy()
+    perm = list(range(len(lc)))[::2] + list(range(len(lc)))[1::2]
+    lc.permute(perm)
+
+    assert lc == [lc_data[i] for i in perm]
+    is_valid(lc)
+    is_arranged(lc)
+
+    with pytest.raises(ValueError):
+        lc.permute([0] * (len(lc) + 1))
+
+
+def test_sort_animate(lc):
+    lc_data = sorted(lc._LinearCollection__values)
+    anim = lc.sort(animate=True)
+    assert isinstance(anim, TranslateMobjects)
+    assert lc == lc_data
+
+    anim.begin()
+    anim.finish()
+    is_valid(lc)
+    is_arranged(lc)
+
+
 def test_reverse(lc):
     lc_reversed = lc.copy().reverse()
 
@@ -233,6 +448,23 @@ def test_getitem(lc):
         assert lc[i] == lc_data[i]
 
 
+def test_numpy_values_rejected():
+    lc = LinearCollection(np.arange(3), position_index=True)
+
+    with pytest.raises(ValueError):
+        lc.insert(1, "a")
+    with pytest.raises(ValueError):
+        lc.appendleft("a")
+    with pytest.raises(ValueError):
+        lc[0:2] = [5, 6, 7]
+    assert lc.count("a") == 0
+    assert lc.index(2) == 2
+
+    lc[0:2] = [5, 6]
+    assert lc == [5, 6, 2]
+    is_valid(lc)
+
+
 def test_setitem(lc):
     lc_data = lc._LinearCollection__values.copy()
     for i in range(len(lc_data)):
@@ -308,6 +540,56 @@ def test_copy(lc):
         assert lc_copy != lc
 
 
+def test_copy_graphical_components(lc):
+    lc_copy = lc.copy()
+    is_valid(lc_copy)
+
+    assert lc_copy._LinearCollection__values is not lc._LinearCollection__values
+    for mob, mob_copy in zip(lc.submobjects, lc_copy.submobjects):
+        assert mob is not mob_copy
+        assert np.allclose(mob.get_center(), mob_copy.get_center())
+
+
+def test_virtual_linear_collection():
+    data = list(range(100))
+    vlc = VirtualLinearCollection(data, visible=5, margin=2)
+
+    def is_synced():
+        start, stop = vlc.fetch_visible_range()
+        assert vlc == data
+        assert len(vlc) == len(data)
+        # Only the containers in view are displayed, each holding its value
+        assert [
+            container.submobjects[-1].get_value() for container in vlc.submobjects
+        ] == data[start:stop]
+
+    is_synced()
+    shown = list(vlc.submobjects)
+    centers = [mob.get_center() for mob in shown]
+    vlc.scroll(3)
+    assert vlc.fetch_visible_range() == (3, 8)
+    # The containers still in view are kept and the view doesn't move
+    assert vlc.submobjects[:2] == shown[3:]
+    assert np.allclose([mob.get_center() for mob in vlc.submobjects], centers)
+    is_synced()
+
+    for mutate in [
+        lambda values: values.insert(4, -1),
+        lambda values: values.pop(5),
+        lambda values: values.__delitem__(0),
+        lambda values: values.append(200),
+        lambda values: values.reverse(),
+        lambda values: values.sort(),
+    ]:
+        mutate(vlc)
+        mutate(data)
+        is_synced()
+
+    vlc.seek(len(data))
+    assert vlc.fetch_visible_range() == (len(data) - 5, len(data))
+    is_synced()
+
+
 @frames_comparison
 def test_add_to_scene(scene):
     lc = LinearCollection([i + 1 for i in range(10)])
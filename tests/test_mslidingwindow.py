@@ -1,3 +1,8 @@
+from manim import *
+
+from manim_data_structures import *
+
+
 # TODO: Fill with appropriate tests
 def test_shift_left():
     pass
@@ -9,3 +14,27 @@ def test_shift_right():
 
 def test_resize():
     pass
+
+
+def test_follows_array(monkeypatch):
+    arr = MArray(Scene(), [1, 2, 3])
+    window = MArraySlidingWindow(Scene(), arr, 1, 2)
+    window.update()
+    center = window.fetch_mob_window().get_center()
+
+    positioned = []
+    move_to = window.fetch_mob_window().move_to
+    monkeypatch.setattr(
+        window.fetch_mob_window(),
+        "move_to",
+        lambda *args, **kwargs: positioned.append(args) or move_to(*args, **kwargs),
+    )
+
+    # An unchanged array leaves the window alone
+    window.update()
+    assert positioned == []
+
+    arr.shift(2 * UP)
+    window.update()
+    assert len(positioned) == 1
+    assert np.allclose(window.fetch_mob_window().get_center(), center + 2 * UP)
@@ -0,0 +1,49 @@
+import io
+
+from manim import *
+
+from manim_data_structures import *
+
+
+def test_record_and_replay():
+    trace = io.StringIO()
+    scene = Scene()
+    with TraceRecorder(trace):
+        arr = MArray(scene, [3, 1, 2], arr_dir=MArrayDirection.DOWN)
+        pointer = MArrayPointer(scene, arr, 0)
+        var = MVariable(scene, 5, label="x")
+        with arr.batch():
+            arr.swap_elems(0, 1, play_anim=False)
+            arr.update_elem_value(2, 7, play_anim=False)
+        arr.append_elem(4, append_anim=FadeIn, play_anim=False)
+        pointer.attach_to_elem(3)
+        var.update_value(6, play_anim=False)
+
+    assert len(trace.getvalue().splitlines()) == 10
+
+    trace.seek(0)
+    dry_run_scene = DryRunScene()
+    dry_arr, dry_pointer, dry_var = replay_trace(dry_run_scene, trace)
+
+    assert dry_arr.fetch_arr() == arr.fetch_arr() == [1, 3, 7, 4]
+    assert dry_arr.fetch_arr_dir() == MArrayDirection.DOWN
+    assert dry_pointer.fetch_index() == 3
+    assert dry_var.fetch_value() == 6
+    assert dry_run_scene.fetch_play_count() == 0
+
+
+def test_replay_callback():
+    trace = io.StringIO()
+    scene = Scene()
+    with TraceRecorder(trace):
+        arr = MArray(scene, [3, 1, 2])
+        _, update_indices = arr.remove_elem(0, play_anim=False)
+        update_indices(play_anim=False)
+
+    assert len(trace.getvalue().splitlines()) == 3
+
+    trace.seek(0)
+    (dry_arr,) = replay_trace(DryRunScene(), trace)
+
+    assert dry_arr.fetch_arr() == [1, 2]
+    assert dry_arr.fetch_indices() == [0, 1]
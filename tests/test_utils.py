@@ -0,0 +1,118 @@
+from manim import *
+
+from manim.utils import hashing
+
+from manim_data_structures import MArray, utils
+
+
+def test_lru_cache_counters():
+    cache = utils.LRUCache(2)
+    assert cache.fetch("a", lambda: 1) == 1
+    assert cache.fetch("a", lambda: 2) == 1
+    cache.fetch("b", lambda: 3)
+    cache.fetch("c", lambda: 4)
+
+    assert "a" not in cache
+    assert cache.fetch_stats() == {
+        "hits": 1,
+        "misses": 3,
+        "evictions": 1,
+        "size": 2,
+        "max_size": 2,
+    }
+
+
+def test_lru_cache_recency():
+    cache = utils.LRUCache(2)
+    cache.fetch("a", lambda: 1)
+    cache.fetch("b", lambda: 2)
+    cache.fetch("a", lambda: 1)
+    cache.fetch("c", lambda: 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+
+
+def test_lru_cache_disabled():
+    cache = utils.LRUCache(0)
+    cache.fetch("a", lambda: 1)
+
+    assert not cache.is_enabled()
+    assert len(cache) == 0
+
+
+def test_freeze():
+    assert utils.freeze({"b": [1, 2], "a": np.array([0, 1])}) == utils.freeze(
+        {"a": [0, 1], "b": (1, 2)}
+    )
+    assert hash(utils.freeze({"a": {"b": [1]}}))
+
+
+def test_build_text():
+    utils.text_cache.clear()
+    text_1 = utils.build_text({"text": "1", "color": WHITE})
+    text_2 = utils.build_text({"text": "1", "color": WHITE})
+
+    assert text_1 is not text_2
+    assert text_1.text == text_2.text
+    assert utils.text_cache.fetch_stats()["hits"] == 1
+
+
+def test_fenwick_tree():
+    values = [1, 2, 3, 4, 5, 6, 7]
+    tree = utils.FenwickTree(values)
+
+    for start in range(len(values)):
+        for end in range(start, len(values)):
+            assert tree.range_sum(start, end) == sum(values[start : end + 1])
+
+    tree.append(8)
+    tree.update(2, 10)
+    tree.delete(0)
+    tree.delete(-1)
+    values = [2, 10, 4, 5, 6, 7]
+
+    assert tree.fetch_values() == values
+    for end in range(len(values) + 1):
+        assert tree.prefix_sum(end) == sum(values[:end])
+
+    tree.update(1, 0)
+    values[1] = 0
+    for total in range(sum(values) + 1):
+        assert tree.search_prefix_sum(total) == next(
+            (i for i in range(len(values)) if sum(values[: i + 1]) > total),
+            len(values),
+        )
+
+
+def test_content_hash():
+    square = Square()
+    digest = utils.content_hash(square, {"side_length": 2})
+
+    assert utils.content_hash(square.copy(), {"side_length": 2}) == digest
+    assert utils.content_hash(square, {"side_length": 1}) != digest
+    assert utils.content_hash(square.shift(RIGHT), {"side_length": 2}) != digest
+
+
+def test_enable_content_hash():
+    arr = MArray(Scene(), [1, 2])
+    default = hashing._CustomEncoder.default
+
+    assert utils.enable_content_hash()
+    try:
+        # The encoder's constructor differs between manim versions
+        encoder = object.__new__(hashing._CustomEncoder)
+        assert encoder.default(arr) == {"content_hash": arr.fetch_content_hash()}
+    finally:
+        utils.disable_content_hash()
+
+    assert hashing._CustomEncoder.default is default
+
+
+def test_find_shared_mobjects():
+    square = Square()
+    group = VGroup(square, Circle())
+    scene_mobjects = [VGroup(group), square]
+
+    assert utils.find_shared_mobjects(scene_mobjects) == [(square, 2)]
+    assert utils.find_shared_mobjects([group]) == []